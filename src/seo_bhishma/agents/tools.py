@@ -54,6 +54,7 @@ from seo_bhishma.models.hannibal import CannibalizationConfig
 from seo_bhishma.models.index_spy import CheckMethod
 from seo_bhishma.models.keyword_sorcerer import ClusterMethod
 from seo_bhishma.models.link_sniper import BacklinkCheckRequest
+from seo_bhishma.models.site_mapper import SitemapCrawlStats
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -156,16 +157,19 @@ def get_ip_details(ip: str) -> dict:
 
 
 @tool
-def check_indexing_status(url: str, use_playwright: bool = False) -> dict:
+def check_indexing_status(url: str, use_playwright: bool = False, use_cache: bool = True) -> dict:
     """Check whether a single URL is indexed in Google via ``site:`` query.
 
     Args:
         url: The URL to check.
         use_playwright: If True, use a real browser (slower, more accurate when
-            HTMLSession is blocked). Default False uses HTMLSession.
+            plain HTTP is blocked). Default False checks the raw results page
+            and only renders it when the result is ambiguous.
+        use_cache: If True (default), return a recent cached result (marked
+            ``cached``) instead of querying Google again.
     """
-    method = CheckMethod.PLAYWRIGHT if use_playwright else CheckMethod.HTML_SESSION
-    result = _index_spy.check_indexing_status(url, method=method, headless=True)
+    method = CheckMethod.PLAYWRIGHT if use_playwright else CheckMethod.HTTP
+    result = _index_spy.check_indexing_status(url, method=method, headless=True, use_cache=use_cache)
     return result.model_dump()
 
 
@@ -187,18 +191,21 @@ def parse_sitemap(sitemap_url: str) -> dict:
     For large sitemaps, only the first 50 URLs are inlined in the result;
     the rest are summarized as counts.
     """
-    result = _sm.download_and_parse_sitemap(sitemap_url)
-    if result is None:
+    stats = SitemapCrawlStats()
+    sample: list[str] = []
+    for u in _sm.iter_sitemap_urls(sitemap_url, stats=stats):
+        if len(sample) < 50:
+            sample.append(u.loc)
+    if stats.sitemaps_parsed == 0:
         return {"success": False, "message": f"Failed to download {sitemap_url}"}
-    sample = [u.loc for u in result.urls[:50]]
     return {
         "success": True,
-        "sitemaps_parsed": result.total_sitemaps_parsed,
-        "total_urls": len(result.urls),
+        "sitemaps_parsed": stats.sitemaps_parsed,
+        "total_urls": stats.urls_found,
         "sample_urls": sample,
         "note": (
-            f"Sample shows first 50 of {len(result.urls)} URLs."
-            if len(result.urls) > 50
+            f"Sample shows first 50 of {stats.urls_found} URLs."
+            if stats.urls_found > 50
             else None
         ),
     }
@@ -247,28 +254,48 @@ def batch_check_backlinks(input_csv: str, output_csv: str = "") -> dict:
 
 @tool
 def batch_check_indexing(
-    input_csv: str,
+    input_csv: str = "",
     output_csv: str = "",
     use_playwright: bool = False,
     rate_limit: float = 0,
+    resume_job_id: str = "",
+    use_cache: bool = True,
 ) -> dict:
     """Check Google indexing status for many URLs (input CSV must contain a 'url' column).
 
     Output defaults to a timestamped CSV. ``rate_limit`` is seconds of delay
-    between requests; recommended >=1 if not using a proxy.
+    between requests; recommended >=1 if not using a proxy. Every result is
+    checkpointed under the returned ``job_id``; pass it as ``resume_job_id``
+    (input CSV optional) to continue an interrupted run without rechecking
+    finished URLs. Recently checked URLs are answered from the result cache
+    unless ``use_cache`` is False.
     """
-    if input_csv.endswith(".json"):
-        df = pd.read_json(input_csv)
-    else:
-        df = pd.read_csv(input_csv)
-    if "url" not in df.columns:
-        raise ValueError("Input file must contain a 'url' column.")
-    urls = df["url"].dropna().astype(str).tolist()
-
-    method = CheckMethod.PLAYWRIGHT if use_playwright else CheckMethod.HTML_SESSION
-    batch = _index_spy.batch_check_indexing(
-        urls, method=method, rate_limit=rate_limit, headless=True
-    )
+    urls: list[str] = []
+    if input_csv:
+        if input_csv.endswith(".json"):
+            df = pd.read_json(input_csv)
+        else:
+            df = pd.read_csv(input_csv)
+        if "url" not in df.columns:
+            raise ValueError("Input file must contain a 'url' column.")
+        urls = df["url"].dropna().astype(str).tolist()
+
+    method = CheckMethod.PLAYWRIGHT if use_playwright else CheckMethod.HTTP
+    with _index_spy.open_index_job_store() as store:
+        if resume_job_id and not store.has_job(resume_job_id):
+            raise ValueError(f"No saved indexing job with ID {resume_job_id!r}.")
+        if not urls and not resume_job_id:
+            raise ValueError("Provide input_csv or resume_job_id.")
+        batch = _index_spy.batch_check_indexing(
+            urls,
+            method=method,
+            rate_limit=rate_limit,
+            headless=True,
+            job_store=store,
+            job_id=resume_job_id or None,
+            use_cache=use_cache,
+        )
+        pending = len(store.pending_urls(batch.job_id))
     output_csv = output_csv or f"indexing_{_timestamp()}.csv"
     pd.DataFrame([r.model_dump() for r in batch.results]).to_csv(
         output_csv, index=False, encoding="utf-8"
@@ -278,6 +305,9 @@ def batch_check_indexing(
         "indexed": batch.total_indexed,
         "not_indexed": batch.total_not_indexed,
         "errors": batch.total_errors,
+        "cached": sum(1 for r in batch.results if r.cached),
+        "unchecked": pending,
+        "job_id": batch.job_id,
         "output_csv": output_csv,
     }
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime as _dt
+from functools import partial
 
 import click
 import pandas as pd
@@ -98,9 +99,9 @@ def _do_dns(domain: str) -> None:
     console.print(f"[green][+] DNS records saved to {out}[/green]")
 
 
-def _do_robots_check(domain: str) -> None:
+def _do_robots_check(domain: str, use_cache: bool = True) -> None:
     console.print("[blue][*] Fetching robots.txt...[/blue]")
-    robots = fetch_robots_txt(domain) or asyncio.run(fetch_robots_txt_playwright(domain))
+    robots = fetch_robots_txt(domain, use_cache=use_cache) or asyncio.run(fetch_robots_txt_playwright(domain))
     if robots is None:
         console.print("[bold red][-] robots.txt not found.[/bold red]")
         return
@@ -117,7 +118,7 @@ def _do_robots_check(domain: str) -> None:
 
     all_urls: list[tuple[str, str]] = []
     for sm in sitemaps:
-        result = download_and_parse_sitemap(sm)
+        result = download_and_parse_sitemap(sm, use_cache=use_cache)
         if result is None:
             continue
         all_urls.extend((sm, url.loc) for url in result.urls)
@@ -200,7 +201,8 @@ def _do_security_headers(domain: str) -> None:
 
 @click.command()
 @click.option("--domain", default=None, help="Domain to analyze")
-def domain_insight(domain: str | None) -> None:
+@click.option("--no-cache", is_flag=True, default=False, help="Bypass the on-disk HTTP cache (robots.txt, sitemaps)")
+def domain_insight(domain: str | None, no_cache: bool) -> None:
     """Advanced domain information gathering tool."""
     console.print(
         tool_panel("Domain Insight", "Powerful domain information gathering tool.")
@@ -233,7 +235,7 @@ def domain_insight(domain: str | None) -> None:
             "1": _do_reverse_ip,
             "2": _do_subdomains,
             "3": _do_dns,
-            "4": _do_robots_check,
+            "4": partial(_do_robots_check, use_cache=not no_cache),
             "5": _do_whois,
             "6": _do_ip_details,
             "7": _do_tech_stack,
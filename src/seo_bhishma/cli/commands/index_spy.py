@@ -10,7 +10,11 @@ import pandas as pd
 from rich.prompt import Prompt
 
 from seo_bhishma.cli._ui import console, make_progress, tool_panel
-from seo_bhishma.core.index_spy import batch_check_indexing, check_indexing_status
+from seo_bhishma.core.index_spy import (
+    batch_check_indexing,
+    check_indexing_status,
+    open_index_job_store,
+)
 from seo_bhishma.models.index_spy import (
     CaptchaConfig,
     CaptchaHandling,
@@ -70,12 +74,14 @@ def _prompt_captcha_config() -> CaptchaConfig | None:
 def _prompt_method_and_handling() -> tuple[CheckMethod, CaptchaHandling, bool]:
     method_choice = Prompt.ask(
         "[cyan]Checking method[/cyan]",
-        choices=["HTMLSession", "Playwright"],
-        default="HTMLSession",
-    )
-    method = (
-        CheckMethod.HTML_SESSION if method_choice == "HTMLSession" else CheckMethod.PLAYWRIGHT
+        choices=["HTTP", "HTMLSession", "Playwright"],
+        default="HTTP",
     )
+    method = {
+        "HTTP": CheckMethod.HTTP,
+        "HTMLSession": CheckMethod.HTML_SESSION,
+        "Playwright": CheckMethod.PLAYWRIGHT,
+    }[method_choice]
     headless = False
     handling = CaptchaHandling.AUTOMATIC
     if method == CheckMethod.PLAYWRIGHT:
@@ -97,9 +103,88 @@ def _prompt_method_and_handling() -> tuple[CheckMethod, CaptchaHandling, bool]:
     return method, handling, headless
 
 
+def _run_batch(
+    urls: list[str],
+    proxy_config: ProxyConfig | None,
+    captcha_config: CaptchaConfig | None,
+    rate_limit: float,
+    job_id: str | None = None,
+) -> None:
+    """Run (or resume) a checkpointed batch job and export its results to CSV."""
+    method, handling, headless = _prompt_method_and_handling()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    default_out = f"index_spy_output_{timestamp}.csv"
+    output_file = Prompt.ask("[cyan]Output CSV file[/cyan]", default=default_out)
+    grouped = (
+        Prompt.ask(
+            "[cyan]Confirm URLs in bulk with site: prefix queries first?[/cyan]",
+            choices=["yes", "no"],
+            default="no",
+        )
+        == "yes"
+    )
+
+    with open_index_job_store() as store:
+        job_id = store.open_job(urls, job_id)
+        console.print(
+            f"[blue][+] Job ID: {job_id} (resume with: seo-bhishma index-spy --resume {job_id})[/blue]"
+        )
+        with make_progress() as progress:
+            task = progress.add_task("[+] Processing URLs...", total=len(urls) or None)
+
+            def on_progress(completed: int, total: int) -> None:
+                progress.update(task, completed=completed, total=total)
+
+            batch = batch_check_indexing(
+                urls,
+                method=method,
+                proxy_config=proxy_config,
+                captcha_config=captcha_config,
+                captcha_handling=handling,
+                headless=headless,
+                rate_limit=rate_limit,
+                on_progress=on_progress,
+                job_store=store,
+                job_id=job_id,
+                grouped=grouped,
+            )
+        pending = len(store.pending_urls(job_id))
+
+    pd.DataFrame([r.model_dump() for r in batch.results]).to_csv(
+        output_file, index=False, encoding="utf-8"
+    )
+    console.print(
+        f"[green bold][+] Saved {batch.total_checked} results to {output_file}[/green bold]"
+    )
+    console.print(
+        f"[green]Indexed: {batch.total_indexed} | "
+        f"Not Indexed: {batch.total_not_indexed} | "
+        f"Errors: {batch.total_errors}[/green]"
+    )
+    if pending:
+        console.print(
+            f"[yellow][!] {pending} URLs still unchecked. "
+            f"Resume with: seo-bhishma index-spy --resume {job_id}[/yellow]"
+        )
+
+
 @click.command()
-def index_spy() -> None:
+@click.option(
+    "--resume",
+    "resume_job",
+    default=None,
+    metavar="JOB_ID",
+    help="Resume an interrupted batch job, skipping URLs it already checked",
+)
+def index_spy(resume_job: str | None) -> None:
     """Check Google indexing status for bulk URLs."""
+    if resume_job:
+        with open_index_job_store() as store:
+            known = store.has_job(resume_job)
+        if not known:
+            console.print(f"[red][-] No saved job with ID {resume_job}.[/red]")
+            return
+
     proxy_config = _prompt_proxy_config()
     captcha_config = _prompt_captcha_config()
     try:
@@ -111,6 +196,10 @@ def index_spy() -> None:
     except ValueError:
         rate_limit = 0.0
 
+    if resume_job:
+        _run_batch([], proxy_config, captcha_config, rate_limit, job_id=resume_job)
+        return
+
     while True:
         console.print(
             tool_panel("IndexSpy", "Bulk Indexing Checker with Proxy & Browser support.")
@@ -131,9 +220,11 @@ def index_spy() -> None:
             method, handling, headless = _prompt_method_and_handling()
             proxy_dict = None
             if proxy_config and proxy_config.proxy_list:
-                from seo_bhishma.core.index_spy import ProxyRotator
+                from seo_bhishma.core.index_spy import ProxyRotator, get_proxy_health_board
 
-                rotator = ProxyRotator(proxy_config.proxy_list, proxy_config.mode)
+                rotator = ProxyRotator(
+                    proxy_config.proxy_list, proxy_config.mode, health=get_proxy_health_board()
+                )
                 proxy_dict = rotator.find_valid(method)
                 if proxy_dict:
                     console.print(f"[blue][+] Using proxy: {proxy_dict}[/blue]")
@@ -153,7 +244,8 @@ def index_spy() -> None:
                 )
             color = "green" if result.status == "Indexed" else "red"
             console.print(f"[cyan][+] URL: {result.url}[/cyan]")
-            console.print(f"[{color}][+] Indexing Status: {result.status}[/{color}]")
+            cached = " (cached)" if result.cached else ""
+            console.print(f"[{color}][+] Indexing Status: {result.status}{cached}[/{color}]")
             console.print(f"[cyan][+] Proxy used: {result.proxy_used}[/cyan]")
 
         elif choice == "2":
@@ -171,40 +263,6 @@ def index_spy() -> None:
                 continue
             urls = df["url"].dropna().astype(str).tolist()
 
-            method, handling, headless = _prompt_method_and_handling()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_out = f"index_spy_output_{timestamp}.csv"
-            output_file = Prompt.ask(
-                "[cyan]Output CSV file[/cyan]", default=default_out
-            )
-
-            with make_progress() as progress:
-                task = progress.add_task("[+] Processing URLs...", total=len(urls))
-
-                def on_progress(completed: int, total: int) -> None:
-                    progress.update(task, completed=completed, total=total)
-
-                batch = batch_check_indexing(
-                    urls,
-                    method=method,
-                    proxy_config=proxy_config,
-                    captcha_config=captcha_config,
-                    captcha_handling=handling,
-                    headless=headless,
-                    rate_limit=rate_limit,
-                    on_progress=on_progress,
-                )
-
-            pd.DataFrame([r.model_dump() for r in batch.results]).to_csv(
-                output_file, index=False, encoding="utf-8"
-            )
-            console.print(
-                f"[green bold][+] Saved {batch.total_checked} results to {output_file}[/green bold]"
-            )
-            console.print(
-                f"[green]Indexed: {batch.total_indexed} | "
-                f"Not Indexed: {batch.total_not_indexed} | "
-                f"Errors: {batch.total_errors}[/green]"
-            )
+            _run_batch(urls, proxy_config, captcha_config, rate_limit)
 
         console.print("\n" + "=" * 50 + "\n")
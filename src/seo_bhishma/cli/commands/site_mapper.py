@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
+import csv
+import os
 from datetime import datetime
 from pathlib import Path
 
 import click
-import pandas as pd
 from rich.prompt import Prompt
 
 from seo_bhishma.cli._ui import console, make_progress, tool_panel
 from seo_bhishma.core._utils import extract_domain
-from seo_bhishma.core.site_mapper import download_and_parse_sitemap
+from seo_bhishma.core.site_mapper import diff_sitemap, iter_sitemap_urls
+from seo_bhishma.models.site_mapper import SitemapCrawlStats, SitemapUrl, SitemapUrlChange
 
 
 @click.command()
 @click.option("--sitemap-url", default=None, help="URL of the sitemap to download and parse")
 @click.option("--output-file", default=None, help="Path to the output CSV file")
-def site_mapper(sitemap_url: str | None, output_file: str | None) -> None:
+@click.option("--no-cache", is_flag=True, default=False, help="Bypass the on-disk HTTP cache and refetch everything")
+@click.option(
+    "--incremental",
+    "store_path",
+    default=None,
+    help="Fingerprint database from previous runs; export only added/removed/modified URLs",
+)
+def site_mapper(sitemap_url: str | None, output_file: str | None, no_cache: bool, store_path: str | None) -> None:
     """Download and parse sitemaps, export URLs to CSV."""
     console.print(
         tool_panel(
@@ -39,24 +48,65 @@ def site_mapper(sitemap_url: str | None, output_file: str | None) -> None:
         default = f"{domain}_sitemap_{timestamp}.csv"
         output_file = Prompt.ask("[cyan]Enter the output CSV file[/cyan]", default=default)
 
+    if store_path:
+        _export_changes(sitemap_url, output_file, store_path, use_cache=not no_cache)
+        return
+
     console.print("[green][+] Downloading and parsing sitemap...[/green]")
 
+    # Rows are streamed into a sibling temp file so memory stays flat for huge
+    # sitemaps; it only replaces output_file once something was parsed.
+    stats = SitemapCrawlStats()
+    partial = Path(f"{output_file}.part")
+    try:
+        with make_progress() as progress, open(partial, "w", newline="", encoding="utf-8") as f:
+            task = progress.add_task("[+] Parsing sitemaps...", total=None)
+
+            def on_progress(completed: int, total: int, message: str = "") -> None:
+                progress.update(task, total=total, completed=completed)
+
+            writer = csv.DictWriter(f, fieldnames=list(SitemapUrl.model_fields))
+            writer.writeheader()
+            for row in iter_sitemap_urls(sitemap_url, stats=stats, on_progress=on_progress, use_cache=not no_cache):
+                writer.writerow(row.model_dump())
+        if stats.sitemaps_parsed:
+            os.replace(partial, output_file)
+    finally:
+        partial.unlink(missing_ok=True)
+
+    if stats.sitemaps_parsed == 0:
+        console.print("[bold red][-] Failed to process sitemap.[/bold red]")
+        return
+
+    if stats.failed_sitemaps:
+        console.print(f"[yellow][!] {len(stats.failed_sitemaps)} nested sitemap(s) could not be parsed.[/yellow]")
+    console.print(
+        f"[green][+] {stats.urls_found} URLs from {stats.sitemaps_parsed} "
+        f"sitemap(s) saved to {output_file}[/green]"
+    )
+
+
+def _export_changes(sitemap_url: str, output_file: str, store_path: str, use_cache: bool) -> None:
+    console.print("[green][+] Comparing sitemap against the previous run...[/green]")
     with make_progress() as progress:
-        task = progress.add_task("[+] Parsing URLs...", total=None)
+        task = progress.add_task("[+] Checking sitemaps...", total=None)
 
-        def on_progress(completed: int, total: int) -> None:
+        def on_progress(completed: int, total: int, message: str = "") -> None:
             progress.update(task, total=total, completed=completed)
 
-        result = download_and_parse_sitemap(sitemap_url, on_progress=on_progress)
+        result = diff_sitemap(sitemap_url, store_path, on_progress=on_progress, use_cache=use_cache)
 
     if result is None:
         console.print("[bold red][-] Failed to process sitemap.[/bold red]")
         return
 
-    rows = [u.model_dump() for u in result.urls]
-    df = pd.DataFrame(rows)
-    df.to_csv(output_file, index=False, encoding="utf-8")
+    with open(output_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(SitemapUrlChange.model_fields))
+        writer.writeheader()
+        writer.writerows(change.model_dump() for change in result.changes)
+
     console.print(
-        f"[green][+] {len(rows)} URLs from {result.total_sitemaps_parsed} "
-        f"sitemap(s) saved to {output_file}[/green]"
+        f"[green][+] {result.added} added, {result.removed} removed, {result.modified} modified "
+        f"({result.sitemaps_parsed} sitemap(s) parsed, {result.sitemaps_skipped} unchanged) "
+        f"saved to {output_file}[/green]"
     )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
 import click
@@ -11,17 +13,24 @@ from rich.prompt import Prompt
 
 from seo_bhishma.cli._ui import console, make_progress, tool_panel
 from seo_bhishma.core.sitemap_generator import (
+    MANIFEST_FILENAME,
     generate_nested_sitemaps,
     generate_sitemap,
     write_sitemap,
 )
 
 
+def _iter_urls(file_path: str, chunksize: int = 100_000) -> Iterator[str]:
+    """Stream URLs from a CSV file (expects a 'url' column) without loading it whole."""
+    with pd.read_csv(file_path, chunksize=chunksize) as reader:
+        for df in reader:
+            col = "url" if "url" in df.columns else df.columns[0]
+            yield from df[col].dropna().astype(str)
+
+
 def _read_urls(file_path: str) -> list[str]:
     """Read URLs from a CSV file (expects a 'url' column)."""
-    df = pd.read_csv(file_path)
-    col = "url" if "url" in df.columns else df.columns[0]
-    return df[col].dropna().astype(str).tolist()
+    return list(_iter_urls(file_path))
 
 
 @click.command()
@@ -29,6 +38,11 @@ def _read_urls(file_path: str) -> list[str]:
 @click.option("--output-dir", default="sitemaps/", help="Output directory for sitemaps")
 @click.option("--nested", is_flag=True, default=False, help="Generate nested sitemaps")
 @click.option("--url-limit", default=50000, help="Max URLs per sitemap (nested mode)")
+@click.option(
+    "--hash-partitions",
+    default=0,
+    help="Nested mode: shard URLs by hash into N stable partitions instead of filling shards in order",
+)
 @click.option("--compressed", is_flag=True, default=False, help="Gzip the output files")
 @click.option("--priority", default="", help="Priority for URLs (e.g. 0.8)")
 @click.option("--frequency", default="", help="Change frequency (daily/weekly/monthly/yearly)")
@@ -38,6 +52,7 @@ def sitemap_generator(
     output_dir: str,
     nested: bool,
     url_limit: int,
+    hash_partitions: int,
     compressed: bool,
     priority: str,
     frequency: str,
@@ -90,8 +105,14 @@ def sitemap_generator(
                 "[cyan]Last modified (blank for now)[/cyan]", default=""
             ) or datetime.now().strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
+        # Nested output is streamed shard by shard, so large inputs are never read whole.
         try:
-            urls = _read_urls(input_file)
+            if use_nested:
+                url_iter = _iter_urls(input_file)
+                first = next(url_iter, None)
+                urls = [] if first is None else chain([first], url_iter)
+            else:
+                urls = _read_urls(input_file)
         except Exception as e:
             console.print(f"[red][-] Failed to read input file: {e}[/red]")
             input_file = None
@@ -133,10 +154,12 @@ def sitemap_generator(
                         lastmod=lastmod,
                         compressed=compressed,
                         on_progress=on_progress,
+                        hash_partitions=hash_partitions or None,
                     )
                 console.print(f"[green bold][+] Sitemap index saved to {index_path}[/green bold]")
                 console.print(
-                    f"[green bold][+] Total sitemaps created: {len(files)}[/green bold]"
+                    f"[green bold][+] Total sitemaps created: {len(files)} "
+                    f"(per-file stats in {MANIFEST_FILENAME})[/green bold]"
                 )
         except Exception as e:
             console.print(f"[bold red][-] Failed to generate sitemaps: {e}[/bold red]")
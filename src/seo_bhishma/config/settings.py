@@ -52,6 +52,32 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
 
+    # On-disk conditional-GET cache for sitemaps / robots.txt ("" = platform cache dir)
+    http_cache_dir: str = ""
+    http_cache_max_mb: int = 256
+
+    # Shared HTTP session: hosts with kept-alive pools, and connections per host (>= worker count)
+    http_pool_hosts: int = 64
+    http_pool_per_host: int = 16
+
+    # Per-host adaptive rate limit: starting requests/second, burst size, and the ceiling it may climb to
+    http_host_rate: float = 10.0
+    http_host_burst: int = 20
+    http_host_max_rate: float = 100.0
+
+    # Largest HTML body read by page fetches (backlink checks, redirect mapping); the rest is never downloaded
+    http_max_html_kb: int = 2048
+
+    # Checkpoint database for resumable batch indexing jobs ("" = platform cache dir)
+    index_jobs_db: str = ""
+
+    # Cache of definitive indexing results ("" = platform cache dir; TTL 0 disables it)
+    index_cache_db: str = ""
+    index_cache_ttl_hours: float = 72
+
+    # Persisted proxy health scoreboard used to rank proxies ("" = platform cache dir)
+    proxy_health_db: str = ""
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -0,0 +1,322 @@
+"""Async CAPTCHA solver client shared by the index checkers.
+
+Solver tasks are submitted and polled on a single event loop over one
+pooled ``httpx.AsyncClient``, so many solves can be in flight at once
+without a thread (or a blocking ``time.sleep``) per CAPTCHA. Latency,
+success rate and cost are tracked per service and used to prefer the
+cheaper / faster provider when more than one is configured.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future
+from functools import lru_cache
+
+import httpx
+
+from seo_bhishma.core._exceptions import CaptchaError
+from seo_bhishma.models.index_spy import CaptchaConfig, CaptchaSolverStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_SOLVE_TIMEOUT = 300.0
+DEFAULT_MAX_CONNECTIONS = 20
+# List prices in USD per reCAPTCHA v2 solve, used until a service reports its own
+DEFAULT_SOLVE_COSTS = {"2captcha": 0.00299, "anti-captcha": 0.002}
+# Dollar value of one second spent waiting for a token, so latency and cost rank on one scale
+DEFAULT_LATENCY_WEIGHT = 0.0001
+_UNKNOWN_SOLVE_COST = 0.003
+_UNKNOWN_SOLVE_LATENCY = 30.0
+
+_DEFAULT_BASE_URLS = {
+    "2captcha": "http://2captcha.com",
+    "anti-captcha": "https://api.anti-captcha.com",
+}
+
+
+class _TwoCaptcha:
+    """2Captcha ``in.php`` / ``res.php`` API."""
+
+    def __init__(self, api_key: str, base_url: str) -> None:
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+
+    async def submit(self, client: httpx.AsyncClient, page_url: str, site_key: str) -> str:
+        payload = {"key": self.api_key, "method": "userrecaptcha", "googlekey": site_key, "pageurl": page_url}
+        response = await client.post(f"{self.base_url}/in.php", data=payload)
+        parts = response.text.split("|")
+        if parts[0] != "OK":
+            raise CaptchaError(f"2Captcha error: {response.text}")
+        return parts[1]
+
+    async def poll(self, client: httpx.AsyncClient, task_id: str) -> tuple[str, float | None] | None:
+        params = {"key": self.api_key, "action": "get", "id": task_id}
+        response = await client.get(f"{self.base_url}/res.php", params=params)
+        parts = response.text.split("|")
+        if parts[0] == "OK":
+            return parts[1], None
+        if parts[0] != "CAPCHA_NOT_READY":
+            raise CaptchaError(f"2Captcha solve error: {response.text}")
+        return None
+
+
+class _AntiCaptcha:
+    """Anti-Captcha ``createTask`` / ``getTaskResult`` API."""
+
+    def __init__(self, api_key: str, base_url: str) -> None:
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+
+    async def submit(self, client: httpx.AsyncClient, page_url: str, site_key: str) -> str:
+        payload = {
+            "clientKey": self.api_key,
+            "task": {"type": "NoCaptchaTaskProxyless", "websiteURL": page_url, "websiteKey": site_key},
+        }
+        data = (await client.post(f"{self.base_url}/createTask", json=payload)).json()
+        if data.get("errorId") != 0:
+            raise CaptchaError(f"Anti-Captcha error: {data.get('errorDescription')}")
+        return str(data["taskId"])
+
+    async def poll(self, client: httpx.AsyncClient, task_id: str) -> tuple[str, float | None] | None:
+        payload = {"clientKey": self.api_key, "taskId": int(task_id)}
+        data = (await client.post(f"{self.base_url}/getTaskResult", json=payload)).json()
+        if data.get("status") == "ready":
+            cost = data.get("cost")
+            return data["solution"]["gRecaptchaResponse"], float(cost) if cost is not None else None
+        if data.get("errorId") or data.get("status") != "processing":
+            raise CaptchaError(f"Anti-Captcha solve error: {data.get('errorDescription')}")
+        return None
+
+
+_PROVIDERS = {"2captcha": _TwoCaptcha, "anti-captcha": _AntiCaptcha}
+
+
+class AsyncCaptchaSolver:
+    """Submit and poll CAPTCHA solver tasks concurrently on one event loop.
+
+    Each ``solve`` call submits a task and then polls it every
+    ``poll_interval`` seconds with ``asyncio.sleep``, so any number of
+    solves share the loop and the client's connection pool. Given several
+    service configs, they are tried cheapest-first by expected cost per
+    successful solve, with waiting time priced at ``latency_weight`` USD/s.
+
+    Create and use it from a single event loop; ``aclose()`` releases the
+    HTTP connections.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_SOLVE_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        latency_weight: float = DEFAULT_LATENCY_WEIGHT,
+        base_urls: dict[str, str] | None = None,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.latency_weight = latency_weight
+        self._max_connections = max_connections
+        self._base_urls = {**_DEFAULT_BASE_URLS, **(base_urls or {})}
+        self._client: httpx.AsyncClient | None = None
+        # service -> [attempts, solved, failed, latency_total, cost_total]
+        self._stats: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    async def solve(
+        self,
+        configs: CaptchaConfig | Sequence[CaptchaConfig],
+        page_url: str,
+        site_key: str,
+    ) -> str | None:
+        """Solve a reCAPTCHA, trying the preferred configured service first.
+
+        Args:
+            configs: One service config, or several to choose between.
+            page_url: Page where the CAPTCHA appears.
+            site_key: reCAPTCHA site key.
+
+        Returns:
+            Solution token, or None if every service failed.
+        """
+        for config in self.rank(configs):
+            token = await self._solve_with(config, page_url, site_key)
+            if token:
+                return token
+        return None
+
+    def rank(self, configs: CaptchaConfig | Sequence[CaptchaConfig]) -> list[CaptchaConfig]:
+        """Order service configs by expected cost per successful solve, cheapest first."""
+        if isinstance(configs, CaptchaConfig):
+            return [configs]
+        return sorted(configs, key=self._expected_cost)
+
+    def stats(self) -> list[CaptchaSolverStats]:
+        """Per-service solve counts, average latency and spend so far."""
+        with self._lock:
+            rows = {service: list(row) for service, row in self._stats.items()}
+        return [
+            CaptchaSolverStats(
+                service=service,
+                attempts=attempts,
+                solved=solved,
+                failed=failed,
+                avg_latency=latency_total / solved if solved else None,
+                total_cost=cost_total,
+            )
+            for service, (attempts, solved, failed, latency_total, cost_total) in sorted(rows.items())
+        ]
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _client_for_loop(self) -> httpx.AsyncClient:
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self._max_connections, max_keepalive_connections=self._max_connections
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=30)
+        return self._client
+
+    async def _solve_with(self, config: CaptchaConfig, page_url: str, site_key: str) -> str | None:
+        service = config.service.lower()
+        provider_cls = _PROVIDERS.get(service)
+        if provider_cls is None:
+            logger.error("Unknown captcha service: %s", config.service)
+            return None
+        provider = provider_cls(config.api_key, self._base_urls[service])
+        client = self._client_for_loop()
+        started = time.monotonic()
+
+        try:
+            task_id = await provider.submit(client, page_url, site_key)
+            while True:
+                await asyncio.sleep(self.poll_interval)
+                solution = await provider.poll(client, task_id)
+                if solution is not None:
+                    break
+                if time.monotonic() - started >= self.timeout:
+                    raise CaptchaError(f"{config.service} did not solve task {task_id} in {self.timeout:.0f}s")
+        except (CaptchaError, httpx.HTTPError, ValueError, KeyError) as e:
+            logger.error("Error solving captcha via %s: %s", config.service, e)
+            self._record(service, None, 0.0)
+            return None
+
+        token, reported_cost = solution
+        cost = reported_cost if reported_cost is not None else self._list_price(config)
+        self._record(service, time.monotonic() - started, cost)
+        return token
+
+    def _record(self, service: str, latency: float | None, cost: float) -> None:
+        with self._lock:
+            row = self._stats.setdefault(service, [0, 0, 0, 0.0, 0.0])
+            row[0] += 1
+            if latency is None:
+                row[2] += 1
+            else:
+                row[1] += 1
+                row[3] += latency
+                row[4] += cost
+
+    def _list_price(self, config: CaptchaConfig) -> float:
+        if config.cost_per_solve is not None:
+            return config.cost_per_solve
+        return DEFAULT_SOLVE_COSTS.get(config.service.lower(), _UNKNOWN_SOLVE_COST)
+
+    def _expected_cost(self, config: CaptchaConfig) -> float:
+        with self._lock:
+            attempts, solved, _failed, latency_total, cost_total = self._stats.get(
+                config.service.lower(), [0, 0, 0, 0.0, 0.0]
+            )
+        # Laplace-smoothed, so an untried service is neither favoured nor ruled out
+        success_rate = (solved + 1) / (attempts + 2)
+        cost = cost_total / solved if solved and config.cost_per_solve is None else self._list_price(config)
+        latency = latency_total / solved if solved else _UNKNOWN_SOLVE_LATENCY
+        return (cost + self.latency_weight * latency) / success_rate
+
+
+class CaptchaSolverPool:
+    """``AsyncCaptchaSolver`` running on its own event-loop thread.
+
+    Lets synchronous callers (HTTP checks, batch worker lanes) share one
+    solver: ``submit`` returns a future immediately so the caller can keep
+    checking other URLs, and ``solve`` blocks only the calling thread while
+    every pending solve is polled together on the pool's loop.
+    """
+
+    def __init__(self, **solver_options) -> None:
+        self.solver = AsyncCaptchaSolver(**solver_options)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="captcha-solver", daemon=True)
+        self._thread.start()
+        self._closed = False
+
+    def submit(
+        self,
+        configs: CaptchaConfig | Sequence[CaptchaConfig],
+        page_url: str,
+        site_key: str,
+    ) -> Future[str | None]:
+        """Start a solve in the background and return a future for its token."""
+        if self._closed:
+            raise RuntimeError("CaptchaSolverPool is closed")
+        return asyncio.run_coroutine_threadsafe(self.solver.solve(configs, page_url, site_key), self._loop)
+
+    def solve(
+        self,
+        configs: CaptchaConfig | Sequence[CaptchaConfig],
+        page_url: str,
+        site_key: str,
+    ) -> str | None:
+        """Solve a reCAPTCHA, blocking the calling thread until done.
+
+        Args:
+            configs: One service config, or several to choose between.
+            page_url: Page where the CAPTCHA appears.
+            site_key: reCAPTCHA site key.
+
+        Returns:
+            Solution token, or None on failure.
+        """
+        return self.submit(configs, page_url, site_key).result()
+
+    def stats(self) -> list[CaptchaSolverStats]:
+        """Per-service solve statistics; see ``AsyncCaptchaSolver.stats``."""
+        return self.solver.stats()
+
+    def close(self) -> None:
+        """Close the HTTP client and stop the event loop."""
+        if self._closed:
+            return
+        self._closed = True
+        asyncio.run_coroutine_threadsafe(self.solver.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> CaptchaSolverPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@lru_cache(maxsize=1)
+def get_captcha_solver() -> CaptchaSolverPool:
+    """Process-wide solver pool shared by every CAPTCHA-solving check."""
+    return CaptchaSolverPool()
+
+
+def reset_captcha_solver() -> None:
+    """Close the shared solver pool; the next call builds a fresh one."""
+    if get_captcha_solver.cache_info().currsize:
+        get_captcha_solver().close()
+    get_captcha_solver.cache_clear()
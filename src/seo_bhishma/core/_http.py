@@ -2,33 +2,81 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import re
+import sys
 import threading
 import time
-from collections import defaultdict
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import IO
 from urllib.parse import urlparse
 
+import httpx
 import requests
 from browserforge.headers import HeaderGenerator
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 from urllib3.util.retry import Retry
 
 DEFAULT_TIMEOUT = 15
 RETRY_STATUS = (429, 500, 502, 503, 504)
 
 
+class _LimiterAwareRetry(Retry):
+    """``Retry`` that reports every response it retries on to the shared rate limiter.
+
+    urllib3 retries 429/503 below ``requests``, so without this the caller
+    only sees the outcome after the retries (or a ``RetryError``) and the
+    limiter never learns the host is throttling.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and _pool is not None:
+            get_rate_limiter().record(
+                _pool_url(_pool, url), response.status, parse_retry_after(response.headers.get("Retry-After"))
+            )
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def _pool_url(pool, path: str | None) -> str:
+    default_port = {"http": 80, "https": 443}.get(pool.scheme)
+    netloc = pool.host if pool.port in (None, default_port) else f"{pool.host}:{pool.port}"
+    return f"{pool.scheme}://{netloc}{path or '/'}"
+
+
 def requests_retry_session(
     retries: int = 3,
     backoff_factor: float = 0.5,
     status_forcelist: tuple[int, ...] = RETRY_STATUS,
     session: requests.Session | None = None,
+    pool_hosts: int = DEFAULT_POOLSIZE,
+    pool_per_host: int = DEFAULT_POOLSIZE,
 ) -> requests.Session:
     """Create a requests session with automatic retry logic.
 
     Retries on connect/read failures and on 429/5xx responses with exponential
-    backoff. Adds a randomized browser-like User-Agent.
+    backoff; each retried response is also recorded on ``get_rate_limiter()``.
+    Adds a randomized browser-like User-Agent.
+
+    This builds a new session (and connection pools) on every call; prefer
+    ``get_session()`` for anything that runs more than once per process.
+    ``pool_hosts`` is how many per-host connection pools are kept alive,
+    ``pool_per_host`` how many connections each of them holds.
     """
     session = session or requests.Session()
-    retry = Retry(
+    retry = _LimiterAwareRetry(
         total=retries,
         read=retries,
         connect=retries,
@@ -38,48 +86,837 @@ def requests_retry_session(
         allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "POST"}),
         respect_retry_after_header=True,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_hosts, pool_maxsize=pool_per_host)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
-def generate_headers() -> dict[str, str]:
-    """Generate randomized browser headers using browserforge."""
-    generator = HeaderGenerator(
+_sessions: dict[tuple, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    status_forcelist: tuple[int, ...] = RETRY_STATUS,
+) -> requests.Session:
+    """Return the process-wide retrying session for these retry settings.
+
+    Sessions are built once (see ``requests_retry_session``) and shared by
+    every caller and thread, so repeated requests to the same host reuse
+    kept-alive connections instead of a fresh TCP + TLS handshake each
+    time. Connection pools are keyed by host: ``Settings.http_pool_hosts``
+    hosts are kept, each with up to ``Settings.http_pool_per_host``
+    connections, which should be at least the worker count hitting one
+    host at once. ``close_sessions()`` (also run at exit) releases them.
+
+    Callers must pass per-request headers/proxies rather than mutating the
+    shared session.
+    """
+    key = (retries, backoff_factor, tuple(status_forcelist))
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            pool_hosts, pool_per_host = _pool_limits()
+            session = _sessions[key] = requests_retry_session(
+                retries, backoff_factor, status_forcelist, pool_hosts=pool_hosts, pool_per_host=pool_per_host
+            )
+        return session
+
+
+def _pool_limits() -> tuple[int, int]:
+    from seo_bhishma.core._config import get_settings
+
+    settings = get_settings()
+    return max(1, settings.http_pool_hosts), max(1, settings.http_pool_per_host)
+
+
+def close_sessions() -> None:
+    """Close every shared session and its pooled connections.
+
+    Registered with ``atexit``; safe to call more than once. The next
+    ``get_session()`` call builds a fresh session.
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_sessions)
+
+
+# ---------------------------------------------------------------------------
+# Async transport
+# ---------------------------------------------------------------------------
+
+# Statuses whose Retry-After header is honoured, as in urllib3's Retry
+_RETRY_AFTER_STATUS = frozenset({413, 429, 503})
+_BACKOFF_MAX = 120.0
+
+
+class AsyncRetryClient:
+    """``httpx.AsyncClient`` with the retry semantics of ``requests_retry_session``.
+
+    Connect/read errors and ``status_forcelist`` responses are retried up to
+    ``retries`` times with urllib3-style exponential backoff
+    (``backoff_factor * 2 ** (n - 1)``, no sleep before the first retry),
+    and a ``Retry-After`` header on 413/429/503 is honoured instead. Unlike
+    ``requests``, exhausting the status retries returns the last response
+    rather than raising, so callers check ``status_code`` as usual.
+
+    One client drives any number of concurrent requests on its event loop
+    over a shared connection pool (``max_connections`` in total,
+    ``max_keepalive`` kept idle). Create it inside the loop that uses it,
+    and close it with ``aclose()`` or ``async with``.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        status_forcelist: tuple[int, ...] = RETRY_STATUS,
+        max_connections: int = 100,
+        max_keepalive: int = 20,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = frozenset(status_forcelist)
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    async def request(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        """Send a request, retrying transient failures.
+
+        With ``stream=True`` the body is left unread: read it with
+        ``aiter_bytes()`` and ``aclose()`` the response when done.
+        """
+        follow_redirects = kwargs.pop("follow_redirects", httpx.USE_CLIENT_DEFAULT)
+        attempt = 0
+        while True:
+            try:
+                request = self._client.build_request(method, url, **kwargs)
+                response = await self._client.send(request, stream=stream, follow_redirects=follow_redirects)
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    raise
+            else:
+                if response.status_code not in self.status_forcelist or attempt >= self.retries:
+                    return response
+                delay = None
+                if response.status_code in _RETRY_AFTER_STATUS:
+                    delay = parse_retry_after(response.headers.get("Retry-After"))
+                await response.aclose()
+                if delay is not None:
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+            attempt += 1
+            await asyncio.sleep(self._backoff(attempt))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET ``url``; see ``request``. Redirects are followed by default, as in ``requests``."""
+        kwargs.setdefault("follow_redirects", True)
+        return await self.request("GET", url, **kwargs)
+
+    def _backoff(self, attempt: int) -> float:
+        if attempt <= 1:
+            return 0.0
+        return min(_BACKOFF_MAX, self.backoff_factor * 2 ** (attempt - 1))
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncRetryClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+@asynccontextmanager
+async def async_client_scope(client: AsyncRetryClient | None = None, **options) -> AsyncIterator[AsyncRetryClient]:
+    """Yield ``client``, or a fresh ``AsyncRetryClient`` closed on exit when none is given.
+
+    Lets async helpers accept an optional caller-owned client, so batch
+    callers can share one connection pool across many calls.
+    """
+    if client is not None:
+        yield client
+        return
+    async with AsyncRetryClient(**options) as owned:
+        yield owned
+
+
+# Pre-generated header sets kept ready, and the level that triggers a background top-up
+HEADER_POOL_SIZE = 256
+_HEADER_POOL_LOW_WATER = 64
+
+
+@lru_cache(maxsize=1)
+def _header_generator() -> HeaderGenerator:
+    return HeaderGenerator(
         browser=("chrome", "firefox", "safari", "edge"),
         os=("windows", "macos", "linux", "android", "ios"),
         device=("desktop", "mobile"),
         locale=("en-US", "en"),
         http_version=2,
     )
-    return generator.generate()
 
 
-class HostRateLimiter:
-    """Simple per-host minimum-interval rate limiter.
+class _HeaderPool:
+    """Ring buffer of pre-generated header sets, topped up on a background thread.
+
+    ``take`` pops a ready set (each is handed out once, so callers may
+    mutate it); when the buffer runs low a daemon thread refills it, and
+    only a fully drained buffer falls back to generating inline.
+    """
+
+    def __init__(self, size: int = HEADER_POOL_SIZE, low_water: int = _HEADER_POOL_LOW_WATER) -> None:
+        self._size = size
+        self._low_water = min(low_water, size)
+        self._ready: deque[dict[str, str]] = deque()
+        self._generate_lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._refilling = False
+
+    def take(self) -> dict[str, str]:
+        try:
+            headers = self._ready.popleft()
+        except IndexError:
+            headers = self._generate()
+        if len(self._ready) < self._low_water:
+            self._start_refill()
+        return headers
+
+    def fill(self) -> None:
+        """Top the buffer up to its full size on the calling thread."""
+        while len(self._ready) < self._size:
+            self._ready.append(self._generate())
+
+    def _generate(self) -> dict[str, str]:
+        with self._generate_lock:
+            return _header_generator().generate()
+
+    def _start_refill(self) -> None:
+        with self._refill_lock:
+            if self._refilling:
+                return
+            self._refilling = True
+        threading.Thread(target=self._refill, name="header-pool", daemon=True).start()
+
+    def _refill(self) -> None:
+        try:
+            self.fill()
+        finally:
+            with self._refill_lock:
+                self._refilling = False
+
+
+@lru_cache(maxsize=1)
+def _header_pool() -> _HeaderPool:
+    return _HeaderPool()
+
+
+def generate_headers() -> dict[str, str]:
+    """Randomized browser headers (browserforge), served from a pre-generated pool."""
+    return _header_pool().take()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Per-host token-bucket defaults, overridable via Settings: steady requests/second,
+# burst size, and the polite ceiling adaptation may climb to
+DEFAULT_HOST_RATE = 10.0
+DEFAULT_HOST_BURST = 20
+DEFAULT_MAX_HOST_RATE = 100.0
+_MIN_HOST_RATE = 0.1
+# Statuses that mean "slow down" even without a Retry-After header
+THROTTLE_STATUS = frozenset({429, 503})
+
+
+class _Bucket:
+    __slots__ = ("rate", "tokens", "refilled", "streak")
+
+    def __init__(self, rate: float, tokens: float, now: float) -> None:
+        self.rate = rate
+        self.tokens = tokens
+        # Time the tokens were last counted; in the future while the host is benched by Retry-After
+        self.refilled = now
+        self.streak = 0
+
+
+class AdaptiveRateLimiter:
+    """Per-host token bucket with AIMD rate adaptation.
+
+    Each host gets a bucket of ``burst`` tokens refilled at its current rate,
+    so short bursts go out back to back and the long-run pace is the rate.
+    ``acquire`` reserves a token under a short lock and sleeps *outside* it,
+    so waiting on one host never blocks callers of another (or of the same
+    host beyond their own turn); ``acquire_async`` awaits instead of sleeping.
+
+    When ``adaptive``, ``record`` feeds responses back: every
+    ``success_window`` consecutive successes add ``increase`` requests/second
+    (up to ``max_rate``), while a 429/503 multiplies the rate by ``decrease``
+    (down to a floor) and a ``Retry-After`` benches the host for that long.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_HOST_RATE,
+        burst: int = DEFAULT_HOST_BURST,
+        max_rate: float = DEFAULT_MAX_HOST_RATE,
+        min_rate: float = _MIN_HOST_RATE,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        success_window: int = 10,
+        adaptive: bool = True,
+    ) -> None:
+        self._initial_rate = max(rate, min_rate)
+        self._burst = max(1, burst)
+        self._max_rate = max(max_rate, self._initial_rate)
+        self._min_rate = min_rate
+        self._increase = increase
+        self._decrease = decrease
+        self._success_window = max(1, success_window)
+        self._adaptive = adaptive
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to ``url``'s host may be sent."""
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait (without blocking the event loop) until a request to ``url``'s host may be sent."""
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record(self, url: str, status_code: int, retry_after: float | None = None) -> None:
+        """Adapt the host's rate to a response's status and ``Retry-After`` (in seconds)."""
+        if not self._adaptive:
+            return
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(_host(url), now)
+            if status_code in THROTTLE_STATUS or retry_after is not None:
+                bucket.rate = max(self._min_rate, bucket.rate * self._decrease)
+                bucket.streak = 0
+                if retry_after:
+                    bucket.tokens = min(bucket.tokens, 0.0)
+                    bucket.refilled = max(bucket.refilled, now + retry_after)
+            elif status_code < 400:
+                bucket.streak += 1
+                if bucket.streak >= self._success_window:
+                    bucket.rate = min(self._max_rate, bucket.rate + self._increase)
+                    bucket.streak = 0
+            else:
+                bucket.streak = 0
+
+    def record_response(self, url: str, response) -> None:
+        """``record`` from a ``requests`` or ``httpx`` response."""
+        self.record(url, response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+
+    def rate(self, url: str) -> float:
+        """Current requests/second allowed for ``url``'s host."""
+        with self._lock:
+            bucket = self._buckets.get(_host(url))
+            return bucket.rate if bucket else self._initial_rate
+
+    def _bucket(self, host: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self._initial_rate, float(self._burst), now)
+        return bucket
+
+    def _reserve(self, url: str) -> float:
+        """Take a token for ``url``'s host (possibly on credit); return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(_host(url), now)
+            if now > bucket.refilled:
+                bucket.tokens = min(self._burst, bucket.tokens + (now - bucket.refilled) * bucket.rate)
+                bucket.refilled = now
+            bucket.tokens -= 1
+            delay = bucket.refilled - now
+            if bucket.tokens < 0:
+                delay += -bucket.tokens / bucket.rate
+            return max(0.0, delay)
+
+
+class HostRateLimiter(AdaptiveRateLimiter):
+    """Fixed per-host minimum interval between requests, across threads.
 
-    Not a token bucket - just enforces a minimum gap between requests to the
-    same host across threads. Suitable for scraping Google/Bing where short
-    bursts cause CAPTCHAs.
+    A non-adaptive, burst-of-one ``AdaptiveRateLimiter``: suitable for
+    scraping Google/Bing where short bursts cause CAPTCHAs. Waiting threads
+    sleep outside the limiter's lock.
     """
 
     def __init__(self, min_interval: float = 0.0) -> None:
         self._min_interval = min_interval
-        self._last: dict[str, float] = defaultdict(lambda: 0.0)
-        self._locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
-        self._dict_lock = threading.Lock()
+        super().__init__(rate=1 / min_interval if min_interval > 0 else 1.0, burst=1, adaptive=False)
 
     def wait(self, url: str) -> None:
         """Block until enough time has passed since the last call for this host."""
-        if self._min_interval <= 0:
-            return
-        host = urlparse(url).netloc or url
+        if self._min_interval > 0:
+            self.acquire(url)
+
+
+def _host(url: str) -> str:
+    return urlparse(url).netloc or url
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Process-wide adaptive limiter shared by link checks, sitemap crawls and content fetches."""
+    from seo_bhishma.core._config import get_settings
+
+    settings = get_settings()
+    return AdaptiveRateLimiter(
+        rate=settings.http_host_rate, burst=settings.http_host_burst, max_rate=settings.http_host_max_rate
+    )
+
+
+def reset_rate_limiter() -> None:
+    """Forget all per-host rates (testing helper)."""
+    get_rate_limiter.cache_clear()
+
+
+class HostConcurrencyLimiter:
+    """Per-host cap on the number of in-flight requests across threads.
+
+    Complements ``HostRateLimiter``: that one spaces requests out in time,
+    this one bounds how many run against the same host at once, so a wide
+    worker pool stays polite to any single origin.
+    """
+
+    def __init__(self, max_per_host: int = 4) -> None:
+        self._max_per_host = max(1, max_per_host)
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._dict_lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Hold one of the host's slots for the duration of the ``with`` block."""
+        host = _host(url)
         with self._dict_lock:
-            lock = self._locks[host]
-        with lock:
-            now = time.monotonic()
-            elapsed = now - self._last[host]
-            if elapsed < self._min_interval:
-                time.sleep(self._min_interval - elapsed)
-            self._last[host] = time.monotonic()
+            sem = self._slots.get(host)
+            if sem is None:
+                sem = self._slots[host] = threading.BoundedSemaphore(self._max_per_host)
+        with sem:
+            yield
+
+
+# ---------------------------------------------------------------------------
+# Conditional-GET cache
+# ---------------------------------------------------------------------------
+
+# Response headers worth replaying from cache. ``Content-Encoding`` is
+# deliberately absent: bodies are stored already decoded.
+_CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+_CACHE_CHUNK_SIZE = 64 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return the platform cache directory for seo-bhishma.
+
+    ``$SEO_BHISHMA_HOME/cache`` when set, else ``%LOCALAPPDATA%/seo-bhishma/cache``
+    on Windows or ``$XDG_CACHE_HOME/seo-bhishma`` (``~/.cache/...``) on POSIX.
+    """
+    override = os.environ.get("SEO_BHISHMA_HOME")
+    if override:
+        return Path(override) / "cache"
+    if sys.platform.startswith("win"):
+        base = Path(os.environ.get("LOCALAPPDATA") or (Path.home() / "AppData" / "Local"))
+        return base / "seo-bhishma" / "cache"
+    base = Path(os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache"))
+    return base / "seo-bhishma"
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+class HttpCache:
+    """On-disk HTTP cache driven by ``ETag`` / ``Last-Modified`` validators.
+
+    Each cached URL is a decoded body file plus a small JSON metadata file.
+    Requests for a cached URL are sent with ``If-None-Match`` /
+    ``If-Modified-Since``; a ``304`` is answered from disk. Responses are
+    only stored when they carry a validator. Total body size is capped at
+    ``max_bytes`` with least-recently-used eviction (recency is the body
+    file's mtime, bumped on every hit). The total is kept in memory after
+    one initial scan, so the directory is only walked when the cap is
+    exceeded.
+
+    Responses from ``get()`` are ordinary ``requests.Response`` objects with
+    an extra ``from_cache`` attribute that is True when the server answered
+    ``304 Not Modified``. As with ``requests``, the body is read up front
+    (and the cache file closed) unless ``stream=True``; then ``raw``
+    streams from the cache file and the caller must close the response.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self._dir = Path(directory)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None  # Sum of body sizes; None until first scanned
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self._dir / f"{key}.body", self._dir / f"{key}.json"
+
+    def _load(self, url: str) -> tuple[dict, IO[bytes]] | None:
+        """Return (metadata, open body handle) for ``url``, or None on a miss.
+
+        The body is opened up front so a concurrent eviction cannot pull it
+        out from under a ``304`` replay.
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("url") != url:
+                return None
+            return meta, open(body_path, "rb")
+        except (OSError, ValueError):
+            return None
+
+    def get(self, url: str, session: requests.Session | None = None, **kwargs) -> requests.Response:
+        """Conditionally GET ``url`` through ``session``, serving ``304``s from disk."""
+        stream = kwargs.pop("stream", False)
+        response = self._fetch(url, session or get_session(), **kwargs)
+        if not stream:
+            response.content  # Buffer the body so the cache file or connection is released
+            response.close()
+            response.raw.close()  # close() leaves a fully read raw open
+        return response
+
+    def _fetch(self, url: str, session: requests.Session, **kwargs) -> requests.Response:
+        """Streamed conditional GET; the returned response holds the cache file or connection open."""
+        headers = dict(kwargs.pop("headers", None) or {})
+
+        cached = self._load(url)
+        if cached:
+            meta, _ = cached
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = session.get(url, headers=headers, stream=True, **kwargs)
+            if response.status_code == 304 and cached:
+                response.close()
+                meta, body = cached
+                cached = None
+                self._touch(url)
+                return self._replay(meta, body, from_cache=True)
+        finally:
+            if cached:
+                cached[1].close()
+
+        if response.status_code == 200 and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            try:
+                meta = self._store(url, response)
+            finally:
+                response.close()
+            body_path, _ = self._paths(url)
+            return self._replay(meta, open(body_path, "rb"), from_cache=False)
+
+        response.from_cache = False
+        return response
+
+    def _store(self, url: str, response: requests.Response) -> dict:
+        """Write ``response``'s (decoded) body and validators to disk, then evict."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        tmp_path = body_path.with_suffix(f".tmp{threading.get_ident()}")
+        meta = {
+            "url": url,
+            "final_url": response.url or url,
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "headers": {h: response.headers[h] for h in _CACHED_HEADERS if h in response.headers},
+        }
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_CACHE_CHUNK_SIZE):
+                    f.write(chunk)
+            size = tmp_path.stat().st_size
+            with self._lock:
+                total = self._size_on_disk() - _file_size(body_path) + size
+                os.replace(tmp_path, body_path)
+                meta_path.write_text(json.dumps(meta), encoding="utf-8")
+                self._total_bytes = total
+                if total > self._max_bytes:
+                    self._evict()
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return meta
+
+    def _touch(self, url: str) -> None:
+        body_path, _ = self._paths(url)
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """``(mtime, size, body path)`` of every cached body."""
+        entries = []
+        for body_path in self._dir.glob("*.body"):
+            try:
+                st = body_path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, body_path))
+        return entries
+
+    def _size_on_disk(self) -> int:
+        """Total body size, scanning the directory only the first time. Caller holds the lock."""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the cache fits in ``max_bytes``. Caller holds the lock."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, body_path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            try:
+                body_path.unlink()
+                body_path.with_suffix(".json").unlink(missing_ok=True)
+            except OSError:
+                continue
+            total -= size
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            for path in self._dir.glob("*.body"):
+                path.unlink(missing_ok=True)
+            for path in self._dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    @staticmethod
+    def _replay(meta: dict, body: IO[bytes], from_cache: bool) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = meta.get("final_url") or meta["url"]
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = body
+        response.from_cache = from_cache
+        return response
+
+
+@lru_cache(maxsize=1)
+def get_http_cache() -> HttpCache:
+    """Return the process-wide ``HttpCache`` configured from ``Settings``."""
+    from seo_bhishma.core._config import get_settings
+
+    settings = get_settings()
+    directory = Path(settings.http_cache_dir) if settings.http_cache_dir else default_cache_dir() / "http"
+    return HttpCache(directory, max_bytes=settings.http_cache_max_mb * 1024 * 1024)
+
+
+def reset_http_cache() -> None:
+    """Clear the cached ``HttpCache`` instance (testing helper)."""
+    get_http_cache.cache_clear()
+
+
+def cached_get(
+    url: str,
+    session: requests.Session | None = None,
+    use_cache: bool = True,
+    **kwargs,
+) -> requests.Response:
+    """GET ``url`` through the conditional-GET cache, or straight through when ``use_cache`` is False."""
+    session = session or get_session()
+    if not use_cache:
+        return session.get(url, **kwargs)
+    return get_http_cache().get(url, session=session, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Streaming HTML fetches
+# ---------------------------------------------------------------------------
+
+_HTML_CHUNK_SIZE = 16 * 1024
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# Called with the body read so far after every chunk; returning True stops the download
+StopCondition = Callable[[bytearray], bool]
+
+
+@dataclass
+class HtmlBody:
+    """Status, headers and the (possibly partial) body read by ``fetch_html``.
+
+    ``skipped`` means the Content-Type was not HTML and no body was read,
+    ``truncated`` that reading stopped at the size cap, and ``stopped``
+    that the caller's stop condition ended it early.
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes = b""
+    skipped: bool = False
+    truncated: bool = False
+    stopped: bool = False
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the declared charset, UTF-8 when none (or an unknown one) is given."""
+        match = _CHARSET_RE.search(self.headers.get("Content-Type", ""))
+        encoding = match.group(1) if match else "utf-8"
+        try:
+            return self.content.decode(encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+def _max_html_bytes(max_bytes: int | None) -> int:
+    if max_bytes is not None:
+        return max_bytes
+    from seo_bhishma.core._config import get_settings
+
+    return max(1, get_settings().http_max_html_kb) * 1024
+
+
+def _start_html_body(response) -> HtmlBody:
+    page = HtmlBody(status_code=response.status_code, headers=response.headers)
+    # A missing Content-Type is read as HTML rather than guessed at
+    page.skipped = bool(page.content_type) and page.content_type not in _HTML_CONTENT_TYPES
+    return page
+
+
+def _add_chunk(
+    page: HtmlBody,
+    buffer: bytearray,
+    chunk: bytes,
+    max_bytes: int,
+    stop_when: StopCondition | None,
+) -> bool:
+    """Append ``chunk`` to ``buffer``; True once no more of the body should be read."""
+    room = max_bytes - len(buffer)
+    if len(chunk) > room:
+        buffer += chunk[:room]
+        page.truncated = True
+        return True
+    buffer += chunk
+    if stop_when is not None and stop_when(buffer):
+        page.stopped = True
+        return True
+    return False
+
+
+def fetch_html(
+    url: str,
+    session: requests.Session | None = None,
+    max_bytes: int | None = None,
+    stop_when: StopCondition | None = None,
+    **kwargs,
+) -> HtmlBody:
+    """GET ``url`` and stream at most ``max_bytes`` of its HTML body.
+
+    The Content-Type is checked as soon as the headers arrive, and a
+    non-HTML response (PDF, image, archive...) is closed without reading
+    its body. Otherwise the body is read in chunks until it ends, the cap
+    is reached, or ``stop_when`` returns True; the rest is never
+    downloaded. The cap applies to the decompressed body.
+
+    Args:
+        url: Page to fetch.
+        session: Session to use; defaults to ``get_session()``.
+        max_bytes: Body size cap; defaults to ``Settings.http_max_html_kb``.
+        stop_when: Optional early-abort check, called on the bytes read so far.
+        **kwargs: Passed to ``session.get`` (timeout defaults to ``DEFAULT_TIMEOUT``).
+
+    Returns:
+        HtmlBody with the status, headers and whatever part of the body was read.
+    """
+    session = session or get_session()
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    limit = _max_html_bytes(max_bytes)
+    response = session.get(url, stream=True, **kwargs)
+    try:
+        page = _start_html_body(response)
+        if page.skipped:
+            return page
+        buffer = bytearray()
+        for chunk in response.iter_content(_HTML_CHUNK_SIZE):
+            if _add_chunk(page, buffer, chunk, limit, stop_when):
+                break
+        page.content = bytes(buffer)
+        return page
+    finally:
+        response.close()
+
+
+async def fetch_html_async(
+    url: str,
+    client: AsyncRetryClient | None = None,
+    max_bytes: int | None = None,
+    stop_when: StopCondition | None = None,
+    **kwargs,
+) -> HtmlBody:
+    """Async ``fetch_html`` on an ``AsyncRetryClient`` (a temporary one when None)."""
+    limit = _max_html_bytes(max_bytes)
+    async with async_client_scope(client) as http:
+        response = await http.get(url, stream=True, **kwargs)
+        try:
+            page = _start_html_body(response)
+            if page.skipped:
+                return page
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes(_HTML_CHUNK_SIZE):
+                if _add_chunk(page, buffer, chunk, limit, stop_when):
+                    break
+            page.content = bytes(buffer)
+            return page
+        finally:
+            await response.aclose()
@@ -7,10 +7,16 @@ import socket
 import ssl
 from urllib.parse import urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
-from seo_bhishma.core._http import DEFAULT_TIMEOUT, generate_headers, requests_retry_session
+from seo_bhishma.core._http import (
+    DEFAULT_TIMEOUT,
+    AsyncRetryClient,
+    async_client_scope,
+    cached_get,
+    generate_headers,
+    get_session,
+)
 from seo_bhishma.core._utils import extract_domain
 from seo_bhishma.models.domain_insight import (
     DnsRecords,
@@ -168,7 +174,7 @@ def get_ip_details(ip: str) -> IpDetails:
         logger.error("Error retrieving ASN details: %s", e)
 
     try:
-        response = requests.get(f"https://ipinfo.io/{ip}/json", timeout=10)
+        response = get_session().get(f"https://ipinfo.io/{ip}/json", timeout=10)
         if response.status_code == 200:
             data = response.json()
             details.hostname = data.get("hostname", "")
@@ -282,6 +288,32 @@ def get_ssl_certificate(domain: str, port: int = 443, timeout: int = 10) -> SslC
         return SslCertificateInfo(domain=domain, error=str(e))
 
 
+def _grade_security_headers(domain: str, url: str, status_code: int, headers) -> SecurityHeadersResult:
+    """Grade a response's security headers. Grade scale: A (>=6 of 7), B (5), C (4), D (2-3), F (<=1)."""
+    headers_ci = {k.lower(): v for k, v in headers.items()}
+    present = {h: headers_ci[h] for h in SECURITY_HEADERS if h in headers_ci}
+    missing = [h for h in SECURITY_HEADERS if h not in headers_ci]
+    n = len(present)
+    if n >= 6:
+        grade = "A"
+    elif n == 5:
+        grade = "B"
+    elif n == 4:
+        grade = "C"
+    elif n >= 2:
+        grade = "D"
+    else:
+        grade = "F"
+    return SecurityHeadersResult(
+        domain=domain,
+        url=url,
+        status_code=status_code,
+        headers=present,
+        grade=grade,
+        missing=missing,
+    )
+
+
 def get_security_headers(domain: str) -> SecurityHeadersResult:
     """Fetch and grade HTTP security response headers for a domain.
 
@@ -289,58 +321,60 @@ def get_security_headers(domain: str) -> SecurityHeadersResult:
     """
     url = f"https://{domain}"
     try:
-        session = requests_retry_session()
+        session = get_session()
         r = session.get(url, headers=generate_headers(), timeout=DEFAULT_TIMEOUT, allow_redirects=True)
-        headers_ci = {k.lower(): v for k, v in r.headers.items()}
-        present = {h: headers_ci[h] for h in SECURITY_HEADERS if h in headers_ci}
-        missing = [h for h in SECURITY_HEADERS if h not in headers_ci]
-        n = len(present)
-        if n >= 6:
-            grade = "A"
-        elif n == 5:
-            grade = "B"
-        elif n == 4:
-            grade = "C"
-        elif n >= 2:
-            grade = "D"
-        else:
-            grade = "F"
-        return SecurityHeadersResult(
-            domain=domain,
-            url=r.url,
-            status_code=r.status_code,
-            headers=present,
-            grade=grade,
-            missing=missing,
-        )
+        return _grade_security_headers(domain, r.url, r.status_code, r.headers)
     except Exception as e:
         logger.error("Error fetching security headers for %s: %s", domain, e)
         return SecurityHeadersResult(domain=domain, url=url, error=str(e), missing=list(SECURITY_HEADERS), grade="F")
 
 
-def fetch_robots_txt(domain: str) -> RobotsTxtResult | None:
-    """Fetch and parse robots.txt for a domain using HTTP requests.
-
-    Tries multiple URL variations (https/http, with/without www).
+async def get_security_headers_async(domain: str, client: AsyncRetryClient | None = None) -> SecurityHeadersResult:
+    """Async ``get_security_headers`` on the async transport.
 
     Args:
         domain: Domain name.
+        client: Client to share across calls; a temporary one is used when None.
 
     Returns:
-        RobotsTxtResult, or None if not found.
+        SecurityHeadersResult with the headers present, missing ones and a grade.
     """
-    urls = [
+    url = f"https://{domain}"
+    try:
+        async with async_client_scope(client) as http:
+            r = await http.get(url, headers=generate_headers())
+        return _grade_security_headers(domain, str(r.url), r.status_code, r.headers)
+    except Exception as e:
+        logger.error("Error fetching security headers for %s: %s", domain, e)
+        return SecurityHeadersResult(domain=domain, url=url, error=str(e), missing=list(SECURITY_HEADERS), grade="F")
+
+
+def _robots_txt_urls(domain: str) -> list[str]:
+    return [
         f"https://{domain}/robots.txt",
         f"http://{domain}/robots.txt",
         f"https://www.{domain}/robots.txt",
         f"http://www.{domain}/robots.txt",
     ]
 
+
+def fetch_robots_txt(domain: str, use_cache: bool = True) -> RobotsTxtResult | None:
+    """Fetch and parse robots.txt for a domain using HTTP requests.
+
+    Tries multiple URL variations (https/http, with/without www).
+
+    Args:
+        domain: Domain name.
+        use_cache: Revalidate against the on-disk HTTP cache (see ``HttpCache``).
+
+    Returns:
+        RobotsTxtResult, or None if not found.
+    """
     headers = generate_headers()
 
-    for url in urls:
+    for url in _robots_txt_urls(domain):
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = cached_get(url, use_cache=use_cache, headers=headers, timeout=10)
             if response.status_code == 200 and response.text.strip():
                 content = response.text
                 disallows, sitemaps = parse_robots_txt(content)
@@ -355,6 +389,29 @@ def fetch_robots_txt(domain: str) -> RobotsTxtResult | None:
     return None
 
 
+async def fetch_robots_txt_async(domain: str, client: AsyncRetryClient | None = None) -> RobotsTxtResult | None:
+    """Async ``fetch_robots_txt`` on the async transport (no on-disk HTTP cache).
+
+    Args:
+        domain: Domain name.
+        client: Client to share across calls; a temporary one is used when None.
+
+    Returns:
+        RobotsTxtResult, or None if not found.
+    """
+    headers = generate_headers()
+    async with async_client_scope(client) as http:
+        for url in _robots_txt_urls(domain):
+            try:
+                response = await http.get(url, headers=headers, timeout=10)
+                if response.status_code == 200 and response.text.strip():
+                    disallows, sitemaps = parse_robots_txt(response.text)
+                    return RobotsTxtResult(raw_content=response.text, disallow_rules=disallows, sitemaps=sitemaps)
+            except Exception as e:
+                logger.debug("Error fetching robots.txt from %s: %s", url, e)
+    return None
+
+
 async def fetch_robots_txt_playwright(domain: str) -> RobotsTxtResult | None:
     """Fetch robots.txt using Playwright (for JS-rendered or protected sites).
 
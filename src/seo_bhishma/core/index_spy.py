@@ -1,14 +1,39 @@
 """Core bulk indexing status checker. No CLI dependencies."""
 
+from __future__ import annotations
+
 import asyncio
+import html
 import logging
+import queue
+import random
+import re
+import sqlite3
+import threading
 import time
+import uuid
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
 from itertools import cycle
+from pathlib import Path
+from typing import Literal
+from urllib.parse import parse_qs, quote, urlsplit
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
-
-from seo_bhishma.core._http import generate_headers
+from lxml import etree
+
+from seo_bhishma.core._captcha import get_captcha_solver
+from seo_bhishma.core._http import (
+    HostRateLimiter,
+    default_cache_dir,
+    generate_headers,
+    parse_retry_after,
+    requests_retry_session,
+)
 from seo_bhishma.models.common import ProgressCallback
 from seo_bhishma.models.index_spy import (
     BatchIndexCheckResult,
@@ -17,28 +42,214 @@ from seo_bhishma.models.index_spy import (
     CheckMethod,
     IndexCheckResult,
     ProxyConfig,
+    ProxyHealth,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LANES = 8
+DEFAULT_VALIDATION_WORKERS = 20
+# Grouped mode: smallest group worth a prefix query, and result pages (of 100) per prefix
+DEFAULT_MIN_GROUP_SIZE = 5
+DEFAULT_PREFIX_PAGES = 5
+# Cooldown after a 429 / CAPTCHA: base seconds, doubled per consecutive strike up to the cap
+COOLDOWN_BASE = 30.0
+COOLDOWN_MAX = 900.0
+# Proxy scoring: assumed latency before a proxy has succeeded, how long a
+# failure keeps halving the score, and the floor that keeps every proxy in play
+_UNKNOWN_LATENCY = 2.0
+_RECENT_FAILURE_WINDOW = 600
+_MIN_PROXY_SCORE = 0.01
+# How often an idle lane re-checks whether retried URLs may still arrive
+_LANE_POLL_INTERVAL = 0.2
+
 
 # ---------------------------------------------------------------------------
 # Proxy management
 # ---------------------------------------------------------------------------
 
 
+ProxyOutcome = Literal["ok", "captcha", "failure"]
+
+
+class ProxyHealthBoard:
+    """Persistent scoreboard of proxy health, used to rank proxies.
+
+    Records attempts, successes, CAPTCHAs, latency and the time of the last
+    failure per proxy. Every update is written through to SQLite, so scores
+    carry over between runs. Safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS proxy_health (
+                proxy TEXT PRIMARY KEY, attempts INTEGER NOT NULL, successes INTEGER NOT NULL,
+                captchas INTEGER NOT NULL, latency_total REAL NOT NULL, last_failure REAL
+            );
+            """
+        )
+        self._rows: dict[str, list] = {
+            row[0]: list(row[1:]) for row in self._conn.execute("SELECT * FROM proxy_health")
+        }
+
+    def record(self, proxy: str, outcome: ProxyOutcome, latency: float | None = None) -> None:
+        """Add one request outcome for ``proxy``; ``latency`` counts only on success."""
+        with self._lock:
+            row = self._rows.setdefault(proxy, [0, 0, 0, 0.0, None])
+            row[0] += 1
+            if outcome == "ok":
+                row[1] += 1
+                row[3] += latency or 0.0
+            else:
+                row[4] = time.time()
+                if outcome == "captcha":
+                    row[2] += 1
+            self._conn.execute("INSERT OR REPLACE INTO proxy_health VALUES (?, ?, ?, ?, ?, ?)", (proxy, *row))
+
+    def health(self, proxy: str) -> ProxyHealth:
+        """Current health record of ``proxy`` (empty if never used)."""
+        with self._lock:
+            attempts, successes, captchas, latency_total, last_failure = self._rows.get(proxy, [0, 0, 0, 0.0, None])
+        return ProxyHealth(
+            proxy=proxy,
+            attempts=attempts,
+            successes=successes,
+            captchas=captchas,
+            avg_latency=latency_total / successes if successes else None,
+            last_failure=last_failure,
+            score=self.score(proxy),
+        )
+
+    def score(self, proxy: str) -> float:
+        """Health score in (0, 1]; higher is better.
+
+        Smoothed success rate, discounted by CAPTCHA rate and average latency,
+        and halved while the last failure is recent. Unused proxies start at
+        a middling score so they still get tried.
+        """
+        with self._lock:
+            attempts, successes, captchas, latency_total, last_failure = self._rows.get(proxy, [0, 0, 0, 0.0, None])
+        success_rate = (successes + 1) / (attempts + 2)
+        captcha_rate = captchas / attempts if attempts else 0.0
+        avg_latency = latency_total / successes if successes else _UNKNOWN_LATENCY
+        score = success_rate * (1 - captcha_rate) / (1 + avg_latency)
+        if last_failure is not None and time.time() - last_failure < _RECENT_FAILURE_WINDOW:
+            score /= 2
+        return max(score, _MIN_PROXY_SCORE)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_proxy_health_board() -> ProxyHealthBoard:
+    """Return the process-wide scoreboard configured from ``Settings``."""
+    from seo_bhishma.core._config import get_settings
+
+    path = get_settings().proxy_health_db
+    return ProxyHealthBoard(path or default_cache_dir() / "proxy_health.db")
+
+
+def reset_proxy_health_board() -> None:
+    """Close and forget the process-wide scoreboard (testing helper)."""
+    if get_proxy_health_board.cache_info().currsize:
+        get_proxy_health_board().close()
+    get_proxy_health_board.cache_clear()
+
+
+class ProxyCooldowns:
+    """Per-proxy cooldown timers with exponential backoff.
+
+    A 429 or CAPTCHA benches a proxy for ``base * 2 ** (strikes - 1)``
+    seconds (capped at ``maximum``), or for the server's ``Retry-After``
+    when it sends one. A success resets the strikes. Nothing here sleeps:
+    callers skip benched proxies and use others in the meantime.
+    """
+
+    def __init__(self, base: float = COOLDOWN_BASE, maximum: float = COOLDOWN_MAX) -> None:
+        self._base = base
+        self._max = maximum
+        self._until: dict[str, float] = {}
+        self._strikes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def penalize(self, proxy: str, retry_after: float | None = None) -> float:
+        """Bench ``proxy`` and return the cooldown length in seconds."""
+        with self._lock:
+            strikes = self._strikes.get(proxy, 0) + 1
+            self._strikes[proxy] = strikes
+            delay = retry_after if retry_after is not None else min(self._base * 2 ** (strikes - 1), self._max)
+            self._until[proxy] = max(self._until.get(proxy, 0.0), time.monotonic() + delay)
+        return delay
+
+    def clear(self, proxy: str) -> None:
+        """Forget ``proxy``'s strikes after a success."""
+        with self._lock:
+            self._strikes.pop(proxy, None)
+
+    def remaining(self, proxy: str) -> float:
+        """Seconds until ``proxy`` may be used again (0 when it is not benched)."""
+        with self._lock:
+            return max(0.0, self._until.get(proxy, 0.0) - time.monotonic())
+
+
 class ProxyRotator:
-    """Manages a rotating pool of proxies with validation."""
+    """Manages a rotating pool of proxies with validation.
+
+    Without a health board proxies rotate round-robin. With one, rotation
+    is weighted by each proxy's health score and validation results are
+    recorded on the board. Proxies on cooldown are skipped by ``next()``
+    while any other proxy is available.
+    """
 
-    def __init__(self, proxies: list[str], mode: list[str] | None = None):
+    def __init__(
+        self,
+        proxies: list[str],
+        mode: list[str] | None = None,
+        health: ProxyHealthBoard | None = None,
+    ):
         self._proxies = proxies
         self._mode = mode or ["http", "https"]
         self._cycle = cycle(proxies)
         self._current: dict | None = None
+        self._health = health
+        self.cooldowns = ProxyCooldowns()
 
     def next(self) -> str:
         """Get the next proxy from the pool."""
-        return next(self._cycle)
+        ready = [p for p in self._proxies if not self.cooldowns.remaining(p)] or self._proxies
+        if self._health is None:
+            proxy = next(self._cycle)
+            for _ in range(len(self._proxies) - 1):
+                if proxy in ready:
+                    break
+                proxy = next(self._cycle)
+            return proxy
+        return random.choices(ready, weights=[self._health.score(p) for p in ready])[0]
+
+    def ranked(self) -> list[str]:
+        """Every proxy once, in the order they should be tried.
+
+        Round-robin order without a health board; otherwise a random order
+        weighted by score, so healthy proxies come first but none starve.
+        """
+        if self._health is None:
+            return [next(self._cycle) for _ in self._proxies]
+        # Weighted shuffle: sort by u ** (1 / weight) (Efraimidis-Spirakis)
+        return sorted(self._proxies, key=lambda p: random.random() ** (1 / self._health.score(p)), reverse=True)
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    @property
+    def health(self) -> ProxyHealthBoard | None:
+        return self._health
 
     @property
     def mode(self) -> list[str]:
@@ -62,22 +273,39 @@ class ProxyRotator:
         Returns:
             Proxy dict if valid, None otherwise.
         """
+        return self._validate_requests(proxy, url, render=True)
+
+    def validate_http(self, proxy: str, url: str = "https://www.google.com/") -> dict | None:
+        """Validate a proxy with a plain HTTP request (no JS rendering).
+
+        Args:
+            proxy: Proxy address (host:port).
+            url: URL to test against.
+
+        Returns:
+            Proxy dict if valid, None otherwise.
+        """
+        return self._validate_requests(proxy, url, render=False)
+
+    def _validate_requests(self, proxy: str, url: str, render: bool) -> dict | None:
         from requests_html import HTMLSession
 
         headers = generate_headers()
 
         for protocol in self._mode:
             proxies = {protocol: f"{protocol}://{proxy}"}
-            session = HTMLSession()
+            session = HTMLSession() if render else requests.Session()
             try:
                 response = session.get(url, headers=headers, proxies=proxies, timeout=10)
-                response.html.render(timeout=20)
+                if render:
+                    response.html.render(timeout=20)
                 if response.status_code == 200 and "captcha" not in response.text.lower():
                     logger.info("Valid proxy: %s", proxy)
                     return proxies
                 elif response.status_code == 429:
-                    logger.warning("Proxy %s returned 429. Applying delay.", proxy)
-                    time.sleep(60)
+                    delay = self.cooldowns.penalize(proxy, parse_retry_after(response.headers.get("Retry-After")))
+                    logger.warning("Proxy %s returned 429; cooling down for %.0fs.", proxy, delay)
+                    return None
             except requests.RequestException as e:
                 logger.debug("Proxy %s failed: %s", proxy, e)
             finally:
@@ -132,23 +360,86 @@ class ProxyRotator:
 
         return None
 
-    def find_valid(self, method: CheckMethod, max_attempts: int = 0) -> dict | None:
-        """Find a valid proxy by cycling through the pool.
+    def validate(self, proxy: str, method: CheckMethod) -> dict | None:
+        """Validate ``proxy`` with the stack matching ``method`` and record the outcome.
+
+        Any error raised while validating (e.g. a failed render) counts as
+        an invalid proxy rather than propagating.
+        """
+        start = time.monotonic()
+        try:
+            if method == CheckMethod.HTTP:
+                result = self.validate_http(proxy)
+            elif method == CheckMethod.HTML_SESSION:
+                result = self.validate_htmlsession(proxy)
+            else:
+                result = _run_async(self.validate_playwright(proxy))
+        except Exception as e:
+            logger.debug("Proxy %s validation failed: %s", proxy, e)
+            result = None
+        if self._health is not None:
+            if result:
+                self._health.record(proxy, "ok", time.monotonic() - start)
+            else:
+                self._health.record(proxy, "failure")
+        return result
+
+    def validate_many(
+        self,
+        proxies: list[str] | None = None,
+        method: CheckMethod = CheckMethod.HTTP,
+        max_workers: int = DEFAULT_VALIDATION_WORKERS,
+    ) -> Iterator[tuple[str, dict | None]]:
+        """Validate proxies concurrently, yielding ``(proxy, proxy_dict or None)`` as each finishes.
+
+        Args:
+            proxies: Proxies to validate (default: the whole pool).
+            method: Check method to validate for.
+            max_workers: Max validations in flight.
+
+        Yields:
+            One ``(proxy, result)`` pair per proxy, in completion order.
+            Validations not yet started are cancelled if the caller stops early.
+        """
+        proxies = self._proxies if proxies is None else proxies
+        if not proxies:
+            return
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(proxies))))
+        try:
+            futures = {executor.submit(self._validate_in_worker, proxy, method): proxy for proxy in proxies}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.debug("Proxy %s validation failed: %s", futures[future], e)
+                    result = None
+                yield futures[future], result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _validate_in_worker(self, proxy: str, method: CheckMethod) -> dict | None:
+        with _own_event_loop():
+            return self.validate(proxy, method)
+
+    def find_valid(
+        self,
+        method: CheckMethod,
+        max_attempts: int = 0,
+        max_workers: int = DEFAULT_VALIDATION_WORKERS,
+    ) -> dict | None:
+        """Find a valid proxy, validating candidates concurrently.
 
         Args:
             method: Check method to use for validation.
             max_attempts: Max proxies to try (0 = try all once).
+            max_workers: Max validations in flight.
 
         Returns:
-            Valid proxy dict, or None.
+            The first proxy dict to validate, or None.
         """
-        attempts = max_attempts or len(self._proxies)
-        for _ in range(attempts):
-            proxy = self.next()
-            if method == CheckMethod.HTML_SESSION:
-                result = self.validate_htmlsession(proxy)
-            else:
-                result = _run_async(self.validate_playwright(proxy))
+        candidates = [p for p in self.ranked() if not self.cooldowns.remaining(p)]
+        candidates = candidates[: max_attempts or len(self._proxies)]
+        for _proxy, result in self.validate_many(candidates, method, max_workers):
             if result:
                 self._current = result
                 return result
@@ -189,26 +480,51 @@ def _run_async(coro):
     return result_box.get("value")
 
 
+@contextmanager
+def _own_event_loop() -> Iterator[None]:
+    """Give the calling worker thread its own event loop for the duration.
+
+    ``requests_html`` renders on ``asyncio.get_event_loop()``, which only
+    exists by default on the main thread; lanes and validation workers
+    need one of their own.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        yield
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
 # ---------------------------------------------------------------------------
 # CAPTCHA solving
 # ---------------------------------------------------------------------------
 
 
-def get_site_key(url: str) -> str | None:
+_SITE_KEY_RE = re.compile(rb"""data-sitekey\s*=\s*["']([^"']+)["']""")
+
+
+def _extract_site_key(content: str | bytes) -> str | None:
+    """Pull the reCAPTCHA site key out of an already fetched page."""
+    data = content.encode("utf-8", "replace") if isinstance(content, str) else content
+    match = _SITE_KEY_RE.search(data)
+    return match.group(1).decode("utf-8", "replace") if match else None
+
+
+def get_site_key(url: str, proxies: dict | None = None) -> str | None:
     """Extract reCAPTCHA site key from a page.
 
     Args:
         url: Page URL to scan.
+        proxies: Optional proxy dict; use the one that hit the CAPTCHA.
 
     Returns:
         Site key string, or None if not found.
     """
     try:
-        response = requests.get(url, timeout=10)
-        soup = BeautifulSoup(response.text, "html.parser")
-        tag = soup.find("div", {"class": "g-recaptcha"})
-        if tag and "data-sitekey" in tag.attrs:
-            return tag["data-sitekey"]
+        response = _http_session().get(url, headers=generate_headers(), proxies=proxies, timeout=10)
+        return _extract_site_key(response.content)
     except Exception as e:
         logger.error("Error getting site key: %s", e)
     return None
@@ -225,37 +541,7 @@ def solve_captcha_2captcha(api_key: str, page_url: str, site_key: str) -> str |
     Returns:
         CAPTCHA solution token, or None on failure.
     """
-    try:
-        payload = {
-            "key": api_key,
-            "method": "userrecaptcha",
-            "googlekey": site_key,
-            "pageurl": page_url,
-        }
-        response = requests.post("http://2captcha.com/in.php", data=payload, timeout=30)
-        parts = response.text.split("|")
-        if parts[0] != "OK":
-            logger.error("2Captcha error: %s", response.text)
-            return None
-
-        request_id = parts[1]
-        solution_params = {"key": api_key, "action": "get", "id": request_id}
-
-        for _ in range(60):  # Max 5 minutes
-            time.sleep(5)
-            result = requests.get(
-                "http://2captcha.com/res.php", params=solution_params, timeout=30
-            )
-            result_parts = result.text.split("|")
-            if result_parts[0] == "OK":
-                return result_parts[1]
-            if result_parts[0] != "CAPCHA_NOT_READY":
-                logger.error("2Captcha solve error: %s", result.text)
-                return None
-
-    except Exception as e:
-        logger.error("Error solving captcha via 2Captcha: %s", e)
-    return None
+    return solve_captcha(CaptchaConfig(service="2captcha", api_key=api_key), page_url, site_key)
 
 
 def solve_captcha_anticaptcha(api_key: str, page_url: str, site_key: str) -> str | None:
@@ -269,64 +555,28 @@ def solve_captcha_anticaptcha(api_key: str, page_url: str, site_key: str) -> str
     Returns:
         CAPTCHA solution token, or None on failure.
     """
-    try:
-        task_payload = {
-            "clientKey": api_key,
-            "task": {
-                "type": "NoCaptchaTaskProxyless",
-                "websiteURL": page_url,
-                "websiteKey": site_key,
-            },
-        }
-        response = requests.post(
-            "https://api.anti-captcha.com/createTask", json=task_payload, timeout=30
-        )
-        data = response.json()
-        if data.get("errorId") != 0:
-            logger.error("Anti-Captcha error: %s", data.get("errorDescription"))
-            return None
-
-        task_id = data["taskId"]
-        result_payload = {"clientKey": api_key, "taskId": task_id}
-
-        for _ in range(60):
-            time.sleep(5)
-            result = requests.post(
-                "https://api.anti-captcha.com/getTaskResult",
-                json=result_payload,
-                timeout=30,
-            )
-            result_data = result.json()
-            if result_data["status"] == "ready":
-                return result_data["solution"]["gRecaptchaResponse"]
-            if result_data["status"] != "processing":
-                logger.error("Anti-Captcha solve error: %s", result_data.get("errorDescription"))
-                return None
-
-    except Exception as e:
-        logger.error("Error solving captcha via Anti-Captcha: %s", e)
-    return None
+    return solve_captcha(CaptchaConfig(service="anti-captcha", api_key=api_key), page_url, site_key)
 
 
 def solve_captcha(
-    captcha_config: CaptchaConfig, page_url: str, site_key: str
+    captcha_config: CaptchaConfig | Sequence[CaptchaConfig], page_url: str, site_key: str
 ) -> str | None:
-    """Solve a CAPTCHA using the configured service.
+    """Solve a CAPTCHA using the configured service(s).
+
+    Runs on the shared solver pool (see ``get_captcha_solver``): only the
+    calling thread waits, while other lanes keep checking and every
+    pending solve is polled together on one event loop.
 
     Args:
-        captcha_config: CAPTCHA service configuration.
+        captcha_config: CAPTCHA service configuration, or several to choose
+            between by observed cost and latency.
         page_url: Page URL where CAPTCHA appears.
         site_key: reCAPTCHA site key.
 
     Returns:
         Solution token, or None.
     """
-    if captcha_config.service.lower() == "2captcha":
-        return solve_captcha_2captcha(captcha_config.api_key, page_url, site_key)
-    elif captcha_config.service.lower() == "anti-captcha":
-        return solve_captcha_anticaptcha(captcha_config.api_key, page_url, site_key)
-    logger.error("Unknown captcha service: %s", captcha_config.service)
-    return None
+    return get_captcha_solver().solve(captcha_config, page_url, site_key)
 
 
 # ---------------------------------------------------------------------------
@@ -334,47 +584,190 @@ def solve_captcha(
 # ---------------------------------------------------------------------------
 
 
-def _parse_indexing_html(html_content: str, url: str) -> str:
+# SERP markers, matched on the raw (lowercased) bytes rather than a parse tree
+_CAPTCHA_MARKERS = (b"captcha", b"unusual traffic", b"/sorry/index")
+# "No results" phrases, each keyed by a rare word to find candidates with a
+# plain bytes search before running the regex around it. Words may be split
+# by whitespace, &nbsp; or inline tags.
+_MARKUP_GAP = rb"(?:\s|&nbsp;|&#160;|<[^>]*>)+"
+_NO_RESULTS_PHRASES = tuple(
+    (anchor, re.compile(_MARKUP_GAP.join(re.escape(word) for word in phrase.split())))
+    for anchor, phrase in (
+        (b"documents", b"did not match any documents"),
+        (b"information", b"no information is available"),
+        (b"your", b"your search -"),  # "Your search - <url> - did not match..."
+    )
+)
+_PHRASE_WINDOW = 256
+_ANCHOR_HREF_RE = re.compile(rb"""<a\b[^>]*?\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+# Containers that only exist once Google has rendered a results page
+_RESULTS_CONTAINER_RE = re.compile(rb"""id\s*=\s*["']?(?:search|rso|res|topstuff)["'\s/>]""")
+_RESULT_LINK_PREFIXES = (b"http://", b"https://", b"/url?")
+# Result blocks, as XPath for the class/attribute selectors div.g, div.tF2Cxc,
+# div[data-hveid] and div.MjjYud - Google changes class names frequently
+_RESULT_BLOCK_XPATHS = tuple(
+    f"//div[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]" for cls in ("g", "tF2Cxc")
+) + ("//div[@data-hveid]", "//div[contains(concat(' ', normalize-space(@class), ' '), ' MjjYud ')]")
+
+
+def _classify_serp(html_content: str | bytes, url: str) -> str | None:
+    """Classify a Google ``site:`` results page, or return None if it can't tell.
+
+    Works on the raw bytes with literal searches and precompiled patterns,
+    and stops at the first anchor that links to ``url``. The page is only parsed with lxml when a
+    link to ``url`` lacks an absolute or ``/url?`` href, in which case it
+    counts only as the first link of a result block.
+
+    The result is None only when the page has no CAPTCHA, no "no results"
+    text, no link to ``url`` and no results container, i.e. a shell that
+    needs JavaScript rendering before it says anything.
+    """
+    data = html_content if isinstance(html_content, bytes) else html_content.encode("utf-8", "replace")
+    lower = data.lower()
+    if any(marker in lower for marker in _CAPTCHA_MARKERS):
+        return "Captcha Encountered"
+    if _has_no_results_text(lower):
+        return "Not Indexed"
+
+    needle = url.encode("utf-8")
+    escaped = html.escape(url).encode("utf-8")
+    if needle in data or escaped in data:
+        needs_tree = False
+        for match in _ANCHOR_HREF_RE.finditer(data):
+            href = match.group(1) or match.group(2) or match.group(3)
+            if b"&" in href:
+                href = html.unescape(href.decode("utf-8", "replace")).encode("utf-8")
+            if needle not in href:
+                continue
+            if href.startswith(_RESULT_LINK_PREFIXES):
+                return "Indexed"
+            needs_tree = True
+        if needs_tree and _first_block_link_matches(data, url):
+            return "Indexed"
+
+    if _RESULTS_CONTAINER_RE.search(lower):
+        return "Not Indexed"
+    return None
+
+
+def _has_no_results_text(lower: bytes) -> bool:
+    for anchor, pattern in _NO_RESULTS_PHRASES:
+        pos = lower.find(anchor)
+        while pos != -1:
+            if pattern.search(lower, max(0, pos - _PHRASE_WINDOW), pos + _PHRASE_WINDOW):
+                return True
+            pos = lower.find(anchor, pos + 1)
+    return False
+
+
+def _first_block_link_matches(data: bytes, url: str) -> bool:
+    """True if the first link of any result block references ``url``."""
+    try:
+        doc = lxml.html.document_fromstring(data)
+    except (etree.ParserError, ValueError):
+        return False
+    for xpath in _RESULT_BLOCK_XPATHS:
+        for block in doc.xpath(xpath):
+            links = block.xpath(".//a[@href]")
+            if links and url in links[0].get("href"):
+                return True
+    return False
+
+
+def _parse_indexing_html(html_content: str | bytes, url: str) -> str:
     """Parse Google search results HTML to determine indexing status.
 
     Args:
-        html_content: HTML page content.
+        html_content: HTML page content, as text or raw bytes.
         url: URL being checked.
 
     Returns:
         "Indexed", "Not Indexed", or "Captcha Encountered".
     """
-    lower = html_content.lower()
-    if "captcha" in lower or "unusual traffic" in lower or "/sorry/index" in lower:
-        return "Captcha Encountered"
+    return _classify_serp(html_content, url) or "Not Indexed"
 
-    soup = BeautifulSoup(html_content, "html.parser")
 
-    # Multiple Google "no results" indicators (DOM changes over time)
-    no_results_markers = [
-        "did not match any documents",
-        "no information is available",
-        "your search -",  # "Your search - <url> - did not match..."
-    ]
-    page_text = soup.get_text(" ", strip=True).lower()
-    if any(marker in page_text for marker in no_results_markers):
-        return "Not Indexed"
+_http_local = threading.local()
 
-    # Multiple selector fallbacks - Google changes class names frequently
-    selectors = ["div.g", "div.tF2Cxc", "div[data-hveid]", "div.MjjYud"]
-    for selector in selectors:
-        for result in soup.select(selector):
-            link = result.find("a", href=True)
-            if link and url in link["href"]:
-                return "Indexed"
 
-    # Final fallback: any anchor whose href references the URL
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if url in href and href.startswith(("http://", "https://", "/url?")):
-            return "Indexed"
+def _take_retry_after() -> float | None:
+    """Pop the ``Retry-After`` hint left by this thread's last throttled HTTP check."""
+    hint = getattr(_http_local, "retry_after", None)
+    _http_local.retry_after = None
+    return hint
 
-    return "Not Indexed"
+
+def _http_session() -> requests.Session:
+    """Per-thread pooled session for HTTP index checks (one per batch lane).
+
+    429 is left out of the retried statuses: from Google it is the CAPTCHA
+    wall, which the caller handles.
+    """
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        session = _http_local.session = requests_retry_session(status_forcelist=(500, 502, 503, 504))
+    return session
+
+
+def check_indexing_http(
+    url: str,
+    proxies: dict | None = None,
+    captcha_config: CaptchaConfig | None = None,
+    rate_limit: float = 0,
+    render_fallback: bool = True,
+) -> str:
+    """Check URL indexing status from the raw SERP HTML, without a browser.
+
+    The page is fetched over a pooled session and classified with lxml.
+    Only when the raw HTML is ambiguous (see ``_classify_serp``) does the
+    check fall back to a rendered ``check_indexing_htmlsession`` call.
+
+    Args:
+        url: URL to check.
+        proxies: Optional proxy dict.
+        captcha_config: Optional CAPTCHA solving configuration.
+        rate_limit: Delay after request.
+        render_fallback: Render ambiguous pages instead of reporting "Not Indexed".
+
+    Returns:
+        Status string: "Indexed", "Not Indexed", "Captcha Encountered",
+        "Proxy Error", or "Error: ...".
+    """
+    search_url = f"https://www.google.com/search?q=site:{url}"
+    headers = generate_headers()
+    session = _http_session()
+
+    try:
+        response = session.get(search_url, headers=headers, proxies=proxies, timeout=10)
+        status = _classify_serp(response.content, url)
+        if response.status_code == 429:
+            # Picked up by the batch lane to size this proxy's cooldown
+            _http_local.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            status = "Captcha Encountered"
+
+        if status == "Captcha Encountered" and captcha_config:
+            # The block page usually carries the site key; only refetch when it doesn't
+            site_key = _extract_site_key(response.content) or get_site_key(search_url, proxies)
+            if site_key:
+                solution = solve_captcha(captcha_config, search_url, site_key)
+                if solution:
+                    headers["g-recaptcha-response"] = solution
+                    response = session.get(search_url, headers=headers, proxies=proxies, timeout=10)
+                    status = _classify_serp(response.content, url)
+    except requests.exceptions.ProxyError as e:
+        logger.warning("Proxy error checking %s: %s", url, e)
+        return "Proxy Error"
+    except requests.RequestException as e:
+        logger.error("Error checking indexing for %s: %s", url, e)
+        return f"Error: {e}"
+    finally:
+        if rate_limit > 0:
+            time.sleep(rate_limit)
+
+    if status is None and render_fallback:
+        logger.debug("Raw SERP for %s is ambiguous; rendering", url)
+        return check_indexing_htmlsession(url, proxies, captcha_config)
+    return status or "Not Indexed"
 
 
 def check_indexing_htmlsession(
@@ -405,7 +798,7 @@ def check_indexing_htmlsession(
         response.html.render(timeout=20)
 
         if "captcha" in response.text.lower() and captcha_config:
-            site_key = get_site_key(search_url)
+            site_key = _extract_site_key(response.text) or get_site_key(search_url, proxies)
             if site_key:
                 solution = solve_captcha(captcha_config, search_url, site_key)
                 if solution:
@@ -426,6 +819,56 @@ def check_indexing_htmlsession(
             time.sleep(rate_limit)
 
 
+_BROWSER_ARGS = ["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage", "--log-level=3"]
+# Containers Google renders for a results page (hits or "no results") and for its CAPTCHA wall
+_RESULTS_SELECTOR = "#search, #res, #topstuff, #botstuff"
+_CAPTCHA_SELECTOR = "#captcha-form, #recaptcha, form[action*='sorry']"
+_SERP_WAIT_MS = 15_000
+_USER_CAPTCHA_WAIT_MS = 600_000
+
+
+def _browser_options(proxy: dict | None, headless: bool) -> dict:
+    options: dict = {"headless": headless, "args": _BROWSER_ARGS}
+    if proxy:
+        options["proxy"] = {"server": proxy.get("http") or proxy.get("https", "")}
+    return options
+
+
+def _playwright_error(url: str, error: Exception) -> str:
+    if "ERR_TUNNEL_CONNECTION_FAILED" in str(error):
+        return "Proxy Error"
+    logger.error("Playwright error checking %s: %s", url, error)
+    return f"Error: {error}"
+
+
+async def _check_on_page(page, url: str, captcha_handling: CaptchaHandling, headless: bool) -> str:
+    """Run one ``site:`` query on an open page and classify the result.
+
+    Waits for the results (or CAPTCHA) container to appear rather than a
+    fixed delay, so a fast SERP is read as soon as it renders.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    await page.goto(f"https://www.google.com/search?q=site:{url}")
+    try:
+        await page.wait_for_selector(f"{_RESULTS_SELECTOR}, {_CAPTCHA_SELECTOR}", timeout=_SERP_WAIT_MS)
+    except PlaywrightTimeoutError:
+        logger.debug("No results container for %s; classifying what loaded", url)
+    content = await page.content()
+
+    if "captcha" in content.lower():
+        if headless or captcha_handling != CaptchaHandling.BY_USER:
+            return "Captcha Encountered"
+        logger.info("CAPTCHA detected. Waiting for user to solve...")
+        try:
+            await page.wait_for_selector(_RESULTS_SELECTOR, timeout=_USER_CAPTCHA_WAIT_MS)
+        except PlaywrightTimeoutError:
+            return "Captcha Encountered"
+        content = await page.content()
+
+    return _parse_indexing_html(content, url)
+
+
 async def check_indexing_playwright(
     url: str,
     proxy: dict | None = None,
@@ -434,6 +877,9 @@ async def check_indexing_playwright(
 ) -> str:
     """Check URL indexing status using Playwright.
 
+    Launches a throwaway browser for this one URL; batch checks go through
+    a ``PlaywrightPool`` instead.
+
     Args:
         url: URL to check.
         proxy: Optional proxy dict.
@@ -446,54 +892,176 @@ async def check_indexing_playwright(
     from playwright.async_api import async_playwright
 
     async with async_playwright() as p:
-        browser_options: dict = {
-            "headless": headless,
-            "args": [
-                "--disable-gpu",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--log-level=3",
-            ],
-        }
+        browser = await p.chromium.launch(**_browser_options(proxy, headless))
+        try:
+            page = await browser.new_page()
+            return await _check_on_page(page, url, captcha_handling, headless)
+        except Exception as e:
+            return _playwright_error(url, e)
+        finally:
+            await browser.close()
 
-        if proxy:
-            server = proxy.get("http") or proxy.get("https", "")
-            browser_options["proxy"] = {"server": server}
 
-        browser = await p.chromium.launch(**browser_options)
-        page = await browser.new_page()
+class PlaywrightPool:
+    """Long-lived Chromium browsers reused across Playwright index checks.
 
-        try:
-            search_url = f"https://www.google.com/search?q=site:{url}"
-            await page.goto(search_url)
-            await page.wait_for_timeout(5000)
+    One browser is launched per proxy (lazily, on first use), with up to
+    ``contexts_per_browser`` contexts each, and kept until ``release`` or
+    ``close``. Every context keeps a single
+    page that is handed back to the pool after a check and reused for the
+    next URL; a page that errors is closed and replaced.
 
-            content = await page.content()
+    All Playwright calls run on the pool's own event-loop thread, so
+    ``check`` can be called from any thread, including batch worker lanes.
+    Use as a context manager or call ``close()`` when done.
+    """
 
-            if "captcha" in content.lower():
-                if not headless and captcha_handling == CaptchaHandling.BY_USER:
-                    logger.info("CAPTCHA detected. Waiting for user to solve...")
-                    for _ in range(120):  # Wait up to 10 minutes
-                        await page.wait_for_timeout(5000)
-                        content = await page.content()
-                        if "captcha" not in content.lower():
-                            break
-                    else:
-                        await browser.close()
-                        return "Captcha Encountered"
-                else:
-                    await browser.close()
-                    return "Captcha Encountered"
+    def __init__(self, headless: bool = False, contexts_per_browser: int = 2) -> None:
+        self._headless = headless
+        self._max_pages = max(1, contexts_per_browser)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="playwright-pool", daemon=True)
+        self._thread.start()
+        self._playwright = None
+        self._launch_lock: asyncio.Lock | None = None
+        self._browsers: dict[str, object] = {}
+        # Idle pages per browser; None marks a freed slot a waiter should refill
+        self._idle: dict[str, asyncio.Queue] = {}
+        self._open: dict[str, int] = {}
+        self._closed = False
+
+    def check(
+        self,
+        url: str,
+        proxy: dict | None = None,
+        captcha_handling: CaptchaHandling = CaptchaHandling.AUTOMATIC,
+    ) -> str:
+        """Check one URL on a pooled page. Blocks until the status is known.
 
-            return _parse_indexing_html(content, url)
+        Args:
+            url: URL to check.
+            proxy: Optional proxy dict; selects which browser is used.
+            captcha_handling: How to handle CAPTCHAs.
+
+        Returns:
+            Status string.
+        """
+        if self._closed:
+            raise RuntimeError("PlaywrightPool is closed")
+        return asyncio.run_coroutine_threadsafe(self._check(url, proxy, captcha_handling), self._loop).result()
+
+    def release(self, proxy: dict | None) -> None:
+        """Close the browser launched for ``proxy``, e.g. once that proxy is quarantined or cooling down.
 
+        Call it only when no check through ``proxy`` is in flight; a later
+        check through the same proxy launches a fresh browser.
+        """
+        if self._closed:
+            return
+        asyncio.run_coroutine_threadsafe(self._release(self._key(proxy)), self._loop).result()
+
+    def close(self) -> None:
+        """Close every browser and stop the pool's event loop."""
+        if self._closed:
+            return
+        self._closed = True
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> PlaywrightPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _key(self, proxy: dict | None) -> str:
+        return _browser_options(proxy, self._headless).get("proxy", {}).get("server") or "direct"
+
+    async def _check(self, url: str, proxy: dict | None, captcha_handling: CaptchaHandling) -> str:
+        key = self._key(proxy)
+        try:
+            page = await self._checkout(key, proxy)
+        except Exception as e:
+            return _playwright_error(url, e)
+
+        healthy = False
+        try:
+            status = await _check_on_page(page, url, captcha_handling, self._headless)
+            healthy = True
+            return status
         except Exception as e:
-            if "ERR_TUNNEL_CONNECTION_FAILED" in str(e):
-                return "Proxy Error"
-            logger.error("Playwright error checking %s: %s", url, e)
-            return f"Error: {e}"
+            return _playwright_error(url, e)
         finally:
-            await browser.close()
+            await self._checkin(key, page, healthy)
+
+    async def _checkout(self, key: str, proxy: dict | None):
+        idle = self._idle.setdefault(key, asyncio.Queue())
+        if idle.empty() and self._open.get(key, 0) < self._max_pages:
+            return await self._new_page(key, proxy)
+        page = await idle.get()
+        return page if page is not None else await self._new_page(key, proxy)
+
+    async def _new_page(self, key: str, proxy: dict | None):
+        self._open[key] = self._open.get(key, 0) + 1
+        try:
+            browser = await self._browser(key, proxy)
+            context = await browser.new_context()
+            return await context.new_page()
+        except Exception:
+            self._open[key] -= 1
+            self._idle[key].put_nowait(None)
+            raise
+
+    async def _browser(self, key: str, proxy: dict | None):
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+            if key not in self._browsers:
+                self._browsers[key] = await self._playwright.chromium.launch(
+                    **_browser_options(proxy, self._headless)
+                )
+            return self._browsers[key]
+
+    async def _checkin(self, key: str, page, healthy: bool) -> None:
+        if healthy:
+            self._idle[key].put_nowait(page)
+            return
+        self._open[key] -= 1
+        try:
+            await page.context.close()
+        except Exception as e:
+            logger.debug("Error closing broken page context: %s", e)
+        self._idle[key].put_nowait(None)
+
+    async def _release(self, key: str) -> None:
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            browser = self._browsers.pop(key, None)
+            self._idle.pop(key, None)
+            self._open.pop(key, None)
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug("Error closing browser: %s", e)
+
+    async def _shutdown(self) -> None:
+        for browser in self._browsers.values():
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug("Error closing browser: %s", e)
+        self._browsers.clear()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
 
 
 def check_indexing_status(
@@ -504,6 +1072,8 @@ def check_indexing_status(
     captcha_handling: CaptchaHandling = CaptchaHandling.AUTOMATIC,
     headless: bool = False,
     rate_limit: float = 0,
+    pool: PlaywrightPool | None = None,
+    use_cache: bool = True,
 ) -> IndexCheckResult:
     """Check indexing status for a single URL.
 
@@ -515,20 +1085,731 @@ def check_indexing_status(
         captcha_handling: How to handle CAPTCHAs (Playwright only).
         headless: Headless mode (Playwright only).
         rate_limit: Delay after check.
+        pool: Optional browser pool for Playwright checks; without one a
+            browser is launched just for this URL.
+        use_cache: Answer from the result cache when a fresh entry exists,
+            and cache a definitive result.
 
     Returns:
         IndexCheckResult.
     """
+    cache = get_index_result_cache() if use_cache else None
+    if cache is not None:
+        hit = cache.get(url)
+        if hit is not None:
+            return hit
+
     proxy_str = str(proxy) if proxy else "No Proxy"
 
-    if method == CheckMethod.HTML_SESSION:
+    if method == CheckMethod.HTTP:
+        status = check_indexing_http(url, proxy, captcha_config, rate_limit)
+    elif method == CheckMethod.HTML_SESSION:
         status = check_indexing_htmlsession(url, proxy, captcha_config, rate_limit)
+    elif pool is not None:
+        status = pool.check(url, proxy, captcha_handling)
     else:
         status = asyncio.run(
             check_indexing_playwright(url, proxy, captcha_handling, headless)
         )
 
-    return IndexCheckResult(url=url, status=status, proxy_used=proxy_str)
+    result = IndexCheckResult(url=url, status=status, proxy_used=proxy_str)
+    if cache is not None:
+        cache.put(result, method)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+# Only answers about the URL itself are worth reusing
+_CACHEABLE_STATUSES = ("Indexed", "Not Indexed")
+
+
+class IndexResultCache:
+    """Persistent ``url -> (status, checked_at, method)`` cache with a TTL.
+
+    Only definitive statuses are stored, so CAPTCHAs and errors are always
+    retried. Safe to share between batch worker lanes.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS results (
+                url TEXT PRIMARY KEY, status TEXT NOT NULL, proxy_used TEXT NOT NULL,
+                method TEXT NOT NULL, checked_at REAL NOT NULL
+            );
+            """
+        )
+        self._conn.execute("DELETE FROM results WHERE checked_at < ?", (time.time() - ttl_seconds,))
+
+    def get(self, url: str) -> IndexCheckResult | None:
+        """Return the cached result for ``url`` if it is younger than the TTL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, proxy_used FROM results WHERE url = ? AND checked_at >= ?",
+                (url, time.time() - self._ttl),
+            ).fetchone()
+        if row is None:
+            return None
+        return IndexCheckResult(url=url, status=row[0], proxy_used=row[1], cached=True)
+
+    def put(self, result: IndexCheckResult, method: CheckMethod) -> None:
+        """Cache ``result`` if its status is definitive."""
+        if result.status not in _CACHEABLE_STATUSES:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (url, status, proxy_used, method, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (result.url, result.status, result.proxy_used, CheckMethod(method).value, time.time()),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_index_result_cache() -> IndexResultCache | None:
+    """Return the process-wide result cache configured from ``Settings``, or None if disabled."""
+    from seo_bhishma.core._config import get_settings
+
+    settings = get_settings()
+    if settings.index_cache_ttl_hours <= 0:
+        return None
+    path = settings.index_cache_db or default_cache_dir() / "index_results.db"
+    return IndexResultCache(path, ttl_seconds=settings.index_cache_ttl_hours * 3600)
+
+
+def reset_index_result_cache() -> None:
+    """Close and forget the process-wide result cache (testing helper)."""
+    if get_index_result_cache.cache_info().currsize:
+        cache = get_index_result_cache()
+        if cache is not None:
+            cache.close()
+    get_index_result_cache.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# Resumable batch jobs
+# ---------------------------------------------------------------------------
+
+
+class IndexJobStore:
+    """SQLite checkpoint of batch indexing jobs, so interrupted runs can resume.
+
+    A job is an ordered list of URLs plus one result row per finished URL.
+    Each result is committed as soon as it lands, so a crash or a CAPTCHA
+    stop loses at most the checks in flight. URLs whose last outcome was a
+    CAPTCHA, a proxy error or a transient ``"Error: ..."`` (timeout, failed
+    render) are not recorded and stay pending.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, created_at TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS job_urls (
+                job_id TEXT NOT NULL, position INTEGER NOT NULL, url TEXT NOT NULL, PRIMARY KEY (job_id, url)
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                job_id TEXT NOT NULL, url TEXT NOT NULL, status TEXT NOT NULL, proxy_used TEXT NOT NULL,
+                checked_at TEXT NOT NULL, PRIMARY KEY (job_id, url)
+            );
+            """
+        )
+
+    def __enter__(self) -> IndexJobStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def has_job(self, job_id: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone() is not None
+
+    def open_job(self, urls: Iterable[str], job_id: str | None = None) -> str:
+        """Create a job (or extend an existing one) with ``urls`` and return its id.
+
+        URLs already in the job keep their place; new ones are appended.
+        """
+        if job_id is None:
+            job_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_id, created_at) VALUES (?, ?)",
+                (job_id, datetime.now().isoformat(timespec="seconds")),
+            )
+            (start,) = self._conn.execute(
+                "SELECT COALESCE(MAX(position) + 1, 0) FROM job_urls WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO job_urls (job_id, position, url) VALUES (?, ?, ?)",
+                ((job_id, start + i, url) for i, url in enumerate(urls)),
+            )
+        return job_id
+
+    def pending_urls(self, job_id: str) -> list[str]:
+        """URLs of ``job_id`` without a recorded result, in job order."""
+        rows = self._conn.execute(
+            """
+            SELECT u.url FROM job_urls u LEFT JOIN results r ON r.job_id = u.job_id AND r.url = u.url
+            WHERE u.job_id = ? AND r.url IS NULL ORDER BY u.position
+            """,
+            (job_id,),
+        )
+        return [url for (url,) in rows]
+
+    def record(self, job_id: str, result: IndexCheckResult) -> None:
+        """Save one finished result and commit it immediately."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (job_id, url, status, proxy_used, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, result.url, result.status, result.proxy_used, datetime.now().isoformat(timespec="seconds")),
+            )
+
+    def results(self, job_id: str) -> list[IndexCheckResult]:
+        """Results recorded so far for ``job_id``, in job order."""
+        rows = self._conn.execute(
+            """
+            SELECT r.url, r.status, r.proxy_used FROM results r
+            JOIN job_urls u ON u.job_id = r.job_id AND u.url = r.url
+            WHERE r.job_id = ? ORDER BY u.position
+            """,
+            (job_id,),
+        )
+        return [IndexCheckResult(url=url, status=status, proxy_used=proxy) for url, status, proxy in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_index_job_store() -> IndexJobStore:
+    """Open the job store configured by ``Settings.index_jobs_db``."""
+    from seo_bhishma.core._config import get_settings
+
+    path = get_settings().index_jobs_db
+    return IndexJobStore(path or default_cache_dir() / "index_jobs.db")
+
+
+def _needs_retry(status: str) -> bool:
+    """Statuses that say more about the proxy than about the URL."""
+    return status.startswith("Captcha") or status == "Proxy Error"
+
+
+def _proxy_outcome(status: str) -> ProxyOutcome:
+    if status.startswith("Captcha"):
+        return "captcha"
+    if status == "Proxy Error" or status.startswith("Error"):
+        return "failure"
+    return "ok"
+
+
+class _CheckLanes:
+    """Runs index checks over per-proxy worker lanes, streaming results as they land.
+
+    Each lane is a thread holding one validated proxy at a time and pulling
+    URLs from a shared queue, spaced by its own ``rate_limit``. A CAPTCHA
+    or 429 puts the lane's proxy on cooldown (see ``ProxyCooldowns``) and a
+    proxy error quarantines it for the rest of the run; either way the URL
+    goes back for another lane (up to ``max_captcha_retries`` attempts) and
+    the lane moves on to the next available proxy. Lanes stop when the work
+    runs out or every proxy is quarantined.
+
+    Without proxies there is a single direct lane, which stops the run after
+    ``max_captcha_retries`` consecutive CAPTCHAs.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        method: CheckMethod,
+        rotator: ProxyRotator | None,
+        captcha_config: CaptchaConfig | None,
+        captcha_handling: CaptchaHandling,
+        headless: bool,
+        rate_limit: float,
+        max_captcha_retries: int,
+        workers: int,
+        cache: IndexResultCache | None = None,
+        quarantined: Iterable[str] = (),
+    ) -> None:
+        self._method = method
+        self._cache = cache
+        self._rotator = rotator
+        self._captcha_config = captcha_config
+        self._captcha_handling = captcha_handling
+        self._headless = headless
+        self._max_attempts = max(1, max_captcha_retries)
+        self._workers = max(1, workers)
+        self._limiter = HostRateLimiter(rate_limit)
+
+        self._work: queue.Queue[tuple[str, int]] = queue.Queue()
+        for url in urls:
+            self._work.put((url, 0))
+        self._results: queue.Queue[IndexCheckResult | None] = queue.Queue()
+        self._outstanding = len(urls)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._in_use: set[str] = set()
+        self._quarantined: set[str] = set(quarantined)
+        self._validated: dict[str, dict] = {}
+        self._any_proxy_valid = False
+        self._direct_captchas = 0
+        self._pool: PlaywrightPool | None = None
+
+    def run(self) -> Iterator[IndexCheckResult]:
+        """Start the lanes and yield results in completion order."""
+        if self._method == CheckMethod.PLAYWRIGHT:
+            self._pool = PlaywrightPool(self._headless)
+        live = self._start_lanes()
+        try:
+            while live:
+                result = self._results.get()
+                if result is not None:
+                    yield result
+                    continue
+                live -= 1
+                if not live and self._rotator and not self._any_proxy_valid and self._outstanding:
+                    logger.warning("No valid proxies found. Proceeding without proxy.")
+                    self._rotator = None
+                    live = self._start_lanes()
+        finally:
+            self._stop.set()
+            if self._pool is not None:
+                self._pool.close()
+        if self._outstanding:
+            logger.error("Stopped with %d URLs unchecked.", self._outstanding)
+
+    def _start_lanes(self) -> int:
+        count = 1 if self._rotator is None else min(self._workers, len(self._rotator))
+        for _ in range(count):
+            threading.Thread(target=self._lane_main, daemon=True).start()
+        return count
+
+    def _lane_main(self) -> None:
+        try:
+            with _own_event_loop():
+                self._lane()
+        except Exception as e:
+            logger.error("Index check lane failed: %s", e)
+        finally:
+            self._results.put(None)
+
+    def _lane(self) -> None:
+        proxy: str | None = None
+        proxy_dict: dict | None = None
+        if self._rotator is not None:
+            acquired = self._acquire_proxy()
+            if acquired is None:
+                return
+            proxy, proxy_dict = acquired
+
+        while not self._stop.is_set():
+            try:
+                url, attempts = self._work.get(timeout=_LANE_POLL_INTERVAL)
+            except queue.Empty:
+                with self._lock:
+                    if self._outstanding == 0:
+                        return
+                continue
+
+            self._limiter.wait(f"proxy://{proxy or 'direct'}")
+            started = time.monotonic()
+            result = check_indexing_status(
+                url,
+                self._method,
+                proxy_dict,
+                self._captcha_config,
+                self._captcha_handling,
+                self._headless,
+                pool=self._pool,
+                use_cache=False,
+            )
+            if self._cache is not None:
+                self._cache.put(result, self._method)
+            if proxy is not None and self._rotator.health is not None:
+                self._rotator.health.record(proxy, _proxy_outcome(result.status), time.monotonic() - started)
+            retry_after = _take_retry_after()
+            if not _needs_retry(result.status):
+                self._finish(result)
+                self._direct_captchas = 0
+                if proxy is not None:
+                    self._rotator.cooldowns.clear(proxy)
+                continue
+
+            if proxy is None:
+                self._finish(result)
+                self._direct_captchas += 1
+                if self._direct_captchas >= self._max_attempts:
+                    logger.error("Too many CAPTCHA failures (%d). Stopping.", self._direct_captchas)
+                    self._stop.set()
+                continue
+
+            if result.status == "Proxy Error":
+                self._quarantine(proxy, result.status)
+            else:
+                self._cool_down(proxy, retry_after)
+            if attempts + 1 < self._max_attempts:
+                self._work.put((url, attempts + 1))
+            else:
+                self._finish(result)
+            acquired = self._acquire_proxy()
+            if acquired is None:
+                return
+            proxy, proxy_dict = acquired
+
+    def _finish(self, result: IndexCheckResult) -> None:
+        with self._lock:
+            self._outstanding -= 1
+        self._results.put(result)
+
+    def _acquire_proxy(self) -> tuple[str, dict] | None:
+        """Claim the best proxy that is free, not quarantined and not cooling down.
+
+        Proxies are validated on first use. When the only ones left are
+        cooling down, waits (without holding one) for the first to come back,
+        giving up once no work is outstanding.
+        """
+        cooldowns = self._rotator.cooldowns
+        while not self._stop.is_set():
+            waits = []
+            for candidate in self._rotator.ranked():
+                with self._lock:
+                    if candidate in self._in_use or candidate in self._quarantined:
+                        continue
+                    remaining = cooldowns.remaining(candidate)
+                    if remaining:
+                        waits.append(remaining)
+                        continue
+                    self._in_use.add(candidate)
+                proxy_dict = self._validated.get(candidate) or self._rotator.validate(candidate, self._method)
+                if proxy_dict:
+                    self._validated[candidate] = proxy_dict
+                    self._any_proxy_valid = True
+                    return candidate, proxy_dict
+                if cooldowns.remaining(candidate):
+                    self._release(candidate)  # Throttled during validation; try again later
+                    waits.append(cooldowns.remaining(candidate))
+                else:
+                    self._quarantine(candidate, "failed validation")
+            with self._lock:
+                if not waits or self._outstanding == 0:
+                    return None
+            self._stop.wait(min(min(waits), _LANE_POLL_INTERVAL))
+        return None
+
+    def _release(self, proxy: str) -> None:
+        with self._lock:
+            self._in_use.discard(proxy)
+
+    def _cool_down(self, proxy: str, retry_after: float | None) -> None:
+        delay = self._rotator.cooldowns.penalize(proxy, retry_after)
+        self._close_browser(proxy)
+        self._release(proxy)
+        logger.warning("Proxy %s throttled; cooling down for %.0fs", proxy, delay)
+
+    def _quarantine(self, proxy: str, reason: str) -> None:
+        self._close_browser(proxy)
+        with self._lock:
+            self._in_use.discard(proxy)
+            self._quarantined.add(proxy)
+        logger.warning("Quarantined proxy %s: %s", proxy, reason)
+
+    def _close_browser(self, proxy: str) -> None:
+        """Drop the pooled browser of a proxy this lane is giving up, so idle Chromiums don't pile up."""
+        if self._pool is not None and proxy in self._validated:
+            self._pool.release(self._validated[proxy])
+
+
+# ---------------------------------------------------------------------------
+# Grouped prefix queries
+# ---------------------------------------------------------------------------
+
+
+def _url_key(url: str) -> str:
+    """Scheme-, case- and trailing-slash-insensitive key for matching SERP links to input URLs."""
+    parts = urlsplit(url.strip())
+    key = parts.netloc.lower() + parts.path.rstrip("/")
+    return f"{key}?{parts.query}" if parts.query else key
+
+
+def _serp_result_urls(data: bytes) -> set[str]:
+    """Absolute result URLs linked from a SERP, with ``/url?q=`` redirects unwrapped."""
+    found = set()
+    for match in _ANCHOR_HREF_RE.finditer(data):
+        href = html.unescape((match.group(1) or match.group(2) or match.group(3) or b"").decode("utf-8", "replace"))
+        if href.startswith("/url?"):
+            href = parse_qs(urlsplit(href).query).get("q", [""])[0]
+        if href.startswith(("http://", "https://")):
+            found.add(href)
+    return found
+
+
+def group_urls_by_prefix(
+    urls: Iterable[str],
+    min_group_size: int = DEFAULT_MIN_GROUP_SIZE,
+) -> tuple[dict[str, list[str]], list[str]]:
+    """Bucket URLs by host and first path segment for prefix ``site:`` queries.
+
+    A section (``host/segment``) with at least ``min_group_size`` URLs gets
+    its own group. The rest of a host's URLs form a host-wide group if there
+    are enough of them, and are otherwise left to per-URL checks.
+
+    Args:
+        urls: URLs to group.
+        min_group_size: Smallest group worth a prefix query.
+
+    Returns:
+        ``(groups, singles)``: prefix -> URLs, and URLs in no group.
+    """
+    by_host: dict[str, dict[str, list[str]]] = {}
+    for url in urls:
+        parts = urlsplit(url)
+        host = parts.netloc.lower()
+        segments = [s for s in parts.path.split("/") if s]
+        section = f"{host}/{segments[0]}" if len(segments) > 1 else host
+        by_host.setdefault(host, {}).setdefault(section, []).append(url)
+
+    groups: dict[str, list[str]] = {}
+    singles: list[str] = []
+    for host, sections in by_host.items():
+        leftovers = []
+        for section, members in sections.items():
+            if section != host and len(members) >= min_group_size:
+                groups[section] = members
+            else:
+                leftovers.extend(members)
+        if len(leftovers) >= min_group_size:
+            groups[host] = leftovers
+        else:
+            singles.extend(leftovers)
+    return groups, singles
+
+
+def check_prefix_indexing(
+    prefix: str,
+    urls: list[str],
+    proxies: dict | None = None,
+    max_pages: int = DEFAULT_PREFIX_PAGES,
+    rate_limit: float = 0,
+) -> tuple[set[str], str | None]:
+    """Confirm many URLs at once with paginated ``site:<prefix>`` queries.
+
+    Fetches up to ``max_pages`` pages of 100 results over plain HTTP and
+    stops early once every URL is confirmed or a page lists nothing under
+    ``prefix``. URLs absent from the results are not proven unindexed
+    (Google caps how deep ``site:`` results go), so callers should check
+    them one by one.
+
+    Args:
+        prefix: Host or host/path prefix, e.g. ``example.com/blog``.
+        urls: URLs under ``prefix`` to look for.
+        proxies: Optional proxy dict.
+        max_pages: Max result pages to fetch.
+        rate_limit: Delay after each request.
+
+    Returns:
+        ``(confirmed, blocked)``: the input URLs seen in the results, and
+        the status that stopped the queries early ("Captcha Encountered",
+        "Proxy Error" or "Error: ...") or None.
+    """
+    wanted = {_url_key(url): url for url in urls}
+    prefix_key = _url_key(prefix if "://" in prefix else f"//{prefix}")
+    confirmed: set[str] = set()
+    session = _http_session()
+
+    for page in range(max_pages):
+        search_url = (
+            f"https://www.google.com/search?q={quote(f'site:{prefix}', safe=':/')}&num=100&start={page * 100}"
+        )
+        try:
+            response = session.get(search_url, headers=generate_headers(), proxies=proxies, timeout=10)
+        except requests.exceptions.ProxyError as e:
+            logger.warning("Proxy error on prefix query %s: %s", prefix, e)
+            return confirmed, "Proxy Error"
+        except requests.RequestException as e:
+            logger.error("Error on prefix query %s: %s", prefix, e)
+            return confirmed, f"Error: {e}"
+        finally:
+            if rate_limit > 0:
+                time.sleep(rate_limit)
+
+        data = response.content
+        if response.status_code == 429 or any(marker in data.lower() for marker in _CAPTCHA_MARKERS):
+            _http_local.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            return confirmed, "Captcha Encountered"
+
+        listed = [
+            key
+            for key in map(_url_key, _serp_result_urls(data))
+            if key == prefix_key or key.startswith(prefix_key + "/")
+        ]
+        confirmed.update(wanted[key] for key in listed if key in wanted)
+        if not listed or len(confirmed) == len(wanted):
+            break
+    return confirmed, None
+
+
+def _prefix_proxy(rotator: ProxyRotator, quarantined: set[str]) -> tuple[str | None, dict | None]:
+    """Validate the ready proxies concurrently and take the first good one.
+
+    Proxies that fail validation (without being throttled) are added to
+    ``quarantined``, as the per-URL lanes would do.
+    """
+    candidates = [p for p in rotator.ranked() if not rotator.cooldowns.remaining(p)]
+    for candidate, proxy_dict in rotator.validate_many(candidates, CheckMethod.HTTP):
+        if proxy_dict:
+            return candidate, proxy_dict
+        if not rotator.cooldowns.remaining(candidate):
+            quarantined.add(candidate)
+            logger.warning("Quarantined proxy %s: failed validation", candidate)
+    return None, None
+
+
+def _prefix_phase(
+    urls: list[str],
+    rotator: ProxyRotator | None,
+    rate_limit: float,
+    min_group_size: int,
+    cache: IndexResultCache | None,
+    quarantined: set[str],
+) -> Generator[IndexCheckResult, None, set[str]]:
+    """Yield "Indexed" for URLs confirmed by prefix queries; return the confirmed set.
+
+    Runs the groups one after another on a single proxy (or directly). A
+    CAPTCHA cools that proxy down and a proxy error quarantines it (adding
+    it to ``quarantined`` for the lanes); either ends the phase, so the
+    remaining URLs go to the per-URL lanes.
+    """
+    groups, _singles = group_urls_by_prefix(urls, min_group_size)
+    confirmed: set[str] = set()
+    if not groups:
+        return confirmed
+
+    proxy = proxy_dict = None
+    if rotator is not None:
+        proxy, proxy_dict = _prefix_proxy(rotator, quarantined)
+    proxy_used = str(proxy_dict) if proxy_dict else "No Proxy"
+
+    for prefix, members in groups.items():
+        started = time.monotonic()
+        hits, blocked = check_prefix_indexing(prefix, members, proxy_dict, rate_limit=rate_limit)
+        if proxy is not None and rotator.health is not None:
+            rotator.health.record(proxy, _proxy_outcome(blocked or ""), time.monotonic() - started)
+        for url in members:
+            if url in hits:
+                result = IndexCheckResult(url=url, status="Indexed", proxy_used=proxy_used)
+                if cache is not None:
+                    cache.put(result, CheckMethod.HTTP)
+                yield result
+        confirmed |= hits
+        if blocked:
+            retry_after = _take_retry_after()
+            if proxy is not None and blocked == "Proxy Error":
+                quarantined.add(proxy)
+                logger.warning("Quarantined proxy %s: %s", proxy, blocked)
+            elif proxy is not None:
+                rotator.cooldowns.penalize(proxy, retry_after)
+            logger.warning("Prefix queries stopped (%s); checking the rest one by one", blocked)
+            break
+
+    logger.info("Prefix queries confirmed %d of %d URLs", len(confirmed), len(urls))
+    return confirmed
+
+
+def iter_check_indexing(
+    urls: list[str],
+    method: CheckMethod = CheckMethod.HTML_SESSION,
+    proxy_config: ProxyConfig | None = None,
+    captcha_config: CaptchaConfig | None = None,
+    captcha_handling: CaptchaHandling = CaptchaHandling.AUTOMATIC,
+    headless: bool = False,
+    rate_limit: float = 0,
+    max_captcha_retries: int = 3,
+    workers: int = DEFAULT_LANES,
+    use_cache: bool = True,
+    grouped: bool = False,
+    min_group_size: int = DEFAULT_MIN_GROUP_SIZE,
+) -> Iterator[IndexCheckResult]:
+    """Check many URLs concurrently, yielding each result as soon as it lands.
+
+    With proxies, up to ``workers`` lanes run at once, each on its own
+    proxy; see ``batch_check_indexing`` for the retry and quarantine rules.
+    Results come in completion order, including final CAPTCHA / proxy-error
+    outcomes for URLs that ran out of attempts. Fresh cache hits are yielded
+    first, without touching Google. With ``grouped``, URLs sharing a host or
+    path prefix are then confirmed in bulk with ``site:<prefix>`` queries
+    (see ``check_prefix_indexing``) and only the rest are checked one by one.
+
+    Args:
+        urls: URLs to check.
+        method: Check method.
+        proxy_config: Optional proxy configuration.
+        captcha_config: Optional CAPTCHA configuration.
+        captcha_handling: CAPTCHA handling strategy.
+        headless: Headless mode.
+        rate_limit: Minimum delay in seconds between checks on the same proxy.
+        max_captcha_retries: Max attempts per URL (with proxies) or max
+            consecutive CAPTCHAs before stopping (without).
+        workers: Max concurrent proxy lanes.
+        use_cache: Serve fresh results from the result cache and cache new ones.
+        grouped: Run prefix-level ``site:`` queries before per-URL checks.
+        min_group_size: Smallest URL group worth a prefix query.
+
+    Yields:
+        IndexCheckResult per URL.
+    """
+    cache = get_index_result_cache() if use_cache else None
+    if cache is not None:
+        misses = []
+        for url in urls:
+            hit = cache.get(url)
+            if hit is None:
+                misses.append(url)
+            else:
+                yield hit
+        urls = misses
+    if not urls:
+        return
+
+    rotator = None
+    if proxy_config:
+        rotator = ProxyRotator(proxy_config.proxy_list, proxy_config.mode, health=get_proxy_health_board())
+    if rotator is not None and not len(rotator):
+        rotator = None
+
+    quarantined: set[str] = set()
+    if grouped:
+        confirmed = yield from _prefix_phase(urls, rotator, rate_limit, min_group_size, cache, quarantined)
+        urls = [url for url in urls if url not in confirmed]
+        if not urls:
+            return
+
+    lanes = _CheckLanes(
+        urls,
+        method,
+        rotator,
+        captcha_config,
+        captcha_handling,
+        headless,
+        rate_limit,
+        max_captcha_retries,
+        workers,
+        cache,
+        quarantined,
+    )
+    yield from lanes.run()
 
 
 def batch_check_indexing(
@@ -541,9 +1822,26 @@ def batch_check_indexing(
     rate_limit: float = 0,
     max_captcha_retries: int = 3,
     on_progress: ProgressCallback | None = None,
+    workers: int = DEFAULT_LANES,
+    job_store: IndexJobStore | None = None,
+    job_id: str | None = None,
+    use_cache: bool = True,
+    grouped: bool = False,
 ) -> BatchIndexCheckResult:
     """Check indexing status for multiple URLs with proxy rotation and CAPTCHA handling.
 
+    Each healthy proxy gets its own worker lane (up to ``workers`` at once).
+    A proxy that hits a CAPTCHA or 429 cools down (a proxy error
+    quarantines it) and the URL is retried on another, up to
+    ``max_captcha_retries`` attempts. Without
+    proxies, checks run one at a time and stop after
+    ``max_captcha_retries`` consecutive CAPTCHAs.
+
+    With a ``job_store`` every definitive result is checkpointed as it
+    lands. Passing the ``job_id`` of an earlier run resumes it: URLs already
+    finished are skipped and their saved results are included in the return
+    value, while URLs that ended in an ``"Error: ..."`` are checked again.
+
     Args:
         urls: List of URLs to check.
         method: Check method.
@@ -551,63 +1849,52 @@ def batch_check_indexing(
         captcha_config: Optional CAPTCHA configuration.
         captcha_handling: CAPTCHA handling strategy.
         headless: Headless mode.
-        rate_limit: Delay between checks.
-        max_captcha_retries: Max consecutive CAPTCHA failures before stopping.
+        rate_limit: Minimum delay in seconds between checks on the same proxy.
+        max_captcha_retries: Max attempts per URL (with proxies) or max
+            consecutive CAPTCHAs before stopping (without).
         on_progress: Optional progress callback.
+        workers: Max concurrent proxy lanes.
+        job_store: Optional checkpoint store for a resumable run.
+        job_id: Job to resume or create in ``job_store`` (generated when None).
+        use_cache: Serve fresh results from the result cache and cache new ones.
+        grouped: Confirm URLs sharing a host/path prefix with bulk ``site:``
+            queries first, then check only the rest one by one.
 
     Returns:
-        BatchIndexCheckResult with all results.
+        BatchIndexCheckResult with all results. URLs that only ever got a
+        CAPTCHA or proxy error are left out.
     """
     results: list[IndexCheckResult] = []
-    rotator = ProxyRotator(proxy_config.proxy_list, proxy_config.mode) if proxy_config else None
-    captcha_failures = 0
-
-    # Find initial valid proxy
-    if rotator:
-        valid = rotator.find_valid(method)
-        if not valid:
-            logger.warning("No valid proxies found. Proceeding without proxy.")
-            rotator = None
-
-    for i, url in enumerate(urls):
-        proxy = rotator.current if rotator else None
-
-        result = check_indexing_status(
-            url, method, proxy, captcha_config, captcha_handling, headless, rate_limit
-        )
-
-        # Handle CAPTCHA failures with proxy rotation
-        if "Captcha" in result.status and rotator:
-            captcha_failures += 1
-            new_proxy = rotator.find_valid(method)
-            if new_proxy:
-                result = check_indexing_status(
-                    url, method, new_proxy, captcha_config, captcha_handling, headless, rate_limit
-                )
-                if "Captcha" not in result.status:
-                    captcha_failures = 0
-
-        elif "Captcha" in result.status:
-            captcha_failures += 1
-
-        if "Captcha" not in result.status and "Proxy Error" not in result.status:
+    pending = urls
+    if job_store is not None:
+        job_id = job_store.open_job(urls, job_id)
+        results = job_store.results(job_id)
+        pending = job_store.pending_urls(job_id)
+        if results:
+            logger.info("Resuming job %s: %d URLs already checked, %d to go", job_id, len(results), len(pending))
+
+    total = len(results) + len(pending)
+    done = len(results)
+    for result in iter_check_indexing(
+        pending,
+        method,
+        proxy_config,
+        captcha_config,
+        captcha_handling,
+        headless,
+        rate_limit,
+        max_captcha_retries,
+        workers,
+        use_cache,
+        grouped,
+    ):
+        done += 1
+        if not _needs_retry(result.status):
             results.append(result)
-            captcha_failures = 0
-        elif "Proxy Error" in result.status and rotator:
-            new_proxy = rotator.find_valid(method)
-            if new_proxy:
-                result = check_indexing_status(
-                    url, method, new_proxy, captcha_config, captcha_handling, headless, rate_limit
-                )
-                if "Captcha" not in result.status and "Proxy Error" not in result.status:
-                    results.append(result)
-
-        if captcha_failures >= max_captcha_retries:
-            logger.error("Too many CAPTCHA failures (%d). Stopping.", captcha_failures)
-            break
-
+            if job_store is not None and not result.status.startswith("Error"):
+                job_store.record(job_id, result)
         if on_progress:
-            on_progress(i + 1, len(urls))
+            on_progress(done, total)
 
     indexed = sum(1 for r in results if r.status == "Indexed")
     not_indexed = sum(1 for r in results if r.status == "Not Indexed")
@@ -619,4 +1906,5 @@ def batch_check_indexing(
         total_indexed=indexed,
         total_not_indexed=not_indexed,
         total_errors=errors,
+        job_id=job_id,
     )
@@ -1,11 +1,22 @@
 """Core backlink checking logic. No CLI dependencies."""
 
+import asyncio
+import html
 import logging
+import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from bs4 import BeautifulSoup
 
-from seo_bhishma.core._http import DEFAULT_TIMEOUT, requests_retry_session
+from seo_bhishma.core._http import (
+    AsyncRetryClient,
+    HtmlBody,
+    async_client_scope,
+    fetch_html,
+    fetch_html_async,
+    get_rate_limiter,
+    get_session,
+)
 from seo_bhishma.models.common import ProgressCallback
 from seo_bhishma.models.link_sniper import BacklinkCheckRequest, BacklinkCheckResult
 
@@ -27,6 +38,133 @@ def _rel_attrs(tag) -> list[str]:
     return [v.strip().lower() for v in rel if v and v.strip()]
 
 
+def _target_links(soup: BeautifulSoup, target_url: str) -> list:
+    """``<a>`` tags in ``soup`` whose href is ``target_url`` (trailing slash ignored)."""
+    target_norm = _normalize_target(target_url)
+    return [a for a in soup.find_all("a", href=True) if _normalize_target(a["href"]) == target_norm]
+
+
+_TAG_RE = re.compile(rb"<[^>]*>")
+
+
+class _AnchorWatch:
+    """Download stop condition: True once a link to the target with the expected anchor has been read.
+
+    Only the part of the body not yet scanned is searched on each call,
+    resuming from the last ``<a`` that may still be incomplete. The byte-level
+    match only finds candidates: one inside a comment or ``<script>`` (or a
+    look-alike attribute) must not end the download, so a candidate is
+    confirmed by parsing the body read so far the way ``_backlink_result``
+    does. Later duplicate links to the target are the only thing given up.
+    """
+
+    def __init__(self, target_url: str, expected_anchor: str = "") -> None:
+        target = _normalize_target(target_url)
+        hrefs = sorted({target, html.escape(target, quote=False)}, key=len, reverse=True)
+        href_re = b"|".join(re.escape(h.encode()) for h in hrefs)
+        # Tag and attribute names are case-insensitive; the href itself is
+        # compared exactly, as ``_backlink_result`` does
+        self._pattern = re.compile(
+            rb"(?i:<a\s[^>]*?(?<![\w-])href)\s*=\s*[\"']?(?:" + href_re + rb")/?[\"'\s>][^>]*>(.*?)(?i:</a)\s*>",
+            re.DOTALL,
+        )
+        self._target = target_url
+        self._anchor = expected_anchor
+        self._pos = 0
+
+    def __call__(self, body: bytearray) -> bool:
+        for match in self._pattern.finditer(body, self._pos):
+            # Same text as ``get_text(strip=True)`` in ``_backlink_result``
+            parts = _TAG_RE.split(match.group(1))
+            text = "".join(html.unescape(p.decode("utf-8", errors="ignore")).strip() for p in parts)
+            if self._anchor in text and self._confirmed(body[: match.end()]):
+                return True
+            self._pos = match.end()
+        open_tag = max(body.rfind(b"<a", self._pos), body.rfind(b"<A", self._pos))
+        self._pos = open_tag if open_tag >= 0 else max(self._pos, len(body) - 1)
+        return False
+
+    def _confirmed(self, prefix: bytes) -> bool:
+        soup = BeautifulSoup(prefix.decode("utf-8", errors="ignore"), "html.parser")
+        return any(self._anchor in link.get_text(strip=True) for link in _target_links(soup, self._target))
+
+
+def _page_html(backlink_url: str, page: HtmlBody) -> str:
+    if page.skipped:
+        logger.debug("Not parsing %s: content type %s", backlink_url, page.content_type)
+        return ""
+    if page.truncated:
+        logger.debug("Only the first %d bytes of %s were checked", len(page.content), backlink_url)
+    return page.text
+
+
+def _backlink_result(
+    backlink_url: str,
+    target_url: str,
+    expected_anchor: str,
+    http_status: int,
+    html: str,
+) -> BacklinkCheckResult:
+    """Build the check result from a fetched backlink page."""
+    if http_status != 200:
+        return BacklinkCheckResult(
+            backlink_url=backlink_url,
+            target_url=target_url,
+            status="Not Live",
+            anchor_status="N/A",
+            link_exists="No",
+            http_status=http_status,
+        )
+
+    links = _target_links(BeautifulSoup(html, "html.parser"), target_url)
+    if not links:
+        return BacklinkCheckResult(
+            backlink_url=backlink_url,
+            target_url=target_url,
+            status="Not Found",
+            anchor_status="N/A",
+            link_exists="No",
+            http_status=http_status,
+        )
+
+    actual_anchor_texts = [link.get_text(strip=True) for link in links]
+    joined_anchors = ", ".join(actual_anchor_texts)
+
+    rel_values: list[str] = []
+    for link in links:
+        for v in _rel_attrs(link):
+            if v not in rel_values:
+                rel_values.append(v)
+    is_dofollow = not any(v in NOFOLLOW_REL_VALUES for v in rel_values)
+
+    anchor_status = "Present"
+    if expected_anchor:
+        anchor_present = any(expected_anchor in (a or "") for a in actual_anchor_texts)
+        anchor_status = "Present" if anchor_present else "Missing"
+
+    return BacklinkCheckResult(
+        backlink_url=backlink_url,
+        target_url=target_url,
+        status="Live",
+        anchor_status=anchor_status,
+        link_exists="Yes",
+        actual_anchor_text=joined_anchors,
+        http_status=http_status,
+        rel_values=rel_values,
+        is_dofollow=is_dofollow,
+    )
+
+
+def _backlink_error(backlink_url: str, target_url: str, error: Exception) -> BacklinkCheckResult:
+    return BacklinkCheckResult(
+        backlink_url=backlink_url,
+        target_url=target_url,
+        status="Error",
+        anchor_status=str(error),
+        link_exists="No",
+    )
+
+
 def check_backlink(
     backlink_url: str,
     target_url: str,
@@ -42,70 +180,16 @@ def check_backlink(
     Returns:
         BacklinkCheckResult with status, anchor details, rel attributes, and HTTP status.
     """
+    limiter = get_rate_limiter()
     try:
-        response = requests_retry_session().get(backlink_url, timeout=DEFAULT_TIMEOUT)
-        http_status = response.status_code
-        if http_status != 200:
-            return BacklinkCheckResult(
-                backlink_url=backlink_url,
-                target_url=target_url,
-                status="Not Live",
-                anchor_status="N/A",
-                link_exists="No",
-                http_status=http_status,
-            )
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        target_norm = _normalize_target(target_url)
-        links = [
-            a for a in soup.find_all("a", href=True)
-            if _normalize_target(a["href"]) == target_norm
-        ]
-        if not links:
-            return BacklinkCheckResult(
-                backlink_url=backlink_url,
-                target_url=target_url,
-                status="Not Found",
-                anchor_status="N/A",
-                link_exists="No",
-                http_status=http_status,
-            )
-
-        actual_anchor_texts = [link.get_text(strip=True) for link in links]
-        joined_anchors = ", ".join(actual_anchor_texts)
-
-        rel_values: list[str] = []
-        for link in links:
-            for v in _rel_attrs(link):
-                if v not in rel_values:
-                    rel_values.append(v)
-        is_dofollow = not any(v in NOFOLLOW_REL_VALUES for v in rel_values)
-
-        anchor_status = "Present"
-        if expected_anchor:
-            anchor_present = any(expected_anchor in (a or "") for a in actual_anchor_texts)
-            anchor_status = "Present" if anchor_present else "Missing"
-
-        return BacklinkCheckResult(
-            backlink_url=backlink_url,
-            target_url=target_url,
-            status="Live",
-            anchor_status=anchor_status,
-            link_exists="Yes",
-            actual_anchor_text=joined_anchors,
-            http_status=http_status,
-            rel_values=rel_values,
-            is_dofollow=is_dofollow,
-        )
+        limiter.acquire(backlink_url)
+        page = fetch_html(backlink_url, session=get_session(), stop_when=_AnchorWatch(target_url, expected_anchor))
+        limiter.record_response(backlink_url, page)
+        html_text = _page_html(backlink_url, page)
+        return _backlink_result(backlink_url, target_url, expected_anchor, page.status_code, html_text)
     except Exception as e:
         logger.error("Error checking backlink %s: %s", backlink_url, e)
-        return BacklinkCheckResult(
-            backlink_url=backlink_url,
-            target_url=target_url,
-            status="Error",
-            anchor_status=str(e),
-            link_exists="No",
-        )
+        return _backlink_error(backlink_url, target_url, e)
 
 
 def batch_check_backlinks(
@@ -146,6 +230,74 @@ def batch_check_backlinks(
     return results  # type: ignore[return-value]
 
 
+async def check_backlink_async(
+    backlink_url: str,
+    target_url: str,
+    expected_anchor: str = "",
+    client: AsyncRetryClient | None = None,
+) -> BacklinkCheckResult:
+    """Async ``check_backlink`` on the async transport; the HTML is parsed in a worker thread.
+
+    Args:
+        backlink_url: The URL that should contain the backlink.
+        target_url: The URL that should be linked to.
+        expected_anchor: Optional anchor text to verify.
+        client: Client to share across calls; a temporary one is used when None.
+
+    Returns:
+        BacklinkCheckResult with status, anchor details, rel attributes, and HTTP status.
+    """
+    limiter = get_rate_limiter()
+    try:
+        await limiter.acquire_async(backlink_url)
+        page = await fetch_html_async(backlink_url, client, stop_when=_AnchorWatch(target_url, expected_anchor))
+        limiter.record_response(backlink_url, page)
+        html_text = _page_html(backlink_url, page)
+        # Parse off the event loop so one large page doesn't stall every other check in flight
+        return await asyncio.to_thread(
+            _backlink_result, backlink_url, target_url, expected_anchor, page.status_code, html_text
+        )
+    except Exception as e:
+        logger.error("Error checking backlink %s: %s", backlink_url, e)
+        return _backlink_error(backlink_url, target_url, e)
+
+
+async def batch_check_backlinks_async(
+    checks: list[BacklinkCheckRequest],
+    max_concurrency: int = 100,
+    on_progress: ProgressCallback | None = None,
+    client: AsyncRetryClient | None = None,
+) -> list[BacklinkCheckResult]:
+    """Check many backlinks concurrently on one event loop.
+
+    Args:
+        checks: List of backlink check requests.
+        max_concurrency: Max requests in flight at once.
+        on_progress: Optional callback for progress reporting.
+        client: Client to share; a temporary one sized to ``max_concurrency`` is used when None.
+
+    Returns:
+        List of BacklinkCheckResult in the same order as input.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    completed = 0
+
+    async with async_client_scope(client, max_connections=max_concurrency) as http:
+
+        async def _one(check: BacklinkCheckRequest) -> BacklinkCheckResult:
+            nonlocal completed
+            async with semaphore:
+                result = await check_backlink_async(
+                    check.backlink_url, check.target_url, check.expected_anchor, client=http
+                )
+            completed += 1
+            if on_progress:
+                on_progress(completed, len(checks))
+            return result
+
+        return list(await asyncio.gather(*(_one(check) for check in checks)))
+
+
 def read_backlinks_from_csv(file_path: str) -> list[BacklinkCheckRequest]:
     """Load backlink check requests from a CSV or JSON file.
 
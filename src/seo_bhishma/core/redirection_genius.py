@@ -1,5 +1,6 @@
 """Core URL redirect mapping logic using NLP and TF-IDF similarity. No CLI dependencies."""
 
+import asyncio
 import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -10,12 +11,24 @@ from bs4 import BeautifulSoup
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
-from seo_bhishma.core._http import DEFAULT_TIMEOUT, requests_retry_session
+from seo_bhishma.core._exceptions import NetworkError
+from seo_bhishma.core._http import (
+    AsyncRetryClient,
+    HtmlBody,
+    async_client_scope,
+    fetch_html,
+    fetch_html_async,
+    get_rate_limiter,
+    get_session,
+)
 from seo_bhishma.models.common import ProgressCallback
 from seo_bhishma.models.redirection_genius import UrlMappingResult
 
 logger = logging.getLogger(__name__)
 
+# Slug matches scoring below this are rechecked against page content / flagged for review
+_LOW_CONFIDENCE = 0.6
+
 _nlp_cache: dict[str, object] = {}
 _nlp_lock = threading.Lock()
 
@@ -83,6 +96,43 @@ def tfidf_similarity(source_slugs: list[str], dest_slugs: list[str]) -> np.ndarr
     return cosine_similarity(source_vectors, dest_vectors)
 
 
+def _checked_page(url: str, page: HtmlBody) -> HtmlBody:
+    if page.status_code >= 400:
+        raise NetworkError(f"HTTP {page.status_code} fetching {url}")
+    if page.skipped:
+        raise NetworkError(f"{url} is not an HTML page ({page.content_type})")
+    return page
+
+
+def _fetch_page(url: str) -> HtmlBody:
+    """Stream a page's HTML (size-capped) for content comparison, paced by the shared per-host rate limiter."""
+    limiter = get_rate_limiter()
+    limiter.acquire(url)
+    page = fetch_html(url, session=get_session())
+    limiter.record_response(url, page)
+    return _checked_page(url, page)
+
+
+async def _fetch_page_async(url: str, client: AsyncRetryClient) -> HtmlBody:
+    """Async ``_fetch_page``."""
+    limiter = get_rate_limiter()
+    await limiter.acquire_async(url)
+    page = await fetch_html_async(url, client)
+    limiter.record_response(url, page)
+    return _checked_page(url, page)
+
+
+def _content_similarity(src_html: str, dst_html: str, spacy_model: str) -> float:
+    """spaCy vector similarity of two pages' visible text."""
+    src_text = BeautifulSoup(src_html, "html.parser").get_text(" ", strip=True)
+    dst_text = BeautifulSoup(dst_html, "html.parser").get_text(" ", strip=True)
+
+    nlp = _get_nlp(spacy_model)
+    src_doc = nlp(src_text[:10000])
+    dst_doc = nlp(dst_text[:10000])
+    return float(cosine_similarity([src_doc.vector], [dst_doc.vector])[0][0])
+
+
 def _process_single_mapping(
     i: int,
     source_url: str,
@@ -98,35 +148,22 @@ def _process_single_mapping(
         best_score = float(tfidf_scores[best_idx])
         remark = ""
 
-        if use_web_content and best_score < 0.6:
+        if use_web_content and best_score < _LOW_CONFIDENCE:
             try:
                 import time
 
-                session = requests_retry_session()
                 time.sleep(rate_limit)
-                src_resp = session.get(source_url, timeout=DEFAULT_TIMEOUT)
-                src_resp.raise_for_status()
-                src_resp.encoding = src_resp.encoding or src_resp.apparent_encoding
+                src_page = _fetch_page(source_url)
                 time.sleep(rate_limit)
-                dst_resp = session.get(dest_urls[best_idx], timeout=DEFAULT_TIMEOUT)
-                dst_resp.raise_for_status()
-                dst_resp.encoding = dst_resp.encoding or dst_resp.apparent_encoding
-
-                src_text = BeautifulSoup(src_resp.text, "html.parser").get_text(" ", strip=True)
-                dst_text = BeautifulSoup(dst_resp.text, "html.parser").get_text(" ", strip=True)
-
-                nlp = _get_nlp(spacy_model)
-                src_doc = nlp(src_text[:10000])
-                dst_doc = nlp(dst_text[:10000])
-                best_score = float(
-                    cosine_similarity([src_doc.vector], [dst_doc.vector])[0][0]
-                )
-                remark = "Check manually" if best_score < 0.6 else ""
+                dst_page = _fetch_page(dest_urls[best_idx])
+
+                best_score = _content_similarity(src_page.text, dst_page.text, spacy_model)
+                remark = "Check manually" if best_score < _LOW_CONFIDENCE else ""
             except Exception as exc:
                 logger.debug("Content fetch for %s failed: %s", source_url, exc)
                 remark = "Error"
         else:
-            remark = "Check manually" if best_score < 0.6 else ""
+            remark = "Check manually" if best_score < _LOW_CONFIDENCE else ""
 
         return UrlMappingResult(
             source=source_url,
@@ -144,6 +181,51 @@ def _process_single_mapping(
         )
 
 
+def _slug_similarity_matrix(source_urls: list[str], dest_urls: list[str], spacy_model: str) -> np.ndarray:
+    """TF-IDF similarity of the lemmatized slugs of every source/destination pair."""
+    source_slugs = [extract_slug(url) for url in source_urls]
+    dest_slugs = [extract_slug(url) for url in dest_urls]
+
+    source_lemmas = [" ".join(analyze_slug(s, spacy_model)) for s in source_slugs]
+    dest_lemmas = [" ".join(analyze_slug(s, spacy_model)) for s in dest_slugs]
+
+    return tfidf_similarity(source_lemmas, dest_lemmas)
+
+
+async def _process_single_mapping_async(
+    source_url: str,
+    dest_urls: list[str],
+    tfidf_scores: np.ndarray,
+    use_web_content: bool,
+    rate_limit: float,
+    spacy_model: str,
+    client: AsyncRetryClient,
+) -> UrlMappingResult:
+    """Async ``_process_single_mapping``: pages are fetched on the loop, scored in a worker thread."""
+    best_idx = int(np.argmax(tfidf_scores))
+    best_score = float(tfidf_scores[best_idx])
+    if not (use_web_content and best_score < _LOW_CONFIDENCE):
+        remark = "Check manually" if best_score < _LOW_CONFIDENCE else ""
+        return UrlMappingResult(
+            source=source_url, destination=dest_urls[best_idx], confidence_score=best_score, remark=remark
+        )
+
+    try:
+        await asyncio.sleep(rate_limit)
+        src_page = await _fetch_page_async(source_url, client)
+        await asyncio.sleep(rate_limit)
+        dst_page = await _fetch_page_async(dest_urls[best_idx], client)
+
+        best_score = await asyncio.to_thread(_content_similarity, src_page.text, dst_page.text, spacy_model)
+        remark = "Check manually" if best_score < _LOW_CONFIDENCE else ""
+    except Exception as exc:
+        logger.debug("Content fetch for %s failed: %s", source_url, exc)
+        remark = "Error"
+    return UrlMappingResult(
+        source=source_url, destination=dest_urls[best_idx], confidence_score=best_score, remark=remark
+    )
+
+
 def map_urls(
     source_urls: list[str],
     dest_urls: list[str],
@@ -169,14 +251,7 @@ def map_urls(
     Returns:
         List of UrlMappingResult in same order as source_urls.
     """
-    # Compute slug similarities
-    source_slugs = [extract_slug(url) for url in source_urls]
-    dest_slugs = [extract_slug(url) for url in dest_urls]
-
-    source_lemmas = [" ".join(analyze_slug(s, spacy_model)) for s in source_slugs]
-    dest_lemmas = [" ".join(analyze_slug(s, spacy_model)) for s in dest_slugs]
-
-    sim_matrix = tfidf_similarity(source_lemmas, dest_lemmas)
+    sim_matrix = _slug_similarity_matrix(source_urls, dest_urls, spacy_model)
 
     # Map URLs in parallel
     results: list[UrlMappingResult | None] = [None] * len(source_urls)
@@ -204,3 +279,54 @@ def map_urls(
                 on_progress(completed, len(source_urls))
 
     return results  # type: ignore[return-value]
+
+
+async def map_urls_async(
+    source_urls: list[str],
+    dest_urls: list[str],
+    use_web_content: bool = False,
+    rate_limit: float = 0,
+    max_concurrency: int = 100,
+    spacy_model: str = "en_core_web_sm",
+    on_progress: ProgressCallback | None = None,
+    client: AsyncRetryClient | None = None,
+) -> list[UrlMappingResult]:
+    """Async ``map_urls``: content fetches for low-confidence matches run concurrently on one loop.
+
+    Args:
+        source_urls: URLs that need redirects.
+        dest_urls: Candidate destination URLs.
+        use_web_content: If True, fetch page content for low-confidence matches.
+        rate_limit: Delay in seconds before each web content request.
+        max_concurrency: Max source URLs having their pages fetched at once.
+        spacy_model: spaCy model for NLP processing.
+        on_progress: Optional progress callback.
+        client: Client to share; a temporary one is used when None.
+
+    Returns:
+        List of UrlMappingResult in same order as source_urls.
+    """
+    sim_matrix = await asyncio.to_thread(_slug_similarity_matrix, source_urls, dest_urls, spacy_model)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    completed = 0
+
+    async with async_client_scope(client, max_connections=max_concurrency) as http:
+
+        async def _one(i: int) -> UrlMappingResult:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    result = await _process_single_mapping_async(
+                        source_urls[i], dest_urls, sim_matrix[i], use_web_content, rate_limit, spacy_model, http
+                    )
+                except Exception as e:
+                    logger.error("Error mapping %s: %s", source_urls[i], e)
+                    result = UrlMappingResult(
+                        source=source_urls[i], destination="", confidence_score=0.0, remark="Error"
+                    )
+            completed += 1
+            if on_progress:
+                on_progress(completed, len(source_urls))
+            return result
+
+        return list(await asyncio.gather(*(_one(i) for i in range(len(source_urls)))))
@@ -1,19 +1,59 @@
 """Core sitemap downloading and parsing logic. No CLI dependencies."""
 
+from __future__ import annotations
+
+import asyncio
 import gzip
+import hashlib
+import io
 import logging
 import re
+import sqlite3
+import tempfile
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-from seo_bhishma.core._http import DEFAULT_TIMEOUT, requests_retry_session
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import IO
+from urllib.parse import urlparse
+
+from seo_bhishma.core._http import (
+    DEFAULT_TIMEOUT,
+    AsyncRetryClient,
+    HostConcurrencyLimiter,
+    async_client_scope,
+    cached_get,
+    get_rate_limiter,
+    get_session,
+)
 from seo_bhishma.models.common import ProgressCallback
-from seo_bhishma.models.site_mapper import SitemapParseResult, SitemapUrl
+from seo_bhishma.models.site_mapper import (
+    SitemapCrawlStats,
+    SitemapDiffResult,
+    SitemapParseResult,
+    SitemapUrl,
+    SitemapUrlChange,
+)
 
 logger = logging.getLogger(__name__)
 
 NAMESPACE = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
 _NS_RE = re.compile(r"^\{[^}]+\}")
+_GZIP_MAGIC = b"\x1f\x8b"
+_STREAM_BUFFER_SIZE = 64 * 1024
+# Incremental mode spools each body to hash it before parsing; beyond this it spills to disk.
+_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+# Report parse progress in batches - a callback per <url> costs more than the parse.
+_PROGRESS_EVERY = 1000
+# Precompiled ``{namespace}tag`` -> ``tag`` map, filled lazily by ``_local_name``.
+_LOCAL_NAMES: dict[object, str] = {}
+_LOCAL_NAMES_MAX = 1024
+
+# Nested-sitemap crawl defaults. The spec forbids indexes of indexes, but real
+# sites nest them anyway; the depth cap stops runaway or malicious chains.
+MAX_SITEMAP_DEPTH = 3
+DEFAULT_MAX_PER_HOST = 4
 
 
 def _strip_namespace(tree: ET.Element) -> ET.Element:
@@ -40,7 +80,7 @@ def _find(elem: ET.Element, tag: str) -> ET.Element | None:
     return elem.find(tag)
 
 
-def download_sitemap(url: str) -> ET.Element | None:
+def download_sitemap(url: str, use_cache: bool = True) -> ET.Element | None:
     """Download and parse a sitemap XML from a URL.
 
     Supports both plain .xml and .gz compressed sitemaps. Tolerates sitemaps
@@ -48,12 +88,13 @@ def download_sitemap(url: str) -> ET.Element | None:
 
     Args:
         url: Sitemap URL.
+        use_cache: Revalidate against the on-disk HTTP cache (see ``HttpCache``).
 
     Returns:
         Parsed XML root element, or None on failure.
     """
     try:
-        response = requests_retry_session().get(url, stream=True, timeout=DEFAULT_TIMEOUT)
+        response = _limited_get(url, use_cache)
         response.raise_for_status()
         if url.endswith(".gz"):
             with gzip.GzipFile(fileobj=response.raw) as f:
@@ -72,6 +113,55 @@ def download_sitemap(url: str) -> ET.Element | None:
         return None
 
 
+def _local_name(tag: object) -> str:
+    """Return an element tag without its ``{namespace}`` prefix.
+
+    Comments and processing instructions have non-string tags; they map to ``""``.
+    Results are memoized: a sitemap only uses a handful of distinct tags.
+    """
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = tag.rpartition("}")[2] if isinstance(tag, str) else ""
+        if len(_LOCAL_NAMES) < _LOCAL_NAMES_MAX:
+            _LOCAL_NAMES[tag] = name
+    return name
+
+
+def _child_texts(elem: ET.Element) -> dict[str, str]:
+    """Map each direct child's local tag name to its stripped text."""
+    return {_local_name(child.tag): (child.text or "").strip() for child in elem}
+
+
+def _url_from_element(url_elem: ET.Element, sitemap_name: str) -> SitemapUrl | None:
+    """Build a ``SitemapUrl`` from a ``<url>`` element in a single pass over its children.
+
+    Matches on local tag names, so sitemap, image, video and news namespaces
+    (or their absence) are all handled the same way.
+    """
+    fields = {"loc": "", "lastmod": "", "changefreq": "", "priority": ""}
+    images: list[dict[str, str]] = []
+    videos: list[dict[str, str]] = []
+    news: list[dict[str, str]] = []
+
+    for child in url_elem:
+        tag = _local_name(child.tag)
+        if tag in fields:
+            fields[tag] = (child.text or "").strip()
+        elif tag == "image":
+            sub = _child_texts(child)
+            images.append({"loc": sub.get("loc", ""), "caption": sub.get("caption", "")})
+        elif tag == "video":
+            sub = _child_texts(child)
+            videos.append({"loc": sub.get("content_loc", ""), "title": sub.get("title", "")})
+        elif tag == "news":
+            sub = _child_texts(child)
+            news.append({"publication_date": sub.get("publication_date", ""), "title": sub.get("title", "")})
+
+    if not fields["loc"]:
+        return None
+    return SitemapUrl(sitemap_name=sitemap_name, images=images, videos=videos, news=news, **fields)
+
+
 def parse_url_element(url_elem: ET.Element, sitemap_name: str) -> SitemapUrl | None:
     """Parse a single <url> element from a sitemap.
 
@@ -83,51 +173,7 @@ def parse_url_element(url_elem: ET.Element, sitemap_name: str) -> SitemapUrl | N
         SitemapUrl model, or None on parse failure.
     """
     try:
-        loc_el = _find(url_elem, "loc")
-        if loc_el is None or loc_el.text is None:
-            return None
-
-        def _text(tag: str) -> str:
-            el = _find(url_elem, tag)
-            return el.text if el is not None and el.text else ""
-
-        images = []
-        for img in _findall(url_elem, "image"):
-            img_loc = _find(img, "loc")
-            img_caption = _find(img, "caption")
-            images.append({
-                "loc": img_loc.text if img_loc is not None and img_loc.text else "",
-                "caption": img_caption.text if img_caption is not None and img_caption.text else "",
-            })
-
-        videos = []
-        for vid in _findall(url_elem, "video"):
-            vid_loc = _find(vid, "content_loc")
-            vid_title = _find(vid, "title")
-            videos.append({
-                "loc": vid_loc.text if vid_loc is not None and vid_loc.text else "",
-                "title": vid_title.text if vid_title is not None and vid_title.text else "",
-            })
-
-        news = []
-        for news_item in _findall(url_elem, "news"):
-            pub_date = _find(news_item, "publication_date")
-            title = _find(news_item, "title")
-            news.append({
-                "publication_date": pub_date.text if pub_date is not None and pub_date.text else "",
-                "title": title.text if title is not None and title.text else "",
-            })
-
-        return SitemapUrl(
-            sitemap_name=sitemap_name,
-            loc=loc_el.text,
-            lastmod=_text("lastmod"),
-            changefreq=_text("changefreq"),
-            priority=_text("priority"),
-            images=images,
-            videos=videos,
-            news=news,
-        )
+        return _url_from_element(url_elem, sitemap_name)
     except Exception as e:
         logger.error("Error parsing URL element: %s", e)
         return None
@@ -138,88 +184,610 @@ def parse_sitemap(
     sitemap_name: str,
     max_workers: int = 10,
     on_progress: ProgressCallback | None = None,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    max_depth: int = MAX_SITEMAP_DEPTH,
+    use_cache: bool = True,
 ) -> SitemapParseResult:
     """Parse a sitemap root element, recursively handling nested sitemaps.
 
+    ``<url>`` rows are extracted in one pass over the root's children (no
+    per-element threads: the work is CPU-bound under the GIL). Child
+    sitemaps of an index are fetched concurrently (see ``iter_sitemap_urls``);
+    their URLs keep index order.
+
     Args:
         root: The XML root element (urlset or sitemapindex).
         sitemap_name: Name/URL of this sitemap.
-        max_workers: Thread pool size for parallel URL parsing.
-        on_progress: Optional progress callback.
+        max_workers: Max child sitemaps fetched concurrently.
+        on_progress: Optional progress callback. For a ``<urlset>`` it gets
+            ``(elements done, elements in root)``; for a ``<sitemapindex>``
+            it is invoked once per sitemap file with
+            ``(files done, files discovered, loc)``, as in ``iter_sitemap_urls``.
+        max_per_host: Max concurrent child fetches against a single host.
+        max_depth: Max index nesting depth to follow.
+        use_cache: Revalidate child sitemaps against the on-disk HTTP cache.
 
     Returns:
         SitemapParseResult with all parsed URLs.
     """
     urls: list[SitemapUrl] = []
+    nested: list[str] = []
     sitemaps_parsed = 1
-
-    # Check for nested sitemaps (sitemapindex)
-    nested = _findall(root, "sitemap")
+    # One unit per call: an index reports sitemap files (below), not its entries
+    is_index = _local_name(root.tag) == "sitemapindex"
+    element_progress = None if is_index else on_progress
+
+    total = len(root)
+    for completed, elem in enumerate(root, start=1):
+        tag = _local_name(elem.tag)
+        if tag == "url":
+            row = parse_url_element(elem, sitemap_name)
+            if row is not None:
+                urls.append(row)
+        elif tag == "sitemap":
+            loc = _child_texts(elem).get("loc")
+            if loc:
+                nested.append(loc)
+        if element_progress and (completed % _PROGRESS_EVERY == 0 or completed == total):
+            element_progress(completed, total)
+
+    # Follow nested sitemaps (sitemapindex)
     if nested:
-        logger.info("Found %d nested sitemaps in %s", len(nested), sitemap_name)
-        for sitemap_el in nested:
-            loc_el = _find(sitemap_el, "loc")
-            if loc_el is None or loc_el.text is None:
-                continue
-            child_root = download_sitemap(loc_el.text)
-            if child_root:
-                child_result = parse_sitemap(child_root, loc_el.text, max_workers, on_progress)
-                urls.extend(child_result.urls)
-                sitemaps_parsed += child_result.total_sitemaps_parsed
-    else:
-        # Parse URL elements
-        url_elements = _findall(root, "url")
-        total = len(url_elements)
-        completed = 0
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(parse_url_element, elem, sitemap_name): elem
-                for elem in url_elements
-            }
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    urls.append(result)
-                completed += 1
-                if on_progress:
-                    on_progress(completed, total)
+        stats = SitemapCrawlStats()
+        file_progress = on_progress if is_index else None
+        crawler = _NestedSitemapCrawler(stats, file_progress, max_workers, max_per_host, max_depth, use_cache)
+        try:
+            crawler.schedule([sitemap_name], depth=0)
+            children = crawler.schedule(nested, depth=1, parent=sitemap_name)
+            crawler.advance(sitemap_name)
+            urls.extend(crawler.crawl(children, depth=1))
+        finally:
+            crawler.close()
+        sitemaps_parsed += stats.sitemaps_parsed
 
     return SitemapParseResult(urls=urls, total_sitemaps_parsed=sitemaps_parsed)
 
 
+def _limited_get(url: str, use_cache: bool):
+    """Streamed (cached) GET paced by the shared per-host rate limiter."""
+    limiter = get_rate_limiter()
+    limiter.acquire(url)
+    response = cached_get(url, session=get_session(), use_cache=use_cache, stream=True, timeout=DEFAULT_TIMEOUT)
+    limiter.record_response(url, response)
+    return response
+
+
+@contextmanager
+def _open_sitemap_stream(url: str, use_cache: bool = True) -> Iterator[IO[bytes]]:
+    """Open a sitemap URL as an incrementally-read byte stream.
+
+    The body is never buffered whole: ``Content-Encoding`` is decoded by
+    urllib3 as it is read (or was decoded when the HTTP cache stored it),
+    and gzipped payloads (``.gz`` files, or any body starting with the gzip
+    magic bytes) are decompressed on the fly.
+    """
+    response = _limited_get(url, use_cache)
+    try:
+        response.raise_for_status()
+        if hasattr(response.raw, "decode_content"):
+            response.raw.decode_content = True
+        body: IO[bytes] = io.BufferedReader(response.raw, buffer_size=_STREAM_BUFFER_SIZE)
+        if body.peek(2)[:2] == _GZIP_MAGIC:
+            body = gzip.GzipFile(fileobj=body)
+        yield body
+    finally:
+        response.close()
+
+
+def _iter_sitemap_file(body: IO[bytes], sitemap_name: str, child_locs: list[str]) -> Iterator[SitemapUrl]:
+    """Stream ``<url>`` rows out of one sitemap document.
+
+    ``<sitemap>`` entries of an index are appended to ``child_locs`` instead
+    of being yielded. Each top-level element is cleared from the root once
+    handled, so memory stays flat regardless of document size.
+    """
+    root: ET.Element | None = None
+    for event, elem in ET.iterparse(body, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end":
+            continue
+        tag = _local_name(elem.tag)
+        if tag == "url":
+            row = _url_from_element(elem, sitemap_name)
+            if row is not None:
+                yield row
+            root.clear()
+        elif tag == "sitemap":
+            loc = _child_texts(elem).get("loc")
+            if loc:
+                child_locs.append(loc)
+            root.clear()
+
+
+class _NestedSitemapCrawler:
+    """Fetch the children of sitemap indexes concurrently, yielding rows in index order.
+
+    Children are downloaded on a shared thread pool with at most
+    ``max_workers`` files in flight per index level and ``max_per_host``
+    against any one origin. A fetched child is buffered whole (a single
+    file is capped at 50k URLs by the spec), so memory scales with the
+    worker count rather than with the size of the index. Locations already
+    seen are skipped, which breaks cycles between indexes that reference
+    each other.
+
+    With a ``fingerprints`` store, each fetched file is hashed before it is
+    parsed and unchanged non-index files are skipped outright (see
+    ``diff_sitemap``).
+    """
+
+    def __init__(
+        self,
+        stats: SitemapCrawlStats,
+        on_progress: ProgressCallback | None,
+        max_workers: int,
+        max_per_host: int,
+        max_depth: int,
+        use_cache: bool = True,
+        fingerprints: SitemapFingerprintStore | None = None,
+    ) -> None:
+        self._stats = stats
+        self._on_progress = on_progress
+        self._max_workers = max(1, max_workers)
+        self._max_depth = max_depth
+        self._use_cache = use_cache
+        self._fingerprints = fingerprints
+        self._limiter = HostConcurrencyLimiter(max_per_host)
+        self._seen: set[str] = set()
+        self._discovered = 0
+        self._done = 0
+        self._pool: ThreadPoolExecutor | None = None
+
+    def schedule(self, locs: list[str], depth: int, parent: str = "") -> list[str]:
+        """Filter ``locs`` down to the unseen ones allowed at ``depth`` and count them as discovered."""
+        if not locs:
+            return []
+        if depth > self._max_depth:
+            logger.warning(
+                "Skipping %d nested sitemaps in %s: depth limit %d reached", len(locs), parent, self._max_depth
+            )
+            return []
+        fresh: list[str] = []
+        for loc in locs:
+            if loc in self._seen:
+                logger.debug("Skipping already-seen sitemap %s", loc)
+                continue
+            self._seen.add(loc)
+            fresh.append(loc)
+        if parent:
+            logger.info("Found %d nested sitemaps in %s", len(fresh), parent)
+        self._discovered += len(fresh)
+        return fresh
+
+    def advance(self, loc: str) -> None:
+        """Mark one sitemap file as finished and report progress."""
+        self._done += 1
+        if self._on_progress:
+            self._on_progress(self._done, self._discovered, loc)
+
+    def crawl(self, locs: list[str], depth: int, parent: str = "") -> Iterator[SitemapUrl]:
+        """Yield the rows of each sitemap in ``locs`` (children of index ``parent``), in order."""
+        if not locs:
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers)
+        pending = iter(locs)
+        window: deque[tuple[str, Future]] = deque()
+
+        def _fill() -> None:
+            for loc in pending:
+                window.append((loc, self._pool.submit(self._fetch, loc)))
+                if len(window) >= self._max_workers:
+                    return
+
+        _fill()
+        while window:
+            loc, future = window.popleft()
+            _fill()
+            try:
+                rows, child_locs, digest = future.result()
+            except Exception as e:
+                logger.error("Error streaming sitemap %s: %s", loc, e)
+                self._stats.failed_sitemaps.append(loc)
+                rows, child_locs, digest = [], [], None
+            else:
+                if rows is None:
+                    self._stats.sitemaps_skipped += 1
+                    self._fingerprints.keep_sitemap(loc)
+                    rows = []
+                else:
+                    self._stats.sitemaps_parsed += 1
+                    if self._fingerprints is not None:
+                        self._fingerprints.record_sitemap(loc, digest, is_index=bool(child_locs), parent=parent)
+            children = self.schedule(child_locs, depth + 1, parent=loc)
+            for row in rows:
+                self._stats.urls_found += 1
+                yield row
+            self.advance(loc)
+            yield from self.crawl(children, depth + 1, parent=loc)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(self, loc: str) -> tuple[list[SitemapUrl] | None, list[str], str]:
+        """Download and parse one file. Rows are None when its fingerprint is unchanged."""
+        child_locs: list[str] = []
+        digest = ""
+        with self._limiter.slot(loc), _open_sitemap_stream(loc, self._use_cache) as body:
+            if self._fingerprints is None:
+                return list(_iter_sitemap_file(body, loc, child_locs)), child_locs, digest
+            with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY) as spool:
+                hasher = hashlib.sha256()
+                for chunk in iter(lambda: body.read(_STREAM_BUFFER_SIZE), b""):
+                    hasher.update(chunk)
+                    spool.write(chunk)
+                digest = hasher.hexdigest()
+                if self._fingerprints.is_unchanged(loc, digest):
+                    return None, [], digest
+                spool.seek(0)
+                rows = list(_iter_sitemap_file(spool, loc, child_locs))
+        return rows, child_locs, digest
+
+
+def iter_sitemap_urls(
+    sitemap_url: str,
+    stats: SitemapCrawlStats | None = None,
+    on_progress: ProgressCallback | None = None,
+    max_workers: int = 10,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    max_depth: int = MAX_SITEMAP_DEPTH,
+    use_cache: bool = True,
+) -> Iterator[SitemapUrl]:
+    """Stream every URL from a sitemap, following nested sitemap indexes.
+
+    Unlike ``download_and_parse_sitemap`` this never holds a whole document
+    or result list in memory: bodies are read incrementally with
+    ``iterparse`` and each row is yielded as soon as its ``<url>`` closes.
+    Child sitemaps of an index are fetched concurrently but still yielded
+    in index order. Sitemaps that fail to download or parse are logged and
+    skipped; repeated locations and chains deeper than ``max_depth`` are
+    not followed.
+
+    Args:
+        sitemap_url: URL of the sitemap or sitemap index.
+        stats: Optional counters, updated in place as the crawl progresses.
+        on_progress: Optional callback, invoked once per sitemap file with
+            (files done, files discovered so far, sitemap URL).
+        max_workers: Max child sitemaps fetched concurrently.
+        max_per_host: Max concurrent child fetches against a single host.
+        max_depth: Max index nesting depth to follow.
+        use_cache: Revalidate sitemaps against the on-disk HTTP cache, so
+            unchanged files cost a ``304`` round trip instead of a download.
+
+    Yields:
+        SitemapUrl rows in document order.
+    """
+    stats = stats if stats is not None else SitemapCrawlStats()
+    crawler = _NestedSitemapCrawler(stats, on_progress, max_workers, max_per_host, max_depth, use_cache)
+    try:
+        crawler.schedule([sitemap_url], depth=0)
+        child_locs: list[str] = []
+        try:
+            with _open_sitemap_stream(sitemap_url, use_cache) as body:
+                for row in _iter_sitemap_file(body, sitemap_url, child_locs):
+                    stats.urls_found += 1
+                    yield row
+            stats.sitemaps_parsed += 1
+        except Exception as e:
+            logger.error("Error streaming sitemap %s: %s", sitemap_url, e)
+            stats.failed_sitemaps.append(sitemap_url)
+        children = crawler.schedule(child_locs, depth=1, parent=sitemap_url)
+        crawler.advance(sitemap_url)
+        yield from crawler.crawl(children, depth=1)
+    finally:
+        crawler.close()
+
+
 def download_and_parse_sitemap(
     sitemap_url: str,
     max_workers: int = 10,
     on_progress: ProgressCallback | None = None,
+    use_cache: bool = True,
 ) -> SitemapParseResult | None:
     """Download and fully parse a sitemap, including nested sitemaps.
 
-    This is the main entry point for sitemap parsing.
+    This is the main entry point for sitemap parsing. It is built on
+    ``iter_sitemap_urls``, so only the resulting rows are held in memory -
+    callers that can consume rows one at a time should use that directly.
 
     Args:
         sitemap_url: URL of the sitemap.
-        max_workers: Thread pool size.
-        on_progress: Optional progress callback.
+        max_workers: Max child sitemaps fetched concurrently.
+        on_progress: Optional progress callback, invoked once per sitemap file.
+        use_cache: Revalidate sitemaps against the on-disk HTTP cache.
 
     Returns:
         SitemapParseResult, or None if download fails.
     """
-    root = download_sitemap(sitemap_url)
-    if root is None:
+    stats = SitemapCrawlStats()
+    urls = list(
+        iter_sitemap_urls(
+            sitemap_url, stats=stats, on_progress=on_progress, max_workers=max_workers, use_cache=use_cache
+        )
+    )
+    if stats.sitemaps_parsed == 0:
         return None
-    result = parse_sitemap(root, sitemap_url, max_workers, on_progress)
-    if len(result.urls) > 50000:
+    if len(urls) > 50000:
         # Spec recommends max 50k URLs per sitemap file (this is the aggregate)
         logger.warning(
             "Parsed %d URLs from %s - exceeds the 50,000 per-file sitemap spec limit",
-            len(result.urls),
+            len(urls),
             sitemap_url,
         )
-    return result
+    return SitemapParseResult(urls=urls, total_sitemaps_parsed=stats.sitemaps_parsed)
+
+
+def _parse_sitemap_bytes(data: bytes, sitemap_name: str) -> tuple[list[SitemapUrl], list[str]]:
+    """Parse a fully downloaded (possibly gzipped) sitemap into rows and child sitemap locations."""
+    body: IO[bytes] = io.BytesIO(data)
+    if data[:2] == _GZIP_MAGIC:
+        body = gzip.GzipFile(fileobj=body)
+    child_locs: list[str] = []
+    rows = list(_iter_sitemap_file(body, sitemap_name, child_locs))
+    return rows, child_locs
+
+
+async def download_and_parse_sitemap_async(
+    sitemap_url: str,
+    max_concurrency: int = 10,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    max_depth: int = MAX_SITEMAP_DEPTH,
+    on_progress: ProgressCallback | None = None,
+    client: AsyncRetryClient | None = None,
+) -> SitemapParseResult | None:
+    """Async ``download_and_parse_sitemap`` on the async transport.
+
+    Child sitemaps are fetched concurrently on the event loop (at most
+    ``max_concurrency`` at once, ``max_per_host`` per host) and parsed in
+    a worker thread, so parsing never stalls other downloads. Rows come
+    back in index order, with the same cycle and depth rules as
+    ``iter_sitemap_urls``. Bodies are read whole and the on-disk HTTP
+    cache is not consulted.
+
+    Args:
+        sitemap_url: URL of the sitemap or sitemap index.
+        max_concurrency: Max sitemap files downloading at once.
+        max_per_host: Max concurrent downloads against a single host.
+        max_depth: Max index nesting depth to follow.
+        on_progress: Optional callback, invoked once per sitemap file with
+            (files done, files discovered so far, sitemap URL).
+        client: Client to share; a temporary one is used when None.
+
+    Returns:
+        SitemapParseResult, or None if no sitemap could be parsed.
+    """
+    stats = SitemapCrawlStats()
+    seen = {sitemap_url}
+    progress = {"done": 0, "discovered": 1}
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    limiter = get_rate_limiter()
+    host_slots: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(max(1, max_per_host)))
+
+    async with async_client_scope(client, max_connections=max_concurrency) as http:
+
+        async def crawl(loc: str, depth: int) -> list[SitemapUrl]:
+            try:
+                async with host_slots[urlparse(loc).netloc], semaphore:
+                    await limiter.acquire_async(loc)
+                    response = await http.get(loc, timeout=DEFAULT_TIMEOUT)
+                limiter.record_response(loc, response)
+                response.raise_for_status()
+                rows, child_locs = await asyncio.to_thread(_parse_sitemap_bytes, response.content, loc)
+            except Exception as e:
+                logger.error("Error streaming sitemap %s: %s", loc, e)
+                stats.failed_sitemaps.append(loc)
+                rows, child_locs = [], []
+            else:
+                stats.sitemaps_parsed += 1
+                stats.urls_found += len(rows)
+
+            children = []
+            if depth < max_depth:
+                for child in child_locs:
+                    if child not in seen:
+                        seen.add(child)
+                        children.append(child)
+            progress["discovered"] += len(children)
+            progress["done"] += 1
+            if on_progress:
+                on_progress(progress["done"], progress["discovered"], loc)
+
+            nested = await asyncio.gather(*(crawl(child, depth + 1) for child in children))
+            return rows + [row for child_rows in nested for row in child_rows]
+
+        urls = await crawl(sitemap_url, 0)
+
+    if stats.sitemaps_parsed == 0:
+        return None
+    return SitemapParseResult(urls=urls, total_sitemaps_parsed=stats.sitemaps_parsed)
+
+
+# ---------------------------------------------------------------------------
+# Incremental crawls
+# ---------------------------------------------------------------------------
+
+
+class SitemapFingerprintStore:
+    """SQLite record of the previous crawl, used by ``diff_sitemap``.
+
+    Holds a content hash (and the index it was listed in) per sitemap file
+    and ``loc -> lastmod`` per URL.
+    Every crawl is a numbered run: URLs seen (or carried over from a skipped,
+    unchanged sitemap) are stamped with the run number, and anything left
+    with an older stamp when the run finishes has been removed. Nothing is
+    committed until ``finish_run``, so an aborted crawl leaves the previous
+    state intact.
+
+    Sitemap hashes are mirrored in memory so crawler worker threads can check
+    them; all SQLite access stays on the thread that opened the store.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS sitemaps (
+                loc TEXT PRIMARY KEY, content_hash TEXT NOT NULL, is_index INTEGER NOT NULL, run INTEGER NOT NULL,
+                parent TEXT NOT NULL DEFAULT ''
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                loc TEXT PRIMARY KEY, lastmod TEXT NOT NULL, sitemap TEXT NOT NULL, run INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS urls_by_sitemap ON urls (sitemap);
+            """
+        )
+        columns = {r[1] for r in self._conn.execute("PRAGMA table_info(sitemaps)")}
+        if "parent" not in columns:  # Stores written before parents were tracked
+            self._conn.execute("ALTER TABLE sitemaps ADD COLUMN parent TEXT NOT NULL DEFAULT ''")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sitemaps_by_parent ON sitemaps (parent)")
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'run'").fetchone()
+        self._run = (row[0] if row else 0) + 1
+        # Index files are never skipped: their children must be visited either way.
+        self._hashes = dict(self._conn.execute("SELECT loc, content_hash FROM sitemaps WHERE is_index = 0"))
+
+    def __enter__(self) -> SitemapFingerprintStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def is_unchanged(self, loc: str, content_hash: str) -> bool:
+        """True when ``loc`` is a non-index sitemap whose content matches the previous run."""
+        return self._hashes.get(loc) == content_hash
+
+    def record_sitemap(self, loc: str, content_hash: str, is_index: bool, parent: str = "") -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sitemaps (loc, content_hash, is_index, run, parent) VALUES (?, ?, ?, ?, ?)",
+            (loc, content_hash, int(is_index), self._run, parent),
+        )
+
+    def keep_sitemap(self, loc: str) -> None:
+        """Carry an unchanged (or unreachable) sitemap and its URLs over into this run.
+
+        For an index, every sitemap recorded beneath it on the previous run
+        is carried over too, since none of them were reached this time.
+        """
+        subtree = (
+            "WITH RECURSIVE tree(loc) AS ("
+            " SELECT ? UNION SELECT sitemaps.loc FROM sitemaps JOIN tree ON sitemaps.parent = tree.loc"
+            ") "
+        )
+        self._conn.execute(subtree + "UPDATE sitemaps SET run = ? WHERE loc IN tree", (loc, self._run))
+        self._conn.execute(subtree + "UPDATE urls SET run = ? WHERE sitemap IN tree", (loc, self._run))
+
+    def observe(self, row: SitemapUrl) -> SitemapUrlChange | None:
+        """Record a crawled URL and return its change against the previous run, if any."""
+        prev = self._conn.execute("SELECT lastmod, run FROM urls WHERE loc = ?", (row.loc,)).fetchone()
+        if prev is not None and prev[1] == self._run:
+            return None  # Listed in more than one sitemap this run
+        self._conn.execute(
+            "INSERT OR REPLACE INTO urls (loc, lastmod, sitemap, run) VALUES (?, ?, ?, ?)",
+            (row.loc, row.lastmod, row.sitemap_name, self._run),
+        )
+        if prev is None:
+            return SitemapUrlChange(change="added", loc=row.loc, sitemap_name=row.sitemap_name, lastmod=row.lastmod)
+        if prev[0] != row.lastmod:
+            return SitemapUrlChange(
+                change="modified",
+                loc=row.loc,
+                sitemap_name=row.sitemap_name,
+                lastmod=row.lastmod,
+                previous_lastmod=prev[0],
+            )
+        return None
+
+    def finish_run(self) -> Iterator[SitemapUrlChange]:
+        """Yield URLs missing from this run, then drop them and commit the run."""
+        stale = self._conn.execute("SELECT loc, lastmod, sitemap FROM urls WHERE run < ?", (self._run,))
+        for loc, lastmod, sitemap in stale:
+            yield SitemapUrlChange(change="removed", loc=loc, sitemap_name=sitemap, previous_lastmod=lastmod)
+        self._conn.execute("DELETE FROM urls WHERE run < ?", (self._run,))
+        self._conn.execute("DELETE FROM sitemaps WHERE run < ?", (self._run,))
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('run', ?)", (self._run,))
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database, discarding any unfinished run."""
+        self._conn.rollback()
+        self._conn.close()
+
+
+def diff_sitemap(
+    sitemap_url: str,
+    store_path: str,
+    max_workers: int = 10,
+    on_progress: ProgressCallback | None = None,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    max_depth: int = MAX_SITEMAP_DEPTH,
+    use_cache: bool = True,
+) -> SitemapDiffResult | None:
+    """Crawl a sitemap and return only what changed since the previous crawl.
+
+    The previous crawl is read from (and this one written to) the
+    fingerprint store at ``store_path``. Child sitemaps whose content hash
+    is unchanged are not parsed at all, so the work is proportional to the
+    number of changed files. The first run against an empty store reports
+    every URL as added. URL sitemaps that fail to download keep their previous
+    URLs rather than reporting them all as removed.
+
+    Args:
+        sitemap_url: URL of the sitemap or sitemap index.
+        store_path: SQLite file holding the fingerprints (created if missing).
+        max_workers: Max sitemaps fetched concurrently.
+        on_progress: Optional progress callback, invoked once per sitemap file.
+        max_per_host: Max concurrent fetches against a single host.
+        max_depth: Max index nesting depth to follow.
+        use_cache: Revalidate sitemaps against the on-disk HTTP cache.
+
+    Returns:
+        SitemapDiffResult, or None if the root sitemap could not be fetched
+        (the store is left untouched).
+    """
+    stats = SitemapCrawlStats()
+    changes: list[SitemapUrlChange] = []
+    with SitemapFingerprintStore(store_path) as store:
+        crawler = _NestedSitemapCrawler(
+            stats, on_progress, max_workers, max_per_host, max_depth, use_cache, fingerprints=store
+        )
+        try:
+            roots = crawler.schedule([sitemap_url], depth=0)
+            for row in crawler.crawl(roots, depth=0):
+                change = store.observe(row)
+                if change is not None:
+                    changes.append(change)
+        finally:
+            crawler.close()
+
+        if sitemap_url in stats.failed_sitemaps:
+            return None
+        for loc in stats.failed_sitemaps:
+            store.keep_sitemap(loc)
+        changes.extend(store.finish_run())
 
+    return SitemapDiffResult(
+        changes=changes,
+        added=sum(1 for c in changes if c.change == "added"),
+        removed=sum(1 for c in changes if c.change == "removed"),
+        modified=sum(1 for c in changes if c.change == "modified"),
+        sitemaps_parsed=stats.sitemaps_parsed,
+        sitemaps_skipped=stats.sitemaps_skipped,
+    )
 
-def discover_sitemaps_from_robots(domain: str) -> list[str]:
+
+def discover_sitemaps_from_robots(domain: str, use_cache: bool = True) -> list[str]:
     """Discover sitemap URLs declared in a domain's robots.txt.
 
     Tries https/http and with/without www prefix. Falls back to
@@ -227,41 +795,79 @@ def discover_sitemaps_from_robots(domain: str) -> list[str]:
 
     Args:
         domain: Bare domain (no scheme), e.g. ``"example.com"``.
+        use_cache: Revalidate robots.txt against the on-disk HTTP cache.
 
     Returns:
         Ordered list of discovered sitemap URLs (deduplicated).
     """
-    candidates = [
-        f"https://{domain}/robots.txt",
-        f"https://www.{domain}/robots.txt",
-        f"http://{domain}/robots.txt",
-    ]
-    session = requests_retry_session()
+    session = get_session()
     discovered: list[str] = []
-    seen: set[str] = set()
     fetched = False
-    for url in candidates:
+    for url in _robots_candidates(domain):
         try:
-            r = session.get(url, timeout=DEFAULT_TIMEOUT)
+            r = cached_get(url, session=session, use_cache=use_cache, timeout=DEFAULT_TIMEOUT)
             if r.status_code == 200 and r.text.strip():
                 fetched = True
-                for line in r.text.splitlines():
-                    line = line.strip()
-                    if line.lower().startswith("sitemap"):
-                        parts = line.split(":", 1)
-                        if len(parts) == 2:
-                            sm = parts[1].strip()
-                            if sm and sm not in seen:
-                                seen.add(sm)
-                                discovered.append(sm)
+                discovered = _sitemaps_from_robots(r.text)
                 break
         except Exception as e:
             logger.debug("robots.txt fetch failed for %s: %s", url, e)
 
-    if not discovered:
-        fallback = f"https://{domain}/sitemap.xml"
-        if fetched:
-            logger.info("No Sitemap: directive in robots.txt; falling back to %s", fallback)
-        discovered.append(fallback)
+    return discovered or [_fallback_sitemap(domain, fetched)]
+
+
+async def discover_sitemaps_from_robots_async(domain: str, client: AsyncRetryClient | None = None) -> list[str]:
+    """Async ``discover_sitemaps_from_robots`` on the async transport (no on-disk HTTP cache).
+
+    Args:
+        domain: Bare domain (no scheme), e.g. ``"example.com"``.
+        client: Client to share across calls; a temporary one is used when None.
+
+    Returns:
+        Ordered list of discovered sitemap URLs (deduplicated).
+    """
+    discovered: list[str] = []
+    fetched = False
+    async with async_client_scope(client) as http:
+        for url in _robots_candidates(domain):
+            try:
+                r = await http.get(url, timeout=DEFAULT_TIMEOUT)
+                if r.status_code == 200 and r.text.strip():
+                    fetched = True
+                    discovered = _sitemaps_from_robots(r.text)
+                    break
+            except Exception as e:
+                logger.debug("robots.txt fetch failed for %s: %s", url, e)
+
+    return discovered or [_fallback_sitemap(domain, fetched)]
+
+
+def _robots_candidates(domain: str) -> list[str]:
+    return [
+        f"https://{domain}/robots.txt",
+        f"https://www.{domain}/robots.txt",
+        f"http://{domain}/robots.txt",
+    ]
 
+
+def _sitemaps_from_robots(text: str) -> list[str]:
+    """``Sitemap:`` directives of a robots.txt, deduplicated in order."""
+    discovered: list[str] = []
+    seen: set[str] = set()
+    for line in text.splitlines():
+        line = line.strip()
+        if line.lower().startswith("sitemap"):
+            parts = line.split(":", 1)
+            if len(parts) == 2:
+                sm = parts[1].strip()
+                if sm and sm not in seen:
+                    seen.add(sm)
+                    discovered.append(sm)
     return discovered
+
+
+def _fallback_sitemap(domain: str, robots_fetched: bool) -> str:
+    fallback = f"https://{domain}/sitemap.xml"
+    if robots_fetched:
+        logger.info("No Sitemap: directive in robots.txt; falling back to %s", fallback)
+    return fallback
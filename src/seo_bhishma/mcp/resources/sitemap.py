@@ -21,15 +21,19 @@ def register(mcp: FastMCP) -> None:
         """Return parsed URLs for the given sitemap (JSON).
 
         The path segment is URL-decoded so that callers may pass an encoded
-        full sitemap URL.
+        full sitemap URL. Rows are serialized as they stream in, so only the
+        JSON text is held in memory, never the parsed XML or model objects.
         """
-        from seo_bhishma.core.site_mapper import download_and_parse_sitemap
+        from seo_bhishma.core.site_mapper import iter_sitemap_urls
+        from seo_bhishma.models.site_mapper import SitemapCrawlStats
 
         decoded = unquote(sitemap_url)
-        result = download_and_parse_sitemap(decoded)
-        if result is None:
+        stats = SitemapCrawlStats()
+        rows = [u.model_dump_json() for u in iter_sitemap_urls(decoded, stats=stats)]
+        if stats.sitemaps_parsed == 0:
             return json.dumps({"error": "Failed to download or parse sitemap", "url": decoded})
-        return result.model_dump_json()
+        # Same shape as ``SitemapParseResult.model_dump_json()``
+        return f'{{"urls":[{",".join(rows)}],"total_sitemaps_parsed":{stats.sitemaps_parsed}}}'
 
     @mcp.resource("seo://robots/{domain}")
     def robots_resource(domain: str) -> str:
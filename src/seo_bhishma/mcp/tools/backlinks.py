@@ -7,7 +7,7 @@ def register(mcp: FastMCP) -> None:
     """Register backlink tools with the MCP server."""
 
     @mcp.tool()
-    def check_backlink(
+    async def check_backlink(
         backlink_url: str,
         target_url: str,
         expected_anchor: str = "",
@@ -22,13 +22,13 @@ def register(mcp: FastMCP) -> None:
         Returns:
             Dict with status, anchor_status, link_exists, and actual_anchor_text.
         """
-        from seo_bhishma.core.link_sniper import check_backlink as _check
+        from seo_bhishma.core.link_sniper import check_backlink_async
 
-        result = _check(backlink_url, target_url, expected_anchor)
+        result = await check_backlink_async(backlink_url, target_url, expected_anchor)
         return result.model_dump()
 
     @mcp.tool()
-    def batch_check_backlinks(
+    async def batch_check_backlinks(
         checks: list[dict],
         max_workers: int = 10,
     ) -> list[dict]:
@@ -36,14 +36,14 @@ def register(mcp: FastMCP) -> None:
 
         Args:
             checks: List of dicts with keys: backlink_url, target_url, expected_anchor (optional).
-            max_workers: Number of parallel workers.
+            max_workers: Max requests in flight at once.
 
         Returns:
             List of backlink check results.
         """
-        from seo_bhishma.core.link_sniper import batch_check_backlinks as _batch
+        from seo_bhishma.core.link_sniper import batch_check_backlinks_async
         from seo_bhishma.models.link_sniper import BacklinkCheckRequest
 
         requests = [BacklinkCheckRequest(**c) for c in checks]
-        results = _batch(requests, max_workers=max_workers)
+        results = await batch_check_backlinks_async(requests, max_concurrency=max_workers)
         return [r.model_dump() for r in results]
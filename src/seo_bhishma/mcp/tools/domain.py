@@ -219,7 +219,7 @@ def register(mcp: FastMCP) -> None:
         return _get_cert(domain, port=port).model_dump()
 
     @mcp.tool()
-    def get_security_headers(domain: str) -> dict:
+    async def get_security_headers(domain: str) -> dict:
         """Audit a domain's HTTP security response headers.
 
         Checks HSTS, CSP, X-Frame-Options, X-Content-Type-Options,
@@ -232,6 +232,6 @@ def register(mcp: FastMCP) -> None:
         Returns:
             Dict with headers present, missing headers list, and grade.
         """
-        from seo_bhishma.core.domain_insight import get_security_headers as _get_sec
+        from seo_bhishma.core.domain_insight import get_security_headers_async
 
-        return _get_sec(domain).model_dump()
+        return (await get_security_headers_async(domain)).model_dump()
@@ -9,20 +9,23 @@ def register(mcp: FastMCP) -> None:
     @mcp.tool()
     def check_indexing_status(
         url: str,
-        method: str = "htmlsession",
+        method: str = "http",
         rate_limit: float = 0,
         headless: bool = False,
+        use_cache: bool = True,
     ) -> dict:
         """Check if a URL is indexed in Google.
 
         Args:
             url: URL to check indexing status for.
-            method: Check method - "htmlsession" or "playwright".
+            method: Check method - "http" (raw HTML, renders only when ambiguous),
+                "htmlsession" or "playwright".
             rate_limit: Delay in seconds after the check.
             headless: Run browser in headless mode (playwright only).
+            use_cache: Return a recent cached result instead of querying Google.
 
         Returns:
-            Dict with url, status, and proxy_used.
+            Dict with url, status, proxy_used, and cached.
         """
         from seo_bhishma.core.index_spy import check_indexing_status as _check
         from seo_bhishma.models.index_spy import CheckMethod
@@ -32,25 +35,34 @@ def register(mcp: FastMCP) -> None:
             method=CheckMethod(method),
             rate_limit=rate_limit,
             headless=headless,
+            use_cache=use_cache,
         )
         return result.model_dump()
 
     @mcp.tool()
     def batch_check_indexing(
         urls: list[str],
-        method: str = "htmlsession",
+        method: str = "http",
         rate_limit: float = 0,
         headless: bool = False,
         max_captcha_retries: int = 3,
+        workers: int = 8,
+        use_cache: bool = True,
+        grouped: bool = False,
     ) -> dict:
         """Check indexing status for multiple URLs.
 
         Args:
             urls: List of URLs to check.
-            method: Check method - "htmlsession" or "playwright".
-            rate_limit: Delay between checks in seconds.
+            method: Check method - "http" (raw HTML, renders only when ambiguous),
+                "htmlsession" or "playwright".
+            rate_limit: Delay between checks on the same proxy in seconds.
             headless: Run browser in headless mode (playwright only).
             max_captcha_retries: Max CAPTCHA failures before stopping.
+            workers: Max proxies checked from concurrently.
+            use_cache: Answer recently checked URLs from the result cache.
+            grouped: First confirm URLs sharing a host/path prefix with bulk
+                site: queries, then check only the rest one by one.
 
         Returns:
             Dict with results list and summary counts.
@@ -64,5 +76,8 @@ def register(mcp: FastMCP) -> None:
             rate_limit=rate_limit,
             headless=headless,
             max_captcha_retries=max_captcha_retries,
+            workers=workers,
+            use_cache=use_cache,
+            grouped=grouped,
         )
         return result.model_dump()
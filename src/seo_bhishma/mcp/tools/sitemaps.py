@@ -15,7 +15,7 @@ def register(mcp: FastMCP) -> None:
 
         Args:
             sitemap_url: URL of the sitemap to download.
-            max_workers: Number of parallel workers for parsing.
+            max_workers: Number of nested sitemaps fetched in parallel.
 
         Returns:
             Dict with urls (list of URL entries) and total_sitemaps_parsed count.
@@ -79,6 +79,7 @@ def register(mcp: FastMCP) -> None:
         frequency: str = "",
         lastmod: str = "",
         compressed: bool = False,
+        hash_partitions: int = 0,
     ) -> dict:
         """Generate multiple sitemap files plus an index, splitting large URL lists.
 
@@ -90,6 +91,8 @@ def register(mcp: FastMCP) -> None:
             frequency: Default change frequency.
             lastmod: Default last modified date.
             compressed: Gzip output files.
+            hash_partitions: If > 0, shard URLs by hash into this many stable
+                partitions instead of filling shards in order.
 
         Returns:
             Dict with sitemap_files and sitemap_index path.
@@ -106,6 +109,7 @@ def register(mcp: FastMCP) -> None:
             frequency=frequency or None,
             lastmod=lastmod or None,
             compressed=compressed,
+            hash_partitions=hash_partitions or None,
         )
         return {"sitemap_files": files, "sitemap_index": index_path}
 
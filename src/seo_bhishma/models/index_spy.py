@@ -8,6 +8,7 @@ from pydantic import BaseModel
 class CheckMethod(str, Enum):
     """Supported methods for checking indexing status."""
 
+    HTTP = "http"
     HTML_SESSION = "htmlsession"
     PLAYWRIGHT = "playwright"
 
@@ -26,11 +27,35 @@ class ProxyConfig(BaseModel):
     mode: list[str] = ["http", "https"]
 
 
+class ProxyHealth(BaseModel):
+    """Health record of one proxy, accumulated across runs."""
+
+    proxy: str
+    attempts: int = 0
+    successes: int = 0
+    captchas: int = 0
+    avg_latency: float | None = None  # Seconds per successful request
+    last_failure: float | None = None  # Unix timestamp
+    score: float = 0.0
+
+
 class CaptchaConfig(BaseModel):
     """CAPTCHA solving service configuration."""
 
     service: str  # "2captcha" or "anti-captcha"
     api_key: str
+    cost_per_solve: float | None = None  # USD; defaults to the service's list price
+
+
+class CaptchaSolverStats(BaseModel):
+    """Solve latency and cost of one CAPTCHA service, accumulated in-process."""
+
+    service: str
+    attempts: int = 0
+    solved: int = 0
+    failed: int = 0
+    avg_latency: float | None = None  # Seconds per successful solve
+    total_cost: float = 0.0  # USD spent on successful solves
 
 
 class IndexCheckResult(BaseModel):
@@ -39,6 +64,7 @@ class IndexCheckResult(BaseModel):
     url: str
     status: str  # "Indexed", "Not Indexed", "Captcha Encountered", "Error: ..."
     proxy_used: str = "No Proxy"
+    cached: bool = False  # Served from the result cache without querying Google
 
 
 class BatchIndexCheckResult(BaseModel):
@@ -49,3 +75,4 @@ class BatchIndexCheckResult(BaseModel):
     total_indexed: int
     total_not_indexed: int
     total_errors: int
+    job_id: str | None = None
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -19,3 +21,37 @@ class SitemapParseResult(BaseModel):
 
     urls: list[SitemapUrl]
     total_sitemaps_parsed: int = 1
+
+
+class SitemapCrawlStats(BaseModel):
+    """Running counters for a streaming sitemap crawl.
+
+    Passed into ``iter_sitemap_urls`` and updated in place, since a generator
+    cannot hand back a summary alongside the rows it yields.
+    """
+
+    sitemaps_parsed: int = 0
+    sitemaps_skipped: int = 0
+    urls_found: int = 0
+    failed_sitemaps: list[str] = []
+
+
+class SitemapUrlChange(BaseModel):
+    """A URL added, removed or re-dated since the previous incremental crawl."""
+
+    change: Literal["added", "removed", "modified"]
+    loc: str
+    sitemap_name: str
+    lastmod: str = ""
+    previous_lastmod: str = ""
+
+
+class SitemapDiffResult(BaseModel):
+    """Result of an incremental sitemap crawl: only the URLs that changed."""
+
+    changes: list[SitemapUrlChange]
+    added: int = 0
+    removed: int = 0
+    modified: int = 0
+    sitemaps_parsed: int = 0
+    sitemaps_skipped: int = 0
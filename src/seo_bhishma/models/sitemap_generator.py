@@ -52,3 +52,39 @@ class SitemapIndexConfig(BaseModel):
     frequency: str | None = None
     lastmod: str | None = None
     compressed: bool = False
+
+
+class SitemapShardStats(BaseModel):
+    """Size, URL count and content hash of one generated sitemap file.
+
+    ``sha256`` covers the uncompressed XML. ``lastmod`` is the newest
+    entry ``lastmod`` in the file, or when its content last changed if the
+    entries carry no dates (or a change, such as a removal, did not bring a
+    newer one).
+    """
+
+    file: str
+    urls: int
+    raw_bytes: int
+    gzip_bytes: int | None = None
+    sha256: str = ""
+    lastmod: str | None = None
+
+
+class SitemapManifest(BaseModel):
+    """Record of a nested sitemap build, written next to the index.
+
+    ``priority``/``frequency``/``lastmod`` are the generator defaults used
+    for the build, reapplied to entries added by later updates.
+    ``hash_partitions`` is set when URLs were sharded by hash.
+    """
+
+    index_file: str
+    url_limit: int
+    max_bytes: int
+    compressed: bool = False
+    priority: str | None = None
+    frequency: str | None = None
+    lastmod: str | None = None
+    hash_partitions: int | None = None
+    shards: list[SitemapShardStats] = []
@@ -0,0 +1,46 @@
+"""Tests for the ``site-mapper`` CLI command's CSV export - no network."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from seo_bhishma.cli.commands.site_mapper import site_mapper
+from seo_bhishma.models.site_mapper import SitemapUrl
+
+
+def _run(output: Path, parsed: int, rows: list[SitemapUrl]):
+    def fake_iter(url, stats, **kwargs):
+        stats.sitemaps_parsed = parsed
+        yield from rows
+
+    with (
+        patch("seo_bhishma.cli.commands.site_mapper.iter_sitemap_urls", side_effect=fake_iter),
+        patch("seo_bhishma.cli.commands.site_mapper.Prompt.ask", return_value=str(output)),
+    ):
+        return CliRunner().invoke(site_mapper, ["--sitemap-url", "https://e.com/sitemap.xml"])
+
+
+def test_failed_run_leaves_an_existing_csv_alone(tmp_path: Path) -> None:
+    output = tmp_path / "urls.csv"
+    output.write_text("keep me\n")
+
+    result = _run(output, parsed=0, rows=[])
+
+    assert result.exit_code == 0
+    assert "Failed to process sitemap" in result.output
+    assert output.read_text() == "keep me\n"
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_successful_run_replaces_the_csv(tmp_path: Path) -> None:
+    output = tmp_path / "urls.csv"
+    output.write_text("old\n")
+
+    result = _run(output, parsed=1, rows=[SitemapUrl(sitemap_name="sitemap.xml", loc="https://e.com/a")])
+
+    assert result.exit_code == 0
+    assert "https://e.com/a" in output.read_text()
+    assert list(tmp_path.iterdir()) == [output]
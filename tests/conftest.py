@@ -1,6 +1,30 @@
 import pytest
 
 from seo_bhishma.config.settings import Settings
+from seo_bhishma.core._captcha import reset_captcha_solver
+from seo_bhishma.core._config import reset_settings_cache
+from seo_bhishma.core._http import reset_http_cache, reset_rate_limiter
+from seo_bhishma.core.index_spy import reset_index_result_cache, reset_proxy_health_board
+
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(tmp_path, monkeypatch):
+    """Point the on-disk HTTP cache and index spy stores at a per-test directory."""
+    monkeypatch.setenv("SEO_BHISHMA_HTTP_CACHE_DIR", str(tmp_path / "http-cache"))
+    monkeypatch.setenv("SEO_BHISHMA_INDEX_JOBS_DB", str(tmp_path / "index_jobs.db"))
+    monkeypatch.setenv("SEO_BHISHMA_INDEX_CACHE_DB", str(tmp_path / "index_results.db"))
+    monkeypatch.setenv("SEO_BHISHMA_PROXY_HEALTH_DB", str(tmp_path / "proxy_health.db"))
+    reset_settings_cache()
+    reset_http_cache()
+    reset_index_result_cache()
+    reset_proxy_health_board()
+    reset_rate_limiter()
+    yield
+    reset_settings_cache()
+    reset_http_cache()
+    reset_index_result_cache()
+    reset_proxy_health_board()
+    reset_captcha_solver()
 
 
 @pytest.fixture
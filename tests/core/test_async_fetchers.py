@@ -0,0 +1,123 @@
+"""Tests for the async variants of the core fetchers, over a mock transport - no network."""
+
+import asyncio
+import contextlib
+import threading
+
+import httpx
+
+from seo_bhishma.core import link_sniper
+from seo_bhishma.core._config import reset_settings_cache
+from seo_bhishma.core._http import AsyncRetryClient
+from seo_bhishma.core.domain_insight import get_security_headers_async
+from seo_bhishma.core.link_sniper import batch_check_backlinks_async, check_backlink_async
+from seo_bhishma.core.site_mapper import discover_sitemaps_from_robots_async, download_and_parse_sitemap_async
+from seo_bhishma.models.link_sniper import BacklinkCheckRequest
+
+NS_DECL = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def _client(pages: dict[str, httpx.Response | str | bytes], delay: float = 0.0) -> AsyncRetryClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        page = pages.get(str(request.url))
+        if page is None:
+            return httpx.Response(404)
+        if isinstance(page, httpx.Response):
+            return page
+        return httpx.Response(200, content=page.encode() if isinstance(page, str) else page)
+
+    return AsyncRetryClient(transport=httpx.MockTransport(handler), retries=0)
+
+
+def _urlset(*locs: str) -> str:
+    body = "".join(f"<url><loc>{loc}</loc></url>" for loc in locs)
+    return f'<?xml version="1.0"?><urlset {NS_DECL}>{body}</urlset>'
+
+
+def _index(*locs: str) -> str:
+    body = "".join(f"<sitemap><loc>{loc}</loc></sitemap>" for loc in locs)
+    return f'<?xml version="1.0"?><sitemapindex {NS_DECL}>{body}</sitemapindex>'
+
+
+async def test_batch_backlinks_run_concurrently_in_input_order(monkeypatch):
+    monkeypatch.setenv("SEO_BHISHMA_HTTP_HOST_BURST", "100")
+    reset_settings_cache()
+    pages = {f"https://b.com/{i}": f'<a href="https://t.com/" rel="nofollow">t{i}</a>' for i in range(50)}
+    checks = [BacklinkCheckRequest(backlink_url=f"https://b.com/{i}", target_url="https://t.com") for i in range(50)]
+    checks.append(BacklinkCheckRequest(backlink_url="https://b.com/missing", target_url="https://t.com"))
+    progress: list[int] = []
+    in_flight = {"now": 0, "max": 0}
+    all_in_flight = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        if in_flight["now"] == 50:
+            all_in_flight.set()
+        # Hold each request until the concurrency cap is reached (sequential requests never get there)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(all_in_flight.wait(), timeout=2)
+        in_flight["now"] -= 1
+        page = pages.get(str(request.url))
+        return httpx.Response(200, content=page.encode()) if page else httpx.Response(404)
+
+    async with AsyncRetryClient(transport=httpx.MockTransport(handler), retries=0) as client:
+        results = await batch_check_backlinks_async(
+            checks, max_concurrency=50, on_progress=lambda done, _total: progress.append(done), client=client
+        )
+
+    assert [r.actual_anchor_text for r in results[:50]] == [f"t{i}" for i in range(50)]
+    assert all(r.status == "Live" and not r.is_dofollow for r in results[:50])
+    assert (results[50].status, results[50].http_status) == ("Not Live", 404)
+    assert progress == list(range(1, 52))
+    assert in_flight["max"] == 50
+
+
+async def test_backlink_html_parsed_off_the_event_loop(monkeypatch):
+    parse_threads: list[threading.Thread] = []
+    parse = link_sniper._backlink_result
+
+    def _recording_parse(*args):
+        parse_threads.append(threading.current_thread())
+        return parse(*args)
+
+    monkeypatch.setattr(link_sniper, "_backlink_result", _recording_parse)
+    async with _client({"https://b.com/": '<a href="https://t.com/">t</a>'}) as client:
+        result = await check_backlink_async("https://b.com/", "https://t.com", client=client)
+
+    assert result.status == "Live"
+    assert parse_threads and threading.current_thread() not in parse_threads
+
+
+async def test_sitemap_index_followed_in_order_with_depth_limit():
+    pages = {
+        "https://e.com/index.xml": _index("https://e.com/1.xml", "https://e.com/nested.xml", "https://e.com/gone.xml"),
+        "https://e.com/1.xml": _urlset("https://e.com/a", "https://e.com/b"),
+        "https://e.com/nested.xml": _index("https://e.com/2.xml", "https://e.com/1.xml"),
+        "https://e.com/2.xml": _urlset("https://e.com/c"),
+    }
+    async with _client(pages) as client:
+        deep = await download_and_parse_sitemap_async("https://e.com/index.xml", client=client)
+        shallow = await download_and_parse_sitemap_async("https://e.com/index.xml", max_depth=1, client=client)
+        missing = await download_and_parse_sitemap_async("https://e.com/nope.xml", client=client)
+
+    assert [u.loc for u in deep.urls] == ["https://e.com/a", "https://e.com/b", "https://e.com/c"]
+    assert deep.total_sitemaps_parsed == 4
+    assert [u.loc for u in shallow.urls] == ["https://e.com/a", "https://e.com/b"]
+    assert missing is None
+
+
+async def test_robots_discovery_and_security_headers():
+    hardened = {h: "x" for h in ("strict-transport-security", "content-security-policy", "x-frame-options")}
+    pages = {
+        "https://e.com/robots.txt": "User-agent: *\nSitemap: https://e.com/s.xml\nsitemap: https://e.com/s.xml\n",
+        "https://e.com": httpx.Response(200, headers=hardened),
+    }
+    async with _client(pages) as client:
+        assert await discover_sitemaps_from_robots_async("e.com", client=client) == ["https://e.com/s.xml"]
+        assert await discover_sitemaps_from_robots_async("none.com", client=client) == ["https://none.com/sitemap.xml"]
+        headers = await get_security_headers_async("e.com", client=client)
+
+    assert headers.grade == "D"
+    assert sorted(headers.headers) == sorted(hardened)
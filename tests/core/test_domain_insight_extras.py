@@ -34,7 +34,7 @@ def test_security_headers_grade_a():
         status_code=200,
         headers=fake_headers,
     )
-    with patch("seo_bhishma.core.domain_insight.requests_retry_session") as sess:
+    with patch("seo_bhishma.core.domain_insight.get_session") as sess:
         sess.return_value.get.return_value = mock_response
         result = get_security_headers("example.com")
 
@@ -45,7 +45,7 @@ def test_security_headers_grade_a():
 
 def test_security_headers_grade_f():
     mock_response = MagicMock(url="https://example.com/", status_code=200, headers={})
-    with patch("seo_bhishma.core.domain_insight.requests_retry_session") as sess:
+    with patch("seo_bhishma.core.domain_insight.get_session") as sess:
         sess.return_value.get.return_value = mock_response
         result = get_security_headers("example.com")
 
@@ -58,7 +58,7 @@ def test_security_headers_grade_c():
     mock_response = MagicMock(
         url="https://example.com/", status_code=200, headers=fake_headers
     )
-    with patch("seo_bhishma.core.domain_insight.requests_retry_session") as sess:
+    with patch("seo_bhishma.core.domain_insight.get_session") as sess:
         sess.return_value.get.return_value = mock_response
         result = get_security_headers("example.com")
 
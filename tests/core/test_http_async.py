@@ -0,0 +1,75 @@
+"""Tests for the async retrying transport in core._http - no network."""
+
+import httpx
+import pytest
+
+from seo_bhishma.core import _http
+from seo_bhishma.core._http import AsyncRetryClient
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept: list[float] = []
+
+    async def _sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(_http.asyncio, "sleep", _sleep)
+    return slept
+
+
+def _client(*replies, **options) -> tuple[AsyncRetryClient, list[httpx.Request]]:
+    seen: list[httpx.Request] = []
+    queue = list(replies)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        reply = queue.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    return AsyncRetryClient(transport=httpx.MockTransport(handler), **options), seen
+
+
+async def test_retries_5xx_with_exponential_backoff(sleeps):
+    client, seen = _client(httpx.Response(502), httpx.Response(503), httpx.Response(200, text="ok"))
+    async with client:
+        response = await client.get("https://e.com/")
+    assert response.text == "ok"
+    assert len(seen) == 3
+    assert sleeps == [0.0, 1.0]  # urllib3: no wait before the first retry, then factor * 2 ** (n - 1)
+
+
+async def test_retry_after_header_is_honoured(sleeps):
+    client, _ = _client(httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200))
+    async with client:
+        assert (await client.get("https://e.com/")).status_code == 200
+    assert sleeps == [7.0]
+
+
+async def test_exhausted_retries_return_last_response(sleeps):
+    client, seen = _client(*(httpx.Response(500) for _ in range(3)), retries=2)
+    async with client:
+        assert (await client.get("https://e.com/")).status_code == 500
+    assert len(seen) == 3
+
+
+async def test_transport_errors_retried_then_raised(sleeps):
+    error = httpx.ConnectError("refused")
+    client, seen = _client(error, httpx.Response(200), retries=1)
+    async with client:
+        assert (await client.get("https://e.com/")).status_code == 200
+
+    client, _ = _client(error, error, retries=1)
+    async with client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://e.com/")
+
+
+async def test_non_retryable_status_returned_immediately(sleeps):
+    client, seen = _client(httpx.Response(404))
+    async with client:
+        assert (await client.get("https://e.com/")).status_code == 404
+    assert len(seen) == 1
+    assert sleeps == []
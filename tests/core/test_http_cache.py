@@ -0,0 +1,131 @@
+"""Tests for the conditional-GET HttpCache (no network)."""
+
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from seo_bhishma.core._http import HttpCache, cached_get
+
+
+def _response(status: int, body: bytes = b"", headers: dict | None = None, url: str = "") -> requests.Response:
+    r = requests.Response()
+    r.status_code = status
+    r.raw = io.BytesIO(body)
+    r.headers = CaseInsensitiveDict(headers or {})
+    r.url = url
+    return r
+
+
+def _session(*responses: requests.Response) -> MagicMock:
+    session = MagicMock()
+    session.get.side_effect = list(responses)
+    return session
+
+
+def test_stores_on_validator_and_revalidates_with_304(tmp_path):
+    cache = HttpCache(tmp_path)
+    url = "https://e.com/sitemap.xml"
+    session = _session(
+        _response(200, b"<urlset/>", {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, url),
+        _response(304, url=url),
+    )
+
+    first = cache.get(url, session=session, timeout=5)
+    assert first.from_cache is False
+    assert first.content == b"<urlset/>"
+
+    with cache.get(url, session=session, stream=True, timeout=5) as second:
+        assert second.from_cache is True
+        assert second.status_code == 200
+        assert second.raw.read() == b"<urlset/>"
+        assert second.headers["ETag"] == '"v1"'
+    assert second.raw.closed
+
+    sent = session.get.call_args_list[1].kwargs["headers"]
+    assert sent["If-None-Match"] == '"v1"'
+    assert sent["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def test_changed_resource_replaces_cached_body(tmp_path):
+    cache = HttpCache(tmp_path)
+    url = "https://e.com/robots.txt"
+    session = _session(
+        _response(200, b"old", {"ETag": '"v1"'}, url),
+        _response(200, b"new", {"ETag": '"v2"'}, url),
+        _response(304, url=url),
+    )
+    cache.get(url, session=session)
+    assert cache.get(url, session=session).text == "new"
+    replay = cache.get(url, session=session)
+    assert replay.from_cache is True
+    assert replay.text == "new"
+    assert session.get.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"v2"'
+
+
+def test_cache_file_is_closed_unless_streaming(tmp_path):
+    cache = HttpCache(tmp_path)
+    url = "https://e.com/robots.txt"
+    session = _session(_response(200, b"body", {"ETag": '"v1"'}, url), _response(304, url=url))
+
+    stored = cache.get(url, session=session)
+    replayed = cache.get(url, session=session)
+
+    assert (stored.text, replayed.text) == ("body", "body")
+    assert stored.raw.closed and replayed.raw.closed
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    cache = HttpCache(tmp_path)
+    url = "https://e.com/plain.xml"
+    session = _session(_response(200, b"a", url=url), _response(200, b"b", url=url))
+    assert cache.get(url, session=session).text == "a"
+    assert cache.get(url, session=session).text == "b"
+    assert "If-None-Match" not in session.get.call_args_list[1].kwargs["headers"]
+    assert list(tmp_path.glob("*.body")) == []
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes=25)
+    urls = [f"https://e.com/{i}.xml" for i in range(3)]
+    for url in urls[:2]:
+        cache.get(url, session=_session(_response(200, b"x" * 10, {"ETag": '"a"'}, url)))
+    os.utime(cache._paths(urls[0])[0], (100, 100))
+    os.utime(cache._paths(urls[1])[0], (200, 200))
+
+    # A 304 hit on entry 0 makes entry 1 the least recently used
+    cache.get(urls[0], session=_session(_response(304, url=urls[0])))
+    cache.get(urls[2], session=_session(_response(200, b"y" * 10, {"ETag": '"b"'}, urls[2])))
+
+    assert cache._paths(urls[0])[0].exists()
+    assert not cache._paths(urls[1])[0].exists()
+    assert cache._paths(urls[2])[0].exists()
+
+
+def test_directory_is_walked_once_then_only_when_over_the_cap(tmp_path):
+    url = "https://e.com/old.xml"
+    HttpCache(tmp_path).get(url, session=_session(_response(200, b"o" * 10, {"ETag": '"a"'}, url)))
+
+    cache = HttpCache(tmp_path, max_bytes=35)
+    urls = [f"https://e.com/{i}.xml" for i in range(3)]
+    with patch.object(cache, "_entries", wraps=cache._entries) as walked:
+        for url in urls[:2]:
+            cache.get(url, session=_session(_response(200, b"x" * 10, {"ETag": '"a"'}, url)))
+        # Re-storing an entry replaces its size rather than adding to it
+        cache.get(urls[1], session=_session(_response(200, b"z" * 10, {"ETag": '"b"'}, urls[1])))
+        assert walked.call_count == 1
+
+        cache.get(urls[2], session=_session(_response(200, b"y" * 10, {"ETag": '"b"'}, urls[2])))
+        assert walked.call_count == 2
+
+    # The entry left over from the earlier instance counted towards the cap
+    assert len(list(tmp_path.glob("*.body"))) == 3
+    assert cache._total_bytes == 30
+
+
+def test_cached_get_bypasses_cache_when_disabled(tmp_path):
+    session = MagicMock()
+    cached_get("https://e.com/x", session=session, use_cache=False, timeout=3)
+    session.get.assert_called_once_with("https://e.com/x", timeout=3)
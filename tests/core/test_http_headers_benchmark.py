@@ -0,0 +1,60 @@
+"""Pooled ``generate_headers``, and a benchmark against building a ``HeaderGenerator`` per call.
+
+The timing comparison is marked ``benchmark`` and only runs with ``pytest -m benchmark``.
+"""
+
+import time
+
+import pytest
+from browserforge.headers import HeaderGenerator
+
+from seo_bhishma.core._http import _HeaderPool
+
+N_CALLS = 200
+
+
+def _per_call_baseline() -> dict[str, str]:
+    """The pre-refactor strategy: a fresh generator for every request."""
+    generator = HeaderGenerator(
+        browser=("chrome", "firefox", "safari", "edge"),
+        os=("windows", "macos", "linux", "android", "ios"),
+        device=("desktop", "mobile"),
+        locale=("en-US", "en"),
+        http_version=2,
+    )
+    return generator.generate()
+
+
+def _timed(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return time.perf_counter() - start
+
+
+def test_pool_hands_out_distinct_browser_header_sets():
+    pool = _HeaderPool(size=8, low_water=2)
+    taken = [pool.take() for _ in range(20)]
+    assert all("User-Agent" in h for h in taken)
+    assert len({id(h) for h in taken}) == 20
+
+
+def test_pool_refills_in_the_background():
+    pool = _HeaderPool(size=16, low_water=8)
+    pool.take()  # empty pool: generated inline, and a refill is kicked off
+    deadline = time.monotonic() + 10
+    while (pool._refilling or len(pool._ready) < 16) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(pool._ready) == 16
+    assert not pool._refilling
+
+
+@pytest.mark.benchmark
+def test_pooled_headers_beat_per_call_generator():
+    pool = _HeaderPool(size=N_CALLS, low_water=0)
+    pool.fill()
+    _per_call_baseline()  # warm browserforge's module-level data
+
+    pooled = _timed(pool.take, N_CALLS)
+    baseline = _timed(_per_call_baseline, N_CALLS)
+    assert pooled * 20 < baseline
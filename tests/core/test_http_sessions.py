@@ -0,0 +1,70 @@
+"""Tests for the process-wide pooled session registry in core._http."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from seo_bhishma.core._config import reset_settings_cache
+from seo_bhishma.core._http import close_sessions, get_session
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sessions():
+    close_sessions()
+    yield
+    close_sessions()
+
+
+class _PeerRecorder(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.peers.append(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _PeerRecorder)
+    httpd.peers = []
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_same_session_shared_across_threads_per_retry_profile():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        sessions = set(map(id, pool.map(lambda _: get_session(), range(8))))
+    assert len(sessions) == 1
+    assert get_session(status_forcelist=(500,)) is not get_session()
+
+
+def test_pool_limits_come_from_settings(monkeypatch):
+    monkeypatch.setenv("SEO_BHISHMA_HTTP_POOL_HOSTS", "3")
+    monkeypatch.setenv("SEO_BHISHMA_HTTP_POOL_PER_HOST", "32")
+    reset_settings_cache()
+    adapter = get_session().get_adapter("https://example.com/")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 32
+
+
+def test_connections_are_kept_alive_between_requests(server):
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    for _ in range(3):
+        assert get_session().get(url, timeout=5).text == "ok"
+    assert len(set(server.peers)) == 1
+
+
+def test_close_sessions_drops_the_registry():
+    first = get_session()
+    close_sessions()
+    assert get_session() is not first
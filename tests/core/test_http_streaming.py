@@ -0,0 +1,146 @@
+"""Tests for size-capped, early-aborting HTML fetches, against a local slow-streaming server."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from seo_bhishma.core._http import AsyncRetryClient, close_sessions, fetch_html, fetch_html_async
+from seo_bhishma.core.link_sniper import _AnchorWatch, check_backlink
+
+CHUNK = b"<p>" + b"filler " * 1000 + b"</p>\n"
+LINK = b'<a href="https://target.com/page/" rel="nofollow">Best <b>SEO</b> tools</a>'
+DECOYS = (
+    b'<a data-href="https://target.com/page" href="/share">Best</a>'
+    b'<!-- <a href="https://target.com/page">Best</a> -->'
+    b"<script>var s = '<a href=\"https://target.com/page\">Best</a>';</script>"
+)
+
+
+class _SlowPages(BaseHTTPRequestHandler):
+    """Streams 20 chunks with a pause between them.
+
+    Under ``/linked`` the link is in the first chunk; under ``/decoyed`` the
+    first chunk only has look-alikes and the link comes in the fourth.
+    """
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        content_type = "application/pdf" if self.path.endswith(".pdf") else "text/html; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.end_headers()
+        try:
+            for i in range(20):
+                if i == 0 and self.path.startswith("/linked"):
+                    self.wfile.write(LINK + CHUNK)
+                elif self.path.startswith("/decoyed") and i in (0, 3):
+                    self.wfile.write((DECOYS if i == 0 else LINK) + CHUNK)
+                else:
+                    self.wfile.write(CHUNK)
+                self.wfile.flush()
+                time.sleep(0.05)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+@pytest.fixture
+def server():
+    close_sessions()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowPages)
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    close_sessions()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_body_read_stops_at_size_cap(server):
+    page = fetch_html(f"{server.url}/plain", max_bytes=20_000)
+    assert page.truncated and not page.stopped
+    assert len(page.content) == 20_000
+    assert page.text.startswith("<p>filler")
+
+
+def test_non_html_response_skipped_without_reading_body(server):
+    page = fetch_html(f"{server.url}/file.pdf")
+    assert page.skipped and not page.truncated
+    assert page.content == b""
+    assert page.content_type == "application/pdf"
+
+
+def test_backlink_check_stops_reading_once_anchor_found(server):
+    page = fetch_html(f"{server.url}/linked", stop_when=_AnchorWatch("https://target.com/page", "Best"))
+    assert page.stopped and not page.truncated
+    assert LINK in page.content
+    assert len(page.content) < 20 * len(CHUNK)
+
+    result = check_backlink(f"{server.url}/linked", "https://target.com/page", "Best")
+    assert (result.status, result.anchor_status, result.is_dofollow) == ("Live", "Present", False)
+    assert result.actual_anchor_text == "BestSEOtools"
+
+
+def test_backlink_check_reads_past_look_alike_links(server):
+    result = check_backlink(f"{server.url}/decoyed", "https://target.com/page", "Best")
+    assert (result.status, result.anchor_status, result.is_dofollow) == ("Live", "Present", False)
+    assert result.actual_anchor_text == "BestSEOtools"
+
+
+def test_backlink_to_binary_file_is_not_found(server):
+    result = check_backlink(f"{server.url}/file.pdf", "https://target.com/page")
+    assert (result.status, result.http_status) == ("Not Found", 200)
+
+
+def _feed(watch: _AnchorWatch, body: bytes, size: int = 7) -> int | None:
+    buffer = bytearray()
+    for start in range(0, len(body), size):
+        buffer += body[start : start + size]
+        if watch(buffer):
+            return len(buffer)
+    return None
+
+
+def test_anchor_watch_waits_for_closing_tag_across_chunks():
+    body = b"<html><a href='/other'>x</a>" + LINK + b"<p>rest of the page</p>"
+    stopped_at = _feed(_AnchorWatch("https://target.com/page"), body)
+    assert stopped_at is not None
+    assert body.index(LINK) + len(LINK) <= stopped_at < body.index(LINK) + len(LINK) + 7
+
+
+def test_anchor_watch_keeps_reading_when_anchor_text_differs():
+    body = LINK + b'<p>later</p><a href="https://target.com/page">Cheap links</a>'
+    assert _feed(_AnchorWatch("https://target.com/page", "Cheap"), body) == len(body)
+    assert _feed(_AnchorWatch("https://target.com/page", "Expensive"), body) is None
+    assert _feed(_AnchorWatch("https://target.com/elsewhere"), body) is None
+
+
+def test_anchor_watch_matches_tag_names_in_any_case_but_href_exactly():
+    upper = b'<A HREF="https://target.com/page">Best</A>'
+    assert _feed(_AnchorWatch("https://target.com/page"), upper) == len(upper)
+    # _backlink_result would not count this link, so the download must go on
+    other_case = b'<a href="https://target.com/PAGE">Best</a>'
+    assert _feed(_AnchorWatch("https://target.com/page"), other_case) is None
+
+
+async def test_anchor_watch_ignores_look_alike_links():
+    assert _feed(_AnchorWatch("https://target.com/page", "Best"), DECOYS + b"<p>more</p>") is None
+    assert _feed(_AnchorWatch("https://target.com/page", "Best"), DECOYS + LINK) == len(DECOYS + LINK)
+
+
+async def test_async_fetch_skips_non_html_and_caps_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(".zip"):
+            return httpx.Response(200, headers={"Content-Type": "application/zip"}, content=b"PK" * 1000)
+        return httpx.Response(200, headers={"Content-Type": "text/html"}, content=CHUNK * 10)
+
+    async with AsyncRetryClient(transport=httpx.MockTransport(handler)) as client:
+        archive = await fetch_html_async("https://e.com/a.zip", client)
+        page = await fetch_html_async("https://e.com/", client, max_bytes=1000)
+
+    assert archive.skipped and archive.content == b""
+    assert page.truncated and len(page.content) == 1000
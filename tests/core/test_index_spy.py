@@ -10,6 +10,7 @@ from seo_bhishma.models.index_spy import (
 
 
 def test_check_method_enum():
+    assert CheckMethod.HTTP == "http"
     assert CheckMethod.HTML_SESSION == "htmlsession"
     assert CheckMethod.PLAYWRIGHT == "playwright"
 
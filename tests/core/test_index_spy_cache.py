@@ -0,0 +1,69 @@
+"""Tests for the indexing result cache - no network."""
+
+import time
+from unittest.mock import patch
+
+from seo_bhishma.core.index_spy import (
+    IndexResultCache,
+    batch_check_indexing,
+    check_indexing_status,
+    get_index_result_cache,
+)
+from seo_bhishma.models.index_spy import CheckMethod, IndexCheckResult
+
+URL = "https://e.com/a"
+
+
+def test_definitive_results_cached_until_ttl(tmp_path):
+    cache = IndexResultCache(tmp_path / "r.db", ttl_seconds=60)
+    cache.put(IndexCheckResult(url=URL, status="Indexed", proxy_used="p1"), CheckMethod.HTTP)
+    cache.put(IndexCheckResult(url="https://e.com/b", status="Captcha Encountered"), CheckMethod.HTTP)
+    cache.put(IndexCheckResult(url="https://e.com/c", status="Error: boom"), CheckMethod.HTTP)
+
+    hit = cache.get(URL)
+    assert (hit.status, hit.proxy_used, hit.cached) == ("Indexed", "p1", True)
+    assert cache.get("https://e.com/b") is None
+    assert cache.get("https://e.com/c") is None
+
+    with patch("seo_bhishma.core.index_spy.time.time", return_value=time.time() + 61):
+        assert cache.get(URL) is None
+    cache.close()
+
+
+def test_check_indexing_status_serves_repeat_urls_from_cache():
+    with patch("seo_bhishma.core.index_spy.check_indexing_http", return_value="Not Indexed") as check:
+        first = check_indexing_status(URL, CheckMethod.HTTP)
+        second = check_indexing_status(URL, CheckMethod.HTTP)
+        bypass = check_indexing_status(URL, CheckMethod.HTTP, use_cache=False)
+
+    assert check.call_count == 2
+    assert (first.cached, second.cached, bypass.cached) == (False, True, False)
+    assert second.status == "Not Indexed"
+
+
+def test_batch_only_sends_cache_misses_to_google():
+    get_index_result_cache().put(IndexCheckResult(url=URL, status="Indexed"), CheckMethod.HTTP)
+    checked: list[str] = []
+
+    def check(url, *args, **kwargs):
+        checked.append(url)
+        return IndexCheckResult(url=url, status="Not Indexed")
+
+    urls = [URL, "https://e.com/b"]
+    with patch("seo_bhishma.core.index_spy.check_indexing_status", side_effect=check):
+        first = batch_check_indexing(urls)
+        second = batch_check_indexing(urls)
+
+    assert checked == ["https://e.com/b"]
+    assert [(r.url, r.cached) for r in first.results] == [(URL, True), ("https://e.com/b", False)]
+    assert all(r.cached for r in second.results)
+
+
+def test_zero_ttl_disables_cache(monkeypatch):
+    from seo_bhishma.core._config import reset_settings_cache
+    from seo_bhishma.core.index_spy import reset_index_result_cache
+
+    monkeypatch.setenv("SEO_BHISHMA_INDEX_CACHE_TTL_HOURS", "0")
+    reset_settings_cache()
+    reset_index_result_cache()
+    assert get_index_result_cache() is None
@@ -0,0 +1,180 @@
+"""Tests for the async CAPTCHA solver client, against a local stub of the solver APIs."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from seo_bhishma.core._captcha import AsyncCaptchaSolver, CaptchaSolverPool
+from seo_bhishma.core.index_spy import check_indexing_http
+from seo_bhishma.models.index_spy import CaptchaConfig
+
+TWO = CaptchaConfig(service="2captcha", api_key="k2")
+ANTI = CaptchaConfig(service="anti-captcha", api_key="ka")
+
+
+class _SolverStub(ThreadingHTTPServer):
+    """2Captcha + Anti-Captcha look-alike: tasks are ready after ``polls_needed`` polls.
+
+    With ``ready_after``, no task is ready until that many have been created.
+    """
+
+    def __init__(self, polls_needed: int = 2) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.polls_needed = polls_needed
+        self.ready_after = 0
+        self.polls: dict[str, int] = {}
+        self.pending = 0
+        self.max_pending = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def create(self) -> str:
+        with self.lock:
+            task_id = str(len(self.polls) + 1)
+            self.polls[task_id] = 0
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+            return task_id
+
+    def poll(self, task_id: str) -> bool:
+        with self.lock:
+            self.polls[task_id] += 1
+            ready = self.polls[task_id] >= self.polls_needed and len(self.polls) >= self.ready_after
+            if ready:
+                self.pending -= 1
+            return ready
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _SolverStub
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _reply(self, body) -> None:
+        payload = json.dumps(body).encode() if isinstance(body, dict) else body.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        task_id = parse_qs(urlsplit(self.path).query)["id"][0]
+        self._reply(f"OK|token-{task_id}" if self.server.poll(task_id) else "CAPCHA_NOT_READY")
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        path = urlsplit(self.path).path
+        if path == "/in.php":
+            key = parse_qs(body.decode())["key"][0]
+            self._reply("ERROR_WRONG_USER_KEY" if key == "bad" else f"OK|{self.server.create()}")
+        elif path == "/createTask":
+            if json.loads(body)["clientKey"] == "bad":
+                self._reply({"errorId": 1, "errorDescription": "ERROR_KEY_DOES_NOT_EXIST"})
+            else:
+                self._reply({"errorId": 0, "taskId": int(self.server.create())})
+        else:
+            task_id = str(json.loads(body)["taskId"])
+            if self.server.poll(task_id):
+                self._reply({
+                    "errorId": 0,
+                    "status": "ready",
+                    "solution": {"gRecaptchaResponse": f"token-{task_id}"},
+                    "cost": "0.00150",
+                })
+            else:
+                self._reply({"errorId": 0, "status": "processing"})
+
+
+@pytest.fixture
+def stub():
+    server = _SolverStub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _solver(stub: _SolverStub, **options) -> AsyncCaptchaSolver:
+    options.setdefault("poll_interval", 0.01)
+    return AsyncCaptchaSolver(base_urls={"2captcha": stub.url, "anti-captcha": stub.url}, **options)
+
+
+async def test_both_services_solve_and_track_latency_and_cost(stub):
+    solver = _solver(stub)
+    try:
+        assert await solver.solve(TWO, "https://g.com/sorry", "site-key") == "token-1"
+        assert await solver.solve(ANTI, "https://g.com/sorry", "site-key") == "token-2"
+    finally:
+        await solver.aclose()
+
+    stats = {s.service: s for s in solver.stats()}
+    assert stats["2captcha"].solved == 1
+    assert stats["2captcha"].total_cost == pytest.approx(0.00299)
+    assert stats["anti-captcha"].total_cost == pytest.approx(0.0015)  # as reported by the service
+    assert stats["anti-captcha"].avg_latency > 0
+
+
+def test_pool_polls_many_pending_solves_concurrently(stub):
+    # Nothing is solved until all ten tasks are pending, so solving one at a time would never finish
+    stub.polls_needed = 5
+    stub.ready_after = 10
+    with CaptchaSolverPool(poll_interval=0.05, base_urls={"2captcha": stub.url}) as pool:
+        futures = [pool.submit(TWO, "https://g.com/sorry", f"key-{i}") for i in range(10)]
+        tokens = sorted(f.result(timeout=10) for f in futures)
+
+    assert tokens == sorted(f"token-{i}" for i in range(1, 11))
+    assert stub.max_pending == 10
+    assert min(stub.polls.values()) >= 5
+
+
+async def test_cheaper_service_preferred_and_failures_fall_through(stub):
+    solver = _solver(stub)
+    assert [c.service for c in solver.rank([TWO, ANTI])] == ["anti-captcha", "2captcha"]
+
+    bad_anti = CaptchaConfig(service="anti-captcha", api_key="bad")
+    try:
+        assert await solver.solve([TWO, bad_anti], "https://g.com/sorry", "site-key") == "token-1"
+    finally:
+        await solver.aclose()
+
+    stats = {s.service: s for s in solver.stats()}
+    assert (stats["anti-captcha"].failed, stats["2captcha"].solved) == (1, 1)
+    assert [c.service for c in solver.rank([TWO, bad_anti])] == ["2captcha", "anti-captcha"]
+
+
+async def test_unsolved_task_times_out(stub):
+    stub.polls_needed = 1000
+    solver = _solver(stub, timeout=0.05)
+    try:
+        assert await solver.solve(TWO, "https://g.com/sorry", "site-key") is None
+    finally:
+        await solver.aclose()
+    assert solver.stats()[0].failed == 1
+
+
+def test_http_check_takes_site_key_from_block_page():
+    blocked = MagicMock(content=b'<div class="g-recaptcha" data-sitekey="abc123"></div> captcha', status_code=200)
+    indexed = MagicMock(
+        content=b'<div id="search"><a href="https://e.com/a">A</a></div>', status_code=200, headers={}
+    )
+    session = MagicMock()
+    session.get.side_effect = [blocked, indexed]
+
+    with (
+        patch("seo_bhishma.core.index_spy._http_session", return_value=session),
+        patch("seo_bhishma.core.index_spy.solve_captcha", return_value="tok") as solve,
+    ):
+        status = check_indexing_http("https://e.com/a", captcha_config=TWO)
+
+    assert status == "Indexed"
+    assert solve.call_args.args[2] == "abc123"
+    assert session.get.call_count == 2
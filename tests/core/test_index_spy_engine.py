@@ -0,0 +1,213 @@
+"""Tests for the per-proxy lane engine behind batch index checks - no network."""
+
+import threading
+import time
+from unittest.mock import call, patch
+
+import requests
+
+from seo_bhishma.core.index_spy import batch_check_indexing, iter_check_indexing
+from seo_bhishma.models.index_spy import CheckMethod, IndexCheckResult, ProxyConfig
+
+
+def _validate(proxy, _method):
+    return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+
+
+def _run(check, urls, proxies=None, validate=_validate, **kwargs):
+    config = ProxyConfig(proxy_list=proxies) if proxies else None
+    with (
+        patch("seo_bhishma.core.index_spy.check_indexing_status", side_effect=check),
+        patch("seo_bhishma.core.index_spy.ProxyRotator.validate", side_effect=validate),
+    ):
+        return list(iter_check_indexing(urls, proxy_config=config, **kwargs))
+
+
+def _proxy_of(proxy_dict) -> str:
+    return proxy_dict["http"].removeprefix("http://") if proxy_dict else "direct"
+
+
+def test_lanes_run_concurrently_one_per_proxy():
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def check(url, method, proxy, *args, **kwargs):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["now"] -= 1
+        return IndexCheckResult(url=url, status="Indexed", proxy_used=_proxy_of(proxy))
+
+    urls = [f"https://e.com/{i}" for i in range(12)]
+    results = _run(check, urls, proxies=["p1:1", "p2:1", "p3:1"], workers=2)
+
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert in_flight["max"] == 2
+    assert {r.proxy_used for r in results} <= {"p1:1", "p2:1", "p3:1"}
+
+
+def test_captcha_cools_proxy_down_and_retries_url_elsewhere():
+    def check(url, method, proxy, *args, **kwargs):
+        name = _proxy_of(proxy)
+        status = "Captcha Encountered" if name == "bad:1" else "Not Indexed"
+        return IndexCheckResult(url=url, status=status, proxy_used=name)
+
+    urls = [f"https://e.com/{i}" for i in range(6)]
+    results = _run(check, urls, proxies=["bad:1", "good:1"], workers=2)
+
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert {r.status for r in results} == {"Not Indexed"}
+    assert {r.proxy_used for r in results} == {"good:1"}
+
+
+def test_invalid_proxies_fall_back_to_direct_checks():
+    def check(url, method, proxy, *args, **kwargs):
+        return IndexCheckResult(url=url, status="Indexed", proxy_used=_proxy_of(proxy))
+
+    results = _run(check, ["https://e.com/a"], proxies=["dead:1"], validate=lambda proxy, method: None)
+    assert [(r.url, r.proxy_used) for r in results] == [("https://e.com/a", "direct")]
+
+
+def test_direct_lane_stops_after_consecutive_captchas():
+    calls: list[str] = []
+
+    def check(url, *args, **kwargs):
+        calls.append(url)
+        return IndexCheckResult(url=url, status="Captcha Encountered")
+
+    urls = [f"https://e.com/{i}" for i in range(5)]
+    results = _run(check, urls, max_captcha_retries=2)
+    assert len(calls) == 2
+    assert [r.status for r in results] == ["Captcha Encountered"] * 2
+
+
+def test_url_gives_up_after_max_attempts_when_every_proxy_fails():
+    def check(url, method, proxy, *args, **kwargs):
+        return IndexCheckResult(url=url, status="Proxy Error", proxy_used=_proxy_of(proxy))
+
+    results = _run(check, ["https://e.com/a"], proxies=["p1:1", "p2:1", "p3:1"], max_captcha_retries=2)
+    assert [(r.url, r.status) for r in results] == [("https://e.com/a", "Proxy Error")]
+
+
+def test_batch_excludes_captcha_results_and_reports_progress():
+    def check(url, *args, **kwargs):
+        status = "Captcha Encountered" if url.endswith("/b") else "Indexed"
+        return IndexCheckResult(url=url, status=status)
+
+    progress: list[tuple[int, int]] = []
+    with patch("seo_bhishma.core.index_spy.check_indexing_status", side_effect=check):
+        result = batch_check_indexing(
+            ["https://e.com/a", "https://e.com/b", "https://e.com/c"],
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+    assert [r.url for r in result.results] == ["https://e.com/a", "https://e.com/c"]
+    assert result.total_indexed == 2
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_browsers_of_quarantined_and_throttled_proxies_are_released():
+    def check(url, method, proxy, *args, **kwargs):
+        name = _proxy_of(proxy)
+        status = {"dead:1": "Proxy Error", "slow:1": "Captcha Encountered"}.get(name, "Indexed")
+        time.sleep(0.02)  # Long enough for every lane to take a URL
+        return IndexCheckResult(url=url, status=status, proxy_used=name)
+
+    with patch("seo_bhishma.core.index_spy.PlaywrightPool") as pool_cls:
+        results = _run(
+            check,
+            [f"https://e.com/{i}" for i in range(6)],
+            proxies=["dead:1", "slow:1", "good:1"],
+            method=CheckMethod.PLAYWRIGHT,
+            workers=3,
+        )
+
+    assert {r.status for r in results} == {"Indexed"}
+    released = pool_cls.return_value.release.call_args_list
+    assert call(_validate("dead:1", None)) in released
+    assert call(_validate("slow:1", None)) in released
+    assert call(_validate("good:1", None)) not in released
+    pool_cls.return_value.close.assert_called_once()
+
+
+def test_cooled_down_proxy_comes_back_when_it_is_the_only_one():
+    calls: list[str] = []
+
+    def check(url, method, proxy, *args, **kwargs):
+        calls.append(url)
+        status = "Captcha Encountered" if len(calls) == 1 else "Indexed"
+        return IndexCheckResult(url=url, status=status, proxy_used=_proxy_of(proxy))
+
+    with patch("seo_bhishma.core.index_spy.ProxyCooldowns.penalize", return_value=0.0):
+        results = _run(check, ["https://e.com/a", "https://e.com/b"], proxies=["only:1"])
+
+    assert sorted(r.url for r in results) == ["https://e.com/a", "https://e.com/b"]
+    assert {r.status for r in results} == {"Indexed"}
+    assert len(calls) == 3
+
+
+class _StaticAdapter:
+    """Transport adapter answering every request with a 200 and a fixed body."""
+
+    def send(self, request, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html><body>loading</body></html>"
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class _RenderPage:
+    """Pyppeteer page whose rendered SERP lists the ``site:`` target it was sent to."""
+
+    def __init__(self) -> None:
+        self._html = ""
+
+    async def goto(self, url: str, options=None) -> None:
+        target = url.split("site:", 1)[1] if "site:" in url else ""
+        self._html = f'<div id="search"><div class="g"><a href="{target}">A</a></div></div>'
+
+    async def content(self) -> str:
+        return self._html
+
+    async def close(self) -> None:
+        pass
+
+
+class _RenderBrowser:
+    async def newPage(self) -> _RenderPage:
+        return _RenderPage()
+
+    async def close(self) -> None:
+        pass
+
+
+async def _launch(**options) -> _RenderBrowser:
+    return _RenderBrowser()
+
+
+def test_htmlsession_renders_inside_lanes_and_validation():
+    urls = [f"https://e.com/{i}" for i in range(4)]
+    with (
+        patch("requests_html.HTMLSession.get_adapter", return_value=_StaticAdapter()),
+        patch("requests_html.pyppeteer.launch", side_effect=_launch),
+    ):
+        direct = list(iter_check_indexing(urls[:2], method=CheckMethod.HTML_SESSION, use_cache=False))
+        proxied = list(
+            iter_check_indexing(
+                urls[2:],
+                method=CheckMethod.HTML_SESSION,
+                proxy_config=ProxyConfig(proxy_list=["p1:1", "p2:1"]),
+                use_cache=False,
+            )
+        )
+
+    assert sorted((r.url, r.status) for r in direct + proxied) == [(u, "Indexed") for u in urls]
+    assert all("p1:1" in r.proxy_used or "p2:1" in r.proxy_used for r in proxied)
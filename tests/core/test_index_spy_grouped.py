@@ -0,0 +1,137 @@
+"""Tests for grouped site: prefix queries ahead of per-URL index checks - no network."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from seo_bhishma.core.index_spy import (
+    batch_check_indexing,
+    check_prefix_indexing,
+    group_urls_by_prefix,
+    iter_check_indexing,
+)
+from seo_bhishma.models.index_spy import IndexCheckResult, ProxyConfig
+
+
+def _serp(*hrefs: str) -> bytes:
+    links = "".join(f'<div class="g"><a href="{h}">r</a></div>' for h in hrefs)
+    return f'<html><div id="search">{links}</div></html>'.encode()
+
+
+def _response(body: bytes, status_code: int = 200) -> MagicMock:
+    response = MagicMock(content=body, status_code=status_code)
+    response.headers = {}
+    return response
+
+
+def _serve(*responses: MagicMock):
+    session = MagicMock()
+    session.get.side_effect = list(responses)
+    return patch("seo_bhishma.core.index_spy._http_session", return_value=session), session
+
+
+def test_grouping_by_section_then_host():
+    blog = [f"https://e.com/blog/{i}" for i in range(5)]
+    misc = [f"https://e.com/{name}" for name in ("a", "b", "c", "docs/x", "docs/y")]
+    other = ["https://other.com/blog/1", "https://other.com/"]
+
+    groups, singles = group_urls_by_prefix(blog + misc + other, min_group_size=5)
+
+    assert groups == {"e.com/blog": blog, "e.com": misc}
+    assert singles == other
+
+
+def test_prefix_query_paginates_and_unwraps_redirect_links():
+    urls = ["https://e.com/blog/a", "https://e.com/blog/b/", "https://e.com/blog/c"]
+    patcher, session = _serve(
+        _response(_serp("https://e.com/blog/a", "https://elsewhere.com/x")),
+        _response(_serp("/url?q=http://e.com/blog/b&amp;sa=U")),
+        _response(_serp()),
+    )
+    with patcher:
+        confirmed, blocked = check_prefix_indexing("e.com/blog", urls)
+
+    assert confirmed == {"https://e.com/blog/a", "https://e.com/blog/b/"}
+    assert blocked is None
+    pages = [call.args[0] for call in session.get.call_args_list]
+    assert len(pages) == 3
+    assert "q=site:e.com/blog&num=100&start=100" in pages[1]
+
+
+def test_prefix_query_ignores_sibling_paths_sharing_the_prefix():
+    patcher, session = _serve(
+        _response(_serp("https://e.com/blogger/a", "https://e.com/blog")),
+        _response(_serp("https://e.com/blogger/b")),
+    )
+    with patcher:
+        confirmed, blocked = check_prefix_indexing("e.com/blog", ["https://e.com/blog", "https://e.com/blog/a"])
+
+    assert (confirmed, blocked) == ({"https://e.com/blog"}, None)
+    # Page 2 lists nothing under e.com/blog/, so paging stops there
+    assert session.get.call_count == 2
+
+
+def test_prefix_query_stops_on_rate_limit():
+    patcher, session = _serve(_response(_serp("https://e.com/a")), _response(b"", status_code=429))
+    with patcher:
+        confirmed, blocked = check_prefix_indexing("e.com", ["https://e.com/a", "https://e.com/b"])
+    assert confirmed == {"https://e.com/a"}
+    assert blocked == "Captcha Encountered"
+
+
+def test_grouped_batch_checks_only_unconfirmed_urls_one_by_one():
+    blog = [f"https://e.com/blog/{i}" for i in range(5)]
+    single = "https://solo.com/page"
+    checked: list[str] = []
+
+    def check(url, *args, **kwargs):
+        checked.append(url)
+        return IndexCheckResult(url=url, status="Not Indexed")
+
+    patcher, _session = _serve(_response(_serp(*blog[:3])), _response(_serp()))
+    with patcher, patch("seo_bhishma.core.index_spy.check_indexing_status", side_effect=check):
+        result = batch_check_indexing(blog + [single], grouped=True)
+
+    assert sorted(checked) == sorted(blog[3:] + [single])
+    statuses = {r.url: r.status for r in result.results}
+    assert [statuses[u] for u in blog] == ["Indexed"] * 3 + ["Not Indexed"] * 2
+    assert result.total_indexed == 3
+
+
+def test_prefix_phase_validates_concurrently_and_quarantines_failed_proxies():
+    blog = [f"https://e.com/blog/{i}" for i in range(5)]
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+    lane_proxies: list = []
+
+    def validate(proxy, _method):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.1 if proxy.startswith("good") else 0.05)
+        with lock:
+            in_flight["now"] -= 1
+        return {"http": f"http://{proxy}"} if proxy.startswith("good") else None
+
+    def check(url, method, proxy, *args, **kwargs):
+        lane_proxies.append(proxy)
+        return IndexCheckResult(url=url, status="Not Indexed")
+
+    session = MagicMock()
+    session.get.side_effect = requests.exceptions.ProxyError("tunnel failed")
+    config = ProxyConfig(proxy_list=["bad1:1", "bad2:1", "good:1"])
+    with (
+        patch("seo_bhishma.core.index_spy._http_session", return_value=session),
+        patch("seo_bhishma.core.index_spy.ProxyRotator.validate", side_effect=validate) as validated,
+        patch("seo_bhishma.core.index_spy.check_indexing_status", side_effect=check),
+    ):
+        results = list(iter_check_indexing(blog, proxy_config=config, grouped=True))
+
+    assert in_flight["max"] > 1
+    assert session.get.call_args.kwargs["proxies"] == {"http": "http://good:1"}
+    # Every proxy was ruled out before the lanes started: none is validated again or used
+    assert validated.call_count == 3
+    assert lane_proxies == [None] * 5
+    assert sorted(r.url for r in results) == blog
@@ -0,0 +1,64 @@
+"""Tests for the browserless HTTP indexing check - no network."""
+
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from seo_bhishma.core.index_spy import _classify_serp, check_indexing_http
+
+URL = "https://example.com/page"
+
+
+def _response(html: str) -> MagicMock:
+    response = MagicMock()
+    response.content = html.encode()
+    response.status_code = 200
+    return response
+
+
+def _check(*responses, render_status: str = "Indexed"):
+    session = MagicMock()
+    session.get.side_effect = list(responses)
+    with (
+        patch("seo_bhishma.core.index_spy._http_session", return_value=session),
+        patch("seo_bhishma.core.index_spy.check_indexing_htmlsession", return_value=render_status) as render,
+    ):
+        return check_indexing_http(URL), render
+
+
+def test_classify_results_container_without_match_is_not_indexed():
+    html = '<html><body><div id="search"><div class="g"><a href="https://other.com/">x</a></div></div></body></html>'
+    assert _classify_serp(html, URL) == "Not Indexed"
+
+
+def test_classify_js_shell_is_ambiguous():
+    html = "<html><head><script>render()</script></head><body><div id='main'></div></body></html>"
+    assert _classify_serp(html, URL) is None
+    assert _classify_serp("", URL) is None
+
+
+def test_classify_first_link_in_result_block():
+    html = f'<html><body><div class="MjjYud"><a href="/url?q={URL}">x</a></div></body></html>'
+    assert _classify_serp(html, URL) == "Indexed"
+
+
+def test_raw_html_answer_skips_rendering():
+    html = f'<html><body><div id="rso"><div class="g"><a href="{URL}">x</a></div></div></body></html>'
+    status, render = _check(_response(html))
+    assert status == "Indexed"
+    render.assert_not_called()
+
+
+def test_ambiguous_raw_html_falls_back_to_rendering():
+    status, render = _check(_response("<html><body><div id='main'></div></body></html>"), render_status="Not Indexed")
+    assert status == "Not Indexed"
+    render.assert_called_once_with(URL, None, None)
+
+
+def test_captcha_and_proxy_failures():
+    status, render = _check(_response("<html><body>Our systems have detected unusual traffic</body></html>"))
+    assert status == "Captcha Encountered"
+    render.assert_not_called()
+
+    status, _ = _check(requests.exceptions.ProxyError("tunnel failed"))
+    assert status == "Proxy Error"
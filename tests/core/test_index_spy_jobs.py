@@ -0,0 +1,64 @@
+"""Tests for the resumable batch indexing job store - no network."""
+
+from unittest.mock import patch
+
+from seo_bhishma.core.index_spy import IndexJobStore, batch_check_indexing
+from seo_bhishma.models.index_spy import IndexCheckResult
+
+URLS = [f"https://e.com/{i}" for i in range(5)]
+
+
+def test_results_checkpointed_and_resume_skips_finished(tmp_path):
+    checked: list[str] = []
+
+    def flaky(url, *args, **kwargs):
+        checked.append(url)
+        if url.endswith(("/3", "/4")):
+            status = "Captcha Encountered"
+        elif url.endswith("/2"):
+            status = "Error: Read timed out"
+        else:
+            status = "Indexed"
+        return IndexCheckResult(url=url, status=status)
+
+    with IndexJobStore(tmp_path / "jobs.db") as store:
+        with patch("seo_bhishma.core.index_spy.check_indexing_status", side_effect=flaky):
+            first = batch_check_indexing(URLS, job_store=store, max_captcha_retries=2)
+        job_id = first.job_id
+        assert first.total_errors == 1
+        # Transient errors stay pending alongside the CAPTCHA'd URLs
+        assert store.pending_urls(job_id) == URLS[2:]
+
+    # A fresh connection sees every committed result
+    checked.clear()
+    progress: list[tuple[int, int]] = []
+    with IndexJobStore(tmp_path / "jobs.db") as store:
+        with patch(
+            "seo_bhishma.core.index_spy.check_indexing_status",
+            side_effect=lambda url, *a, **k: IndexCheckResult(url=url, status="Not Indexed"),
+        ):
+            resumed = batch_check_indexing(
+                [], job_store=store, job_id=job_id, on_progress=lambda d, t: progress.append((d, t))
+            )
+        assert store.pending_urls(job_id) == []
+
+    assert checked == []
+    assert [r.url for r in resumed.results] == URLS
+    assert (resumed.total_indexed, resumed.total_not_indexed, resumed.total_errors) == (2, 3, 0)
+    assert progress == [(3, 5), (4, 5), (5, 5)]
+
+
+def test_open_job_extends_existing_job_in_order(tmp_path):
+    with IndexJobStore(tmp_path / "jobs.db") as store:
+        job_id = store.open_job(URLS[:2], "nightly")
+        assert job_id == "nightly"
+        assert store.has_job("nightly") and not store.has_job("other")
+        store.record(job_id, IndexCheckResult(url=URLS[0], status="Indexed"))
+        store.open_job([URLS[1], URLS[2]], job_id)
+        assert store.pending_urls(job_id) == URLS[1:3]
+        assert [r.url for r in store.results(job_id)] == [URLS[0]]
+
+
+def test_generated_job_ids_are_unique(tmp_path):
+    with IndexJobStore(tmp_path / "jobs.db") as store:
+        assert store.open_job(URLS) != store.open_job(URLS)
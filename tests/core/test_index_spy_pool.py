@@ -0,0 +1,150 @@
+"""Tests for the reusable Playwright browser pool, against a fake Playwright - no browser."""
+
+from unittest.mock import patch
+
+from seo_bhishma.core.index_spy import PlaywrightPool
+from seo_bhishma.models.index_spy import CaptchaHandling
+
+INDEXED = '<div id="search"><div class="g"><a href="https://e.com/a">A</a></div></div>'
+NOT_INDEXED = '<div id="topstuff">Your search - site:https://e.com/b - did not match any documents.</div>'
+
+
+class _FakePage:
+    def __init__(self, context, serps: dict[str, str]) -> None:
+        self.context = context
+        self._serps = serps
+        self._html = ""
+        self.waited: list[str] = []
+
+    async def goto(self, url: str) -> None:
+        target = url.split("site:", 1)[1]
+        if target not in self._serps:
+            raise RuntimeError("net::ERR_TUNNEL_CONNECTION_FAILED")
+        self._html = self._serps[target]
+
+    async def wait_for_selector(self, selector: str, timeout: float) -> None:
+        self.waited.append(selector)
+
+    async def content(self) -> str:
+        return self._html
+
+
+class _FakeContext:
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage(self, self.browser.pw.serps)
+        self.browser.pw.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self, pw, options: dict) -> None:
+        self.pw = pw
+        self.options = options
+        self.closed = False
+
+    async def new_context(self) -> _FakeContext:
+        return _FakeContext(self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self, serps: dict[str, str]) -> None:
+        self.serps = serps
+        self.browsers: list[_FakeBrowser] = []
+        self.pages: list[_FakePage] = []
+        self.chromium = self
+        self.stopped = False
+
+    async def start(self) -> "_FakePlaywright":
+        return self
+
+    async def launch(self, **options) -> _FakeBrowser:
+        browser = _FakeBrowser(self, options)
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+def _pool(serps: dict[str, str]):
+    fake = _FakePlaywright(serps)
+    patcher = patch("playwright.async_api.async_playwright", return_value=fake)
+    patcher.start()
+    return fake, patcher
+
+
+def test_pages_and_browsers_are_reused_across_urls():
+    fake, patcher = _pool({"https://e.com/a": INDEXED, "https://e.com/b": NOT_INDEXED})
+    try:
+        with PlaywrightPool(headless=True) as pool:
+            statuses = [pool.check(u) for u in ["https://e.com/a", "https://e.com/b", "https://e.com/a"]]
+    finally:
+        patcher.stop()
+
+    assert statuses == ["Indexed", "Not Indexed", "Indexed"]
+    assert len(fake.browsers) == 1
+    assert len(fake.pages) == 1
+    assert all("#search" in s for s in fake.pages[0].waited)
+    assert fake.browsers[0].closed and fake.stopped
+
+
+def test_one_browser_per_proxy():
+    fake, patcher = _pool({"https://e.com/a": INDEXED})
+    proxies = [{"http": "http://p1:1"}, {"http": "http://p2:1"}, {"http": "http://p1:1"}]
+    try:
+        with PlaywrightPool(headless=True) as pool:
+            for proxy in proxies:
+                assert pool.check("https://e.com/a", proxy) == "Indexed"
+    finally:
+        patcher.stop()
+
+    assert [b.options["proxy"]["server"] for b in fake.browsers] == ["http://p1:1", "http://p2:1"]
+
+
+def test_broken_page_is_replaced_and_proxy_error_reported():
+    fake, patcher = _pool({"https://e.com/a": INDEXED})
+    try:
+        with PlaywrightPool(headless=True) as pool:
+            assert pool.check("https://e.com/missing") == "Proxy Error"
+            assert pool.check("https://e.com/a") == "Indexed"
+    finally:
+        patcher.stop()
+
+    assert len(fake.pages) == 2
+    assert fake.pages[0].context.closed
+
+
+def test_captcha_page_reported_when_not_waiting_for_user():
+    fake, patcher = _pool({"https://e.com/a": '<form id="captcha-form">captcha</form>'})
+    try:
+        with PlaywrightPool(headless=True) as pool:
+            status = pool.check("https://e.com/a", captcha_handling=CaptchaHandling.BY_USER)
+    finally:
+        patcher.stop()
+    assert status == "Captcha Encountered"
+
+
+def test_released_proxy_browser_is_closed_and_relaunched_on_demand():
+    fake, patcher = _pool({"https://e.com/a": INDEXED})
+    p1, p2 = {"http": "http://p1:1"}, {"http": "http://p2:1"}
+    try:
+        with PlaywrightPool(headless=True) as pool:
+            assert pool.check("https://e.com/a", p1) == "Indexed"
+            assert pool.check("https://e.com/a", p2) == "Indexed"
+            pool.release(p1)
+            assert [b.closed for b in fake.browsers] == [True, False]
+            assert pool.check("https://e.com/a", p1) == "Indexed"
+    finally:
+        patcher.stop()
+
+    assert [b.options["proxy"]["server"] for b in fake.browsers] == ["http://p1:1", "http://p2:1", "http://p1:1"]
@@ -0,0 +1,143 @@
+"""Tests for proxy health scoring, rotation, cooldowns and parallel validation - no network."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+from seo_bhishma.core._http import parse_retry_after
+from seo_bhishma.core.index_spy import ProxyCooldowns, ProxyHealthBoard, ProxyRotator
+from seo_bhishma.models.index_spy import CheckMethod
+
+
+def test_scoreboard_tracks_rates_and_persists(tmp_path):
+    board = ProxyHealthBoard(tmp_path / "h.db")
+    board.record("p1:1", "ok", 0.5)
+    board.record("p1:1", "ok", 1.5)
+    board.record("p1:1", "captcha")
+    board.close()
+
+    health = ProxyHealthBoard(tmp_path / "h.db").health("p1:1")
+    assert (health.attempts, health.successes, health.captchas) == (3, 2, 1)
+    assert health.avg_latency == 1.0
+    assert health.last_failure is not None
+
+
+def test_score_orders_healthy_before_failing(tmp_path):
+    board = ProxyHealthBoard(tmp_path / "h.db")
+    for _ in range(5):
+        board.record("good:1", "ok", 0.2)
+        board.record("bad:1", "failure")
+    board.record("captcha:1", "ok", 0.2)
+    board.record("captcha:1", "captcha")
+
+    assert board.score("good:1") > board.score("new:1") > board.score("bad:1")
+    assert board.score("good:1") > board.score("captcha:1")
+    assert board.score("bad:1") > 0
+
+
+def test_weighted_rotation_prefers_healthy_proxies(tmp_path):
+    board = ProxyHealthBoard(tmp_path / "h.db")
+    for _ in range(20):
+        board.record("good:1", "ok", 0.1)
+        board.record("bad:1", "failure")
+    rotator = ProxyRotator(["good:1", "bad:1"], health=board)
+
+    picks = [rotator.next() for _ in range(200)]
+    assert picks.count("good:1") > 150
+    firsts = [rotator.ranked()[0] for _ in range(200)]
+    assert firsts.count("good:1") > 150
+    assert sorted(rotator.ranked()) == ["bad:1", "good:1"]
+
+
+def test_round_robin_without_board():
+    rotator = ProxyRotator(["a:1", "b:1", "c:1"])
+    assert [rotator.next() for _ in range(4)] == ["a:1", "b:1", "c:1", "a:1"]
+    assert rotator.ranked() == ["b:1", "c:1", "a:1"]
+
+
+def test_find_valid_validates_concurrently_and_records(tmp_path):
+    board = ProxyHealthBoard(tmp_path / "h.db")
+    proxies = [f"p{i}:1" for i in range(10)]
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def validate_http(self, proxy, url="https://www.google.com/"):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.05)
+        with lock:
+            in_flight["now"] -= 1
+        return {"http": f"http://{proxy}"} if proxy == "p7:1" else None
+
+    with patch.object(ProxyRotator, "validate_http", validate_http):
+        rotator = ProxyRotator(proxies, health=board)
+        assert rotator.find_valid(CheckMethod.HTTP, max_workers=10) == {"http": "http://p7:1"}
+        results = dict(rotator.validate_many(method=CheckMethod.HTTP, max_workers=10))
+
+    assert in_flight["max"] > 1
+    assert [p for p, r in results.items() if r] == ["p7:1"]
+    assert board.health("p7:1").successes == 2
+    assert board.health("p0:1").attempts >= 1
+
+
+def test_htmlsession_validation_workers_have_an_event_loop():
+    def validate_htmlsession(self, proxy, url="https://www.google.com/"):
+        if proxy == "boom:1":
+            raise RuntimeError("render crashed")
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))  # what requests_html's render does
+        return {"http": f"http://{proxy}"}
+
+    with patch.object(ProxyRotator, "validate_htmlsession", validate_htmlsession):
+        rotator = ProxyRotator(["boom:1", "ok:1"])
+        results = dict(rotator.validate_many(method=CheckMethod.HTML_SESSION))
+        found = rotator.find_valid(CheckMethod.HTML_SESSION)
+
+    assert results == {"boom:1": None, "ok:1": {"http": "http://ok:1"}}
+    assert found == {"http": "http://ok:1"}
+
+
+def test_cooldown_backs_off_exponentially_and_honours_retry_after():
+    cooldowns = ProxyCooldowns(base=10, maximum=25)
+    assert cooldowns.penalize("p:1") == 10
+    assert cooldowns.penalize("p:1") == 20
+    assert cooldowns.penalize("p:1") == 25
+    assert 24 < cooldowns.remaining("p:1") <= 25
+    cooldowns.clear("p:1")
+    assert cooldowns.penalize("p:1") == 10
+    assert cooldowns.penalize("q:1", retry_after=3) == 3
+    assert cooldowns.remaining("other:1") == 0
+
+
+def test_rotation_skips_cooling_proxies():
+    rotator = ProxyRotator(["a:1", "b:1"])
+    rotator.cooldowns.penalize("a:1")
+    assert {rotator.next() for _ in range(4)} == {"b:1"}
+    rotator.cooldowns.penalize("b:1")
+    assert rotator.next() in {"a:1", "b:1"}
+
+
+def test_validation_429_cools_down_instead_of_sleeping():
+    response = MagicMock(status_code=429, text="", headers={"Retry-After": "120"})
+    with (
+        patch("seo_bhishma.core.index_spy.requests.Session") as session_cls,
+        patch("seo_bhishma.core.index_spy.time.sleep") as sleep,
+    ):
+        session_cls.return_value.get.return_value = response
+        rotator = ProxyRotator(["p:1"], mode=["http"])
+        assert rotator.validate_http("p:1") is None
+
+    sleep.assert_not_called()
+    assert 119 < rotator.cooldowns.remaining("p:1") <= 120
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 01 Jan 2020 00:00:00 GMT") == 0
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=90), usegmt=True)
+    assert 85 < parse_retry_after(future) <= 90
@@ -0,0 +1,83 @@
+"""SERP classifier regression corpus and throughput benchmark.
+
+``serp_fixtures/`` holds synthetic results pages modelled on Google's
+markup (organic hits, basic-HTML ``/url?`` links, "no results", other
+results only, the CAPTCHA wall and an unrendered JS shell), with the
+expected status of each in ``expected.json``. Add a fixture whenever
+Google's markup changes. The throughput comparison is marked ``benchmark``
+and only runs with ``pytest -m benchmark``.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from seo_bhishma.core.index_spy import _classify_serp, _parse_indexing_html
+
+FIXTURES = Path(__file__).parent / "serp_fixtures"
+EXPECTED = json.loads((FIXTURES / "expected.json").read_text())
+ROUNDS = 20
+
+
+def _load(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def _bs4_baseline(html_content: str, url: str) -> str:
+    """The previous html.parser implementation of ``_parse_indexing_html``."""
+    lower = html_content.lower()
+    if "captcha" in lower or "unusual traffic" in lower or "/sorry/index" in lower:
+        return "Captcha Encountered"
+    soup = BeautifulSoup(html_content, "html.parser")
+    page_text = soup.get_text(" ", strip=True).lower()
+    if any(m in page_text for m in ("did not match any documents", "no information is available", "your search -")):
+        return "Not Indexed"
+    for selector in ["div.g", "div.tF2Cxc", "div[data-hveid]", "div.MjjYud"]:
+        for result in soup.select(selector):
+            link = result.find("a", href=True)
+            if link and url in link["href"]:
+                return "Indexed"
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        if url in href and href.startswith(("http://", "https://", "/url?")):
+            return "Indexed"
+    return "Not Indexed"
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_fixture_classification(name):
+    case = EXPECTED[name]
+    data = _load(name)
+    assert _classify_serp(data, case["url"]) == case["status"]
+    assert _classify_serp(data.decode(), case["url"]) == case["status"]
+    assert _parse_indexing_html(data, case["url"]) == (case["status"] or "Not Indexed")
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_matches_previous_parser(name):
+    case = EXPECTED[name]
+    text = _load(name).decode()
+    assert _parse_indexing_html(text, case["url"]) == _bs4_baseline(text, case["url"])
+
+
+@pytest.mark.benchmark
+def test_compiled_classifier_throughput():
+    corpus = [(_load(name), case["url"]) for name, case in EXPECTED.items()]
+    texts = [(data.decode(), url) for data, url in corpus]
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for data, url in corpus:
+            _classify_serp(data, url)
+    compiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for text, url in texts:
+            _bs4_baseline(text, url)
+    baseline = time.perf_counter() - start
+
+    assert compiled * 3 < baseline
@@ -9,6 +9,15 @@ class _FakeResponse:
     def __init__(self, status_code: int, text: str = "") -> None:
         self.status_code = status_code
         self.text = text
+        self.headers: dict[str, str] = {"Content-Type": "text/html; charset=utf-8"}
+
+    def iter_content(self, chunk_size: int):
+        body = self.text.encode()
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    def close(self) -> None:
+        pass
 
 
 def test_rel_attrs_string_form():
@@ -41,7 +50,7 @@ def test_check_backlink_nofollow_detection():
       <a href="https://target.com" rel="nofollow sponsored">click here</a>
     </body></html>
     """
-    with patch("seo_bhishma.core.link_sniper.requests_retry_session") as mock_sess:
+    with patch("seo_bhishma.core.link_sniper.get_session") as mock_sess:
         mock_sess.return_value.get.return_value = _FakeResponse(200, html)
         result = check_backlink("https://example.com", "https://target.com", "click here")
 
@@ -57,7 +66,7 @@ def test_check_backlink_nofollow_detection():
 
 def test_check_backlink_dofollow_default():
     html = '<html><body><a href="https://target.com">anchor</a></body></html>'
-    with patch("seo_bhishma.core.link_sniper.requests_retry_session") as mock_sess:
+    with patch("seo_bhishma.core.link_sniper.get_session") as mock_sess:
         mock_sess.return_value.get.return_value = _FakeResponse(200, html)
         result = check_backlink("https://example.com", "https://target.com")
 
@@ -66,7 +75,7 @@ def test_check_backlink_dofollow_default():
 
 
 def test_check_backlink_404():
-    with patch("seo_bhishma.core.link_sniper.requests_retry_session") as mock_sess:
+    with patch("seo_bhishma.core.link_sniper.get_session") as mock_sess:
         mock_sess.return_value.get.return_value = _FakeResponse(404, "Not Found")
         result = check_backlink("https://example.com/x", "https://target.com")
 
@@ -77,7 +86,7 @@ def test_check_backlink_404():
 
 def test_check_backlink_not_found():
     html = '<html><body><a href="https://other.com">other</a></body></html>'
-    with patch("seo_bhishma.core.link_sniper.requests_retry_session") as mock_sess:
+    with patch("seo_bhishma.core.link_sniper.get_session") as mock_sess:
         mock_sess.return_value.get.return_value = _FakeResponse(200, html)
         result = check_backlink("https://example.com", "https://target.com")
 
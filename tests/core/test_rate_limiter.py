@@ -0,0 +1,148 @@
+"""Tests for the per-host token-bucket / AIMD rate limiter in core._http."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from urllib3.util.retry import Retry
+
+from seo_bhishma.core import _http
+from seo_bhishma.core._http import AdaptiveRateLimiter, HostRateLimiter, close_sessions, get_rate_limiter
+from seo_bhishma.core.link_sniper import check_backlink
+
+A = "https://a.com/page"
+B = "https://b.com/page"
+
+
+def test_burst_then_steady_rate_per_host():
+    limiter = AdaptiveRateLimiter(rate=10, burst=5)
+    assert [limiter._reserve(A) for _ in range(5)] == [0.0] * 5
+    assert limiter._reserve(A) == pytest.approx(0.1, abs=0.01)
+    assert limiter._reserve(A) == pytest.approx(0.2, abs=0.01)
+    assert limiter._reserve(B) == 0.0  # other hosts have their own bucket
+
+
+def test_additive_increase_up_to_ceiling_and_multiplicative_decrease():
+    limiter = AdaptiveRateLimiter(rate=4, max_rate=6, increase=1, success_window=3)
+    for _ in range(3):
+        limiter.record(A, 200)
+    assert limiter.rate(A) == 5
+    for _ in range(30):
+        limiter.record(A, 200)
+    assert limiter.rate(A) == 6
+
+    limiter.record(A, 429)
+    assert limiter.rate(A) == 3
+    limiter.record(A, 503)
+    assert limiter.rate(A) == 1.5
+    limiter.record(A, 404)  # ordinary errors neither speed up nor slow down
+    assert limiter.rate(A) == 1.5
+    assert limiter.rate(B) == 4
+
+
+def test_retry_after_benches_the_host():
+    limiter = AdaptiveRateLimiter(rate=100, burst=10)
+    limiter._reserve(A)
+    limiter.record(A, 429, retry_after=2.0)
+    assert limiter._reserve(A) >= 1.9
+    assert limiter._reserve(B) == 0.0
+
+
+def test_record_response_reads_retry_after_header():
+    class _Response:
+        status_code = 200
+        headers = {"Retry-After": "3"}
+
+    limiter = AdaptiveRateLimiter(rate=8)
+    limiter.record_response(A, _Response())
+    assert limiter.rate(A) == 4
+    assert limiter._reserve(A) >= 2.9
+
+
+def test_non_adaptive_limiter_ignores_feedback():
+    limiter = HostRateLimiter(0.5)
+    limiter.record(A, 429, retry_after=60)
+    assert limiter._reserve(A) == 0.0
+    assert limiter._reserve(A) == pytest.approx(0.5, abs=0.01)
+
+
+def test_host_rate_limiter_waits_outside_the_lock(monkeypatch):
+    limiter = HostRateLimiter(0.3)
+    limiter.wait(A)
+    limiter.wait(B)
+
+    # Each waiter blocks in sleep until the other is asleep too; a sleep held
+    # under the limiter's lock would keep the second from ever getting there
+    both_asleep = threading.Barrier(2, timeout=5)
+    slept: dict[str, float] = {}
+    errors: list[Exception] = []
+
+    def _sleep(delay: float) -> None:
+        slept[threading.current_thread().name] = delay
+        both_asleep.wait()
+
+    def _wait(url: str) -> None:
+        try:
+            limiter.wait(url)
+        except threading.BrokenBarrierError as e:
+            errors.append(e)
+
+    monkeypatch.setattr(_http.time, "sleep", _sleep)
+    threads = [threading.Thread(target=_wait, args=(url,), name=url) for url in (A, B)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert slept == {A: pytest.approx(0.3, abs=0.05), B: pytest.approx(0.3, abs=0.05)}
+
+    slept.clear()
+    unlimited = HostRateLimiter(0)
+    for _ in range(100):
+        unlimited.wait(A)
+    assert slept == {}
+
+
+async def test_acquire_async_awaits_the_reserved_delay(monkeypatch):
+    slept: list[float] = []
+
+    async def _sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(_http.asyncio, "sleep", _sleep)
+    limiter = AdaptiveRateLimiter(rate=2, burst=1)
+    await limiter.acquire_async(A)
+    await limiter.acquire_async(A)
+    assert slept == [pytest.approx(0.5, abs=0.01)]
+
+
+class _AlwaysThrottled(BaseHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.hits += 1
+        self.send_response(429)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def test_throttles_retried_inside_the_shared_session_slow_the_host(monkeypatch):
+    monkeypatch.setattr(Retry, "sleep", lambda self, response=None: None)
+    close_sessions()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _AlwaysThrottled)
+    httpd.hits = 0
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/post"
+    try:
+        result = check_backlink(url, "https://target.com/")
+    finally:
+        close_sessions()
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert result.status == "Error"
+    assert httpd.hits == 4
+    # One multiplicative decrease per throttled response, from the default 10/s
+    assert get_rate_limiter().rate(url) == pytest.approx(10 * 0.5**4)
@@ -0,0 +1,83 @@
+"""Single-pass ``parse_sitemap`` on a full-size sitemap, and a benchmark against the old per-element thread pool.
+
+Builds a synthetic 50k-URL sitemap (the per-file spec maximum). The timing
+comparison is marked ``benchmark`` and only runs with ``pytest -m benchmark``.
+"""
+
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pytest
+
+from seo_bhishma.core.site_mapper import NAMESPACE, parse_sitemap
+
+N_URLS = 50_000
+
+
+def _synthetic_sitemap(n: int) -> bytes:
+    rows = "".join(
+        f"<url><loc>https://example.com/p/{i}</loc><lastmod>2025-01-01</lastmod>"
+        f"<changefreq>weekly</changefreq><priority>0.5</priority>"
+        f"<image:image><image:loc>https://example.com/i/{i}.jpg</image:loc></image:image></url>"
+        for i in range(n)
+    )
+    return (
+        '<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+        'xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">' + rows + "</urlset>"
+    ).encode()
+
+
+def _find_text(elem: ET.Element, tag: str) -> str:
+    found = elem.find(f"ns:{tag}", NAMESPACE)
+    if found is None:
+        found = elem.find(tag)
+    return found.text if found is not None and found.text else ""
+
+
+def _old_url_element(url_elem: ET.Element) -> dict | None:
+    """The pre-refactor extractor: two namespace-tolerant ``find`` calls per field."""
+    loc = _find_text(url_elem, "loc")
+    if not loc:
+        return None
+    return {tag: _find_text(url_elem, tag) for tag in ("lastmod", "changefreq", "priority")} | {"loc": loc}
+
+
+def _thread_pool_baseline(root: ET.Element, max_workers: int = 10) -> list:
+    """The pre-refactor strategy: one future per ``<url>`` element, each running the old extractor."""
+    urls = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_old_url_element, e) for e in root.findall("ns:url", NAMESPACE)]
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                urls.append(result)
+    return urls
+
+
+def _best_of(fn, repeats: int = 2) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_single_pass_parses_full_size_sitemap():
+    root = ET.fromstring(_synthetic_sitemap(N_URLS))
+
+    result = parse_sitemap(root, "bench.xml")
+    assert len(result.urls) == N_URLS
+    assert result.urls[0].loc == "https://example.com/p/0"
+    assert result.urls[-1].images == [{"loc": f"https://example.com/i/{N_URLS - 1}.jpg", "caption": ""}]
+
+
+@pytest.mark.benchmark
+def test_single_pass_beats_per_element_thread_pool():
+    root = ET.fromstring(_synthetic_sitemap(N_URLS))
+    assert len(_thread_pool_baseline(root)) == N_URLS
+
+    single_pass = _best_of(lambda: parse_sitemap(root, "bench.xml"))
+    thread_pool = _best_of(lambda: _thread_pool_baseline(root))
+    assert single_pass < thread_pool
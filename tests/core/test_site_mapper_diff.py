@@ -0,0 +1,152 @@
+"""Tests for incremental sitemap diffing - no network."""
+
+import io
+from unittest.mock import patch
+
+from seo_bhishma.core.site_mapper import diff_sitemap
+
+NS_DECL = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200) -> None:
+        self.raw = io.BytesIO(body)
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def close(self) -> None:
+        pass
+
+
+def _urlset(*rows: tuple[str, str]) -> bytes:
+    body = "".join(f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>" for loc, lastmod in rows)
+    return f'<?xml version="1.0"?><urlset {NS_DECL}>{body}</urlset>'.encode()
+
+
+def _index(*locs: str) -> bytes:
+    body = "".join(f"<sitemap><loc>{loc}</loc></sitemap>" for loc in locs)
+    return f'<?xml version="1.0"?><sitemapindex {NS_DECL}>{body}</sitemapindex>'.encode()
+
+
+def _diff(pages: dict[str, bytes], store, url: str = "https://e.com/index.xml"):
+    fetched: list[str] = []
+
+    def _get(u, **_kwargs):
+        fetched.append(u)
+        return _FakeResponse(pages[u]) if u in pages else _FakeResponse(b"", status_code=404)
+
+    with patch("seo_bhishma.core.site_mapper.get_session") as mock_sess:
+        mock_sess.return_value.get.side_effect = _get
+        return diff_sitemap(url, str(store)), fetched
+
+
+def _by_kind(result) -> dict[str, list[str]]:
+    out: dict[str, list[str]] = {"added": [], "removed": [], "modified": []}
+    for c in result.changes:
+        out[c.change].append(c.loc)
+    return out
+
+
+def test_first_run_reports_everything_added(tmp_path):
+    pages = {
+        "https://e.com/index.xml": _index("https://e.com/1.xml", "https://e.com/2.xml"),
+        "https://e.com/1.xml": _urlset(("https://e.com/a", "2025-01-01")),
+        "https://e.com/2.xml": _urlset(("https://e.com/b", "2025-01-01")),
+    }
+    result, _ = _diff(pages, tmp_path / "fp.db")
+    assert result.added == 2
+    assert _by_kind(result)["added"] == ["https://e.com/a", "https://e.com/b"]
+    assert result.sitemaps_parsed == 3
+
+
+def test_unchanged_children_skipped_and_changes_reported(tmp_path):
+    store = tmp_path / "fp.db"
+    pages = {
+        "https://e.com/index.xml": _index("https://e.com/1.xml", "https://e.com/2.xml"),
+        "https://e.com/1.xml": _urlset(("https://e.com/a", "2025-01-01")),
+        "https://e.com/2.xml": _urlset(("https://e.com/b", "2025-01-01"), ("https://e.com/c", "2025-01-01")),
+    }
+    _diff(pages, store)
+
+    pages["https://e.com/2.xml"] = _urlset(("https://e.com/b", "2025-02-01"), ("https://e.com/d", "2025-02-01"))
+    result, _ = _diff(pages, store)
+
+    assert result.sitemaps_skipped == 1
+    assert result.sitemaps_parsed == 2
+    assert _by_kind(result) == {
+        "added": ["https://e.com/d"],
+        "removed": ["https://e.com/c"],
+        "modified": ["https://e.com/b"],
+    }
+    modified = next(c for c in result.changes if c.change == "modified")
+    assert (modified.previous_lastmod, modified.lastmod) == ("2025-01-01", "2025-02-01")
+
+    # A third identical run reports nothing, and "a" survived being skipped twice
+    result, _ = _diff(pages, store)
+    assert result.changes == []
+    assert result.sitemaps_skipped == 2
+
+
+def test_dropped_child_sitemap_reports_its_urls_removed(tmp_path):
+    store = tmp_path / "fp.db"
+    pages = {
+        "https://e.com/index.xml": _index("https://e.com/1.xml", "https://e.com/2.xml"),
+        "https://e.com/1.xml": _urlset(("https://e.com/a", "")),
+        "https://e.com/2.xml": _urlset(("https://e.com/b", "")),
+    }
+    _diff(pages, store)
+    pages["https://e.com/index.xml"] = _index("https://e.com/1.xml")
+    result, fetched = _diff(pages, store)
+    assert _by_kind(result)["removed"] == ["https://e.com/b"]
+    assert "https://e.com/2.xml" not in fetched
+
+
+def test_failed_child_keeps_previous_urls(tmp_path):
+    store = tmp_path / "fp.db"
+    pages = {
+        "https://e.com/index.xml": _index("https://e.com/1.xml"),
+        "https://e.com/1.xml": _urlset(("https://e.com/a", "")),
+    }
+    _diff(pages, store)
+    del pages["https://e.com/1.xml"]
+    result, _ = _diff(pages, store)
+    assert result.changes == []
+
+
+def test_failed_nested_index_keeps_its_whole_subtree(tmp_path):
+    store = tmp_path / "fp.db"
+    pages = {
+        "https://e.com/index.xml": _index("https://e.com/blog.xml", "https://e.com/1.xml"),
+        "https://e.com/blog.xml": _index("https://e.com/blog-1.xml", "https://e.com/blog-2.xml"),
+        "https://e.com/blog-1.xml": _urlset(("https://e.com/blog/a", "")),
+        "https://e.com/blog-2.xml": _urlset(("https://e.com/blog/b", "")),
+        "https://e.com/1.xml": _urlset(("https://e.com/c", "")),
+    }
+    _diff(pages, store)
+
+    failing = {k: v for k, v in pages.items() if k != "https://e.com/blog.xml"}
+    failing["https://e.com/1.xml"] = _urlset(("https://e.com/d", ""))
+    result, fetched = _diff(failing, store)
+    assert _by_kind(result) == {"added": ["https://e.com/d"], "removed": ["https://e.com/c"], "modified": []}
+    assert "https://e.com/blog-1.xml" not in fetched
+
+    # Once the index is back, nothing under it is reported as newly added
+    pages["https://e.com/1.xml"] = failing["https://e.com/1.xml"]
+    result, _ = _diff(pages, store)
+    assert result.changes == []
+
+
+def test_root_failure_returns_none_and_leaves_store_untouched(tmp_path):
+    store = tmp_path / "fp.db"
+    pages = {"https://e.com/s.xml": _urlset(("https://e.com/a", ""))}
+    _diff(pages, store, url="https://e.com/s.xml")
+
+    result, _ = _diff({}, store, url="https://e.com/s.xml")
+    assert result is None
+
+    result, _ = _diff(pages, store, url="https://e.com/s.xml")
+    assert result.changes == []
@@ -0,0 +1,226 @@
+"""Tests for the streaming (iterparse) sitemap parser - no network."""
+
+import gzip
+import io
+import threading
+import time
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
+from seo_bhishma.core.site_mapper import download_and_parse_sitemap, iter_sitemap_urls, parse_sitemap
+from seo_bhishma.models.site_mapper import SitemapCrawlStats
+
+NS_DECL = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+IMAGE_NS_DECL = 'xmlns:image="http://www.google.com/schemas/sitemap-image/1.1"'
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200) -> None:
+        self.raw = io.BytesIO(body)
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self.closed = False
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _serve(pages: dict[str, bytes]):
+    """Patch the HTTP session so ``get(url)`` returns the body mapped to ``url``."""
+    patcher = patch("seo_bhishma.core.site_mapper.get_session")
+    mock_sess = patcher.start()
+
+    def _get(url, **_kwargs):
+        if url not in pages:
+            return _FakeResponse(b"", status_code=404)
+        return _FakeResponse(pages[url])
+
+    mock_sess.return_value.get.side_effect = _get
+    return patcher
+
+
+def _urlset(*locs: str) -> bytes:
+    body = "".join(f"<url><loc>{loc}</loc></url>" for loc in locs)
+    return f'<?xml version="1.0"?><urlset {NS_DECL}>{body}</urlset>'.encode()
+
+
+def _index(*locs: str) -> bytes:
+    body = "".join(f"<sitemap><loc>{loc}</loc></sitemap>" for loc in locs)
+    return f'<?xml version="1.0"?><sitemapindex {NS_DECL}>{body}</sitemapindex>'.encode()
+
+
+def test_iter_sitemap_urls_plain_document_order():
+    patcher = _serve({"https://e.com/s.xml": _urlset("https://e.com/a", "https://e.com/b", "https://e.com/c")})
+    try:
+        locs = [u.loc for u in iter_sitemap_urls("https://e.com/s.xml")]
+    finally:
+        patcher.stop()
+    assert locs == ["https://e.com/a", "https://e.com/b", "https://e.com/c"]
+
+
+def test_iter_sitemap_urls_gzip_sniffed_without_gz_suffix():
+    patcher = _serve({"https://e.com/s": gzip.compress(_urlset("https://e.com/a"))})
+    try:
+        rows = list(iter_sitemap_urls("https://e.com/s"))
+    finally:
+        patcher.stop()
+    assert [u.loc for u in rows] == ["https://e.com/a"]
+    assert rows[0].sitemap_name == "https://e.com/s"
+
+
+def test_iter_sitemap_urls_follows_index_and_counts():
+    patcher = _serve({
+        "https://e.com/index.xml": _index("https://e.com/1.xml.gz", "https://e.com/missing.xml", "https://e.com/2.xml"),
+        "https://e.com/1.xml.gz": gzip.compress(_urlset("https://e.com/a", "https://e.com/b")),
+        "https://e.com/2.xml": _urlset("https://e.com/c"),
+    })
+    stats = SitemapCrawlStats()
+    progress: list[tuple[int, int]] = []
+    try:
+        rows = list(
+            iter_sitemap_urls(
+                "https://e.com/index.xml",
+                stats=stats,
+                on_progress=lambda done, total, message="": progress.append((done, total)),
+            )
+        )
+    finally:
+        patcher.stop()
+
+    assert [u.loc for u in rows] == ["https://e.com/a", "https://e.com/b", "https://e.com/c"]
+    assert rows[0].sitemap_name == "https://e.com/1.xml.gz"
+    assert stats.sitemaps_parsed == 3
+    assert stats.urls_found == 3
+    assert stats.failed_sitemaps == ["https://e.com/missing.xml"]
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_parse_sitemap_reports_progress_in_one_unit_per_root():
+    patcher = _serve({
+        "https://e.com/1.xml": _urlset("https://e.com/a", "https://e.com/b"),
+        "https://e.com/2.xml": _urlset("https://e.com/c"),
+    })
+    index_progress: list[tuple[int, int]] = []
+    urlset_progress: list[tuple[int, int]] = []
+    try:
+        result = parse_sitemap(
+            ET.fromstring(_index("https://e.com/1.xml", "https://e.com/2.xml")),
+            "https://e.com/index.xml",
+            on_progress=lambda done, total, message="": index_progress.append((done, total)),
+        )
+        parse_sitemap(
+            ET.fromstring(_urlset("https://e.com/a", "https://e.com/b")),
+            "https://e.com/1.xml",
+            on_progress=lambda done, total, message="": urlset_progress.append((done, total)),
+        )
+    finally:
+        patcher.stop()
+
+    assert [u.loc for u in result.urls] == ["https://e.com/a", "https://e.com/b", "https://e.com/c"]
+    # Sitemap files for an index, with no element counts mixed in; elements for a urlset
+    assert index_progress == [(1, 3), (2, 3), (3, 3)]
+    assert urlset_progress == [(2, 2)]
+
+
+def test_iter_sitemap_urls_extracts_namespaced_extensions():
+    xml = f"""<?xml version="1.0"?>
+<urlset {NS_DECL} {IMAGE_NS_DECL}>
+  <url>
+    <loc>
+      https://e.com/page
+    </loc>
+    <lastmod>2025-01-01</lastmod>
+    <priority>0.8</priority>
+    <image:image><image:loc>https://e.com/img.jpg</image:loc><image:caption>Alt</image:caption></image:image>
+  </url>
+</urlset>""".encode()
+    patcher = _serve({"https://e.com/s.xml": xml})
+    try:
+        (row,) = list(iter_sitemap_urls("https://e.com/s.xml"))
+    finally:
+        patcher.stop()
+    assert row.loc == "https://e.com/page"
+    assert row.lastmod == "2025-01-01"
+    assert row.priority == "0.8"
+    assert row.images == [{"loc": "https://e.com/img.jpg", "caption": "Alt"}]
+
+
+def test_download_and_parse_sitemap_returns_none_on_failure():
+    patcher = _serve({})
+    try:
+        assert download_and_parse_sitemap("https://e.com/nope.xml") is None
+    finally:
+        patcher.stop()
+
+
+def test_download_and_parse_sitemap_built_on_stream():
+    patcher = _serve({"https://e.com/s.xml": _urlset("https://e.com/a", "https://e.com/b")})
+    try:
+        result = download_and_parse_sitemap("https://e.com/s.xml")
+    finally:
+        patcher.stop()
+    assert result is not None
+    assert result.total_sitemaps_parsed == 1
+    assert [u.loc for u in result.urls] == ["https://e.com/a", "https://e.com/b"]
+
+
+def test_nested_children_fetched_concurrently_in_order_with_host_cap():
+    children = [f"https://e.com/{i}.xml" for i in range(8)]
+    pages = {"https://e.com/index.xml": _index(*children)}
+    for i, loc in enumerate(children):
+        pages[loc] = _urlset(f"https://e.com/p{i}")
+
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def _get(url, **_kwargs):
+        if url != "https://e.com/index.xml":
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            # Earlier children answer slowest, so completion order is reversed
+            time.sleep(0.02 * (8 - children.index(url)))
+            with lock:
+                in_flight["now"] -= 1
+        return _FakeResponse(pages[url])
+
+    with patch("seo_bhishma.core.site_mapper.get_session") as mock_sess:
+        mock_sess.return_value.get.side_effect = _get
+        locs = [u.loc for u in iter_sitemap_urls("https://e.com/index.xml", max_workers=8, max_per_host=3)]
+
+    assert locs == [f"https://e.com/p{i}" for i in range(8)]
+    assert 1 < in_flight["max"] <= 3
+
+
+def test_nested_cycles_and_duplicates_are_skipped():
+    patcher = _serve({
+        "https://e.com/a.xml": _index("https://e.com/b.xml", "https://e.com/leaf.xml", "https://e.com/leaf.xml"),
+        "https://e.com/b.xml": _index("https://e.com/a.xml", "https://e.com/leaf.xml"),
+        "https://e.com/leaf.xml": _urlset("https://e.com/p"),
+    })
+    stats = SitemapCrawlStats()
+    try:
+        locs = [u.loc for u in iter_sitemap_urls("https://e.com/a.xml", stats=stats)]
+    finally:
+        patcher.stop()
+    assert locs == ["https://e.com/p"]
+    assert stats.sitemaps_parsed == 3
+
+
+def test_nested_depth_limit():
+    patcher = _serve({
+        "https://e.com/0.xml": _index("https://e.com/1.xml"),
+        "https://e.com/1.xml": _index("https://e.com/2.xml"),
+        "https://e.com/2.xml": _urlset("https://e.com/deep"),
+    })
+    try:
+        shallow = list(iter_sitemap_urls("https://e.com/0.xml", max_depth=1))
+        deep = list(iter_sitemap_urls("https://e.com/0.xml", max_depth=2))
+    finally:
+        patcher.stop()
+    assert shallow == []
+    assert [u.loc for u in deep] == ["https://e.com/deep"]
@@ -1,11 +1,16 @@
+import gzip
 import tempfile
 from pathlib import Path
 
+from lxml import etree
+
 from seo_bhishma.core.sitemap_generator import (
+    MANIFEST_FILENAME,
     generate_nested_sitemaps,
     generate_sitemap,
     generate_sitemap_index,
 )
+from seo_bhishma.models.sitemap_generator import SitemapImage, SitemapManifest, UrlEntry
 
 
 def test_generate_sitemap_basic():
@@ -45,3 +50,35 @@ def test_generate_nested_sitemaps():
         assert Path(index_path).exists()
         for f in files:
             assert Path(f).exists()
+
+
+def test_nested_sitemaps_parallel_matches_serial_and_is_deterministic():
+    urls = [f"https://example.com/page{i}?a=1&b=2" for i in range(25)]
+    with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as parallel_dir:
+        serial, _ = generate_nested_sitemaps(urls, serial_dir, url_limit=10, compressed=True, max_workers=1)
+        parallel, _ = generate_nested_sitemaps(urls, parallel_dir, url_limit=10, compressed=True, max_workers=2)
+        assert [Path(f).name for f in parallel] == ["sitemap_0.xml.gz", "sitemap_1.xml.gz", "sitemap_2.xml.gz"]
+        for a, b in zip(serial, parallel, strict=True):
+            assert Path(a).read_bytes() == Path(b).read_bytes()
+
+        root = etree.fromstring(gzip.decompress(Path(parallel[2]).read_bytes()))
+        locs = [e.text for e in root.iter("{http://www.sitemaps.org/schemas/sitemap/0.9}loc")]
+        assert locs == urls[20:]
+        assert not list(Path(parallel_dir).glob("*.tmp"))
+
+
+def test_nested_sitemaps_roll_over_on_byte_limit_and_write_manifest():
+    images = [SitemapImage(loc=f"https://example.com/img/{j}.jpg") for j in range(20)]
+    entries = [UrlEntry(loc=f"https://example.com/p{i}", images=images) for i in range(10)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        files, _ = generate_nested_sitemaps(entries, tmpdir, url_limit=6, max_bytes=4096, compressed=True)
+        manifest = SitemapManifest.model_validate_json((Path(tmpdir) / MANIFEST_FILENAME).read_text())
+
+        assert len(files) > 2  # the URL limit alone would give two files
+        assert [s.file for s in manifest.shards] == [Path(f).name for f in files]
+        assert sum(s.urls for s in manifest.shards) == 10
+        for shard, f in zip(manifest.shards, files, strict=True):
+            raw = gzip.decompress(Path(f).read_bytes())
+            assert shard.raw_bytes == len(raw) <= 4096
+            assert shard.gzip_bytes == Path(f).stat().st_size
+            assert len(etree.fromstring(raw)) - 1 == shard.urls  # minus the leading comment
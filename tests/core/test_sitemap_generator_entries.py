@@ -1,6 +1,8 @@
 """Tests for per-URL UrlEntry support in sitemap generation."""
 
-from seo_bhishma.core.sitemap_generator import generate_sitemap
+import pytest
+
+from seo_bhishma.core.sitemap_generator import generate_nested_sitemaps, generate_sitemap
 from seo_bhishma.models.sitemap_generator import SitemapImage, UrlEntry
 
 
@@ -49,3 +51,33 @@ def test_generate_sitemap_with_stylesheet():
     ).decode()
     assert 'xml-stylesheet' in xml
     assert "sitemap.xsl" in xml
+
+
+def test_generate_sitemap_accepts_dicts_from_a_generator():
+    rows = ({"loc": f"https://example.com/{i}", "priority": "0.3"} for i in range(2))
+    xml = generate_sitemap(rows).decode()
+    assert "https://example.com/1" in xml
+    assert xml.count("<priority>0.3</priority>") == 2
+
+
+def test_generate_sitemap_rejects_unknown_entry_types():
+    with pytest.raises(TypeError):
+        generate_sitemap([42])
+
+
+def test_nested_sitemaps_consume_generator_lazily(tmp_path):
+    consumed = []
+
+    def rows():
+        for i in range(7):
+            consumed.append(i)
+            yield f"https://example.com/{i}"
+
+    pulled_at_progress = []
+    files, _ = generate_nested_sitemaps(
+        rows(), str(tmp_path), url_limit=3, max_workers=1,
+        on_progress=lambda done, total: pulled_at_progress.append(len(consumed)),
+    )
+    assert len(files) == 3
+    # The source is pulled one shard at a time, not drained up front
+    assert pulled_at_progress == [3, 6, 7]
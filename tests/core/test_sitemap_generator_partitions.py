@@ -0,0 +1,74 @@
+"""Tests for index lastmods and hash-partitioned nested sitemaps."""
+
+from lxml import etree
+
+from seo_bhishma.core.sitemap_generator import generate_nested_sitemaps, load_manifest, update_nested_sitemaps
+from seo_bhishma.models.sitemap_generator import UrlEntry
+
+NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+def _index_lastmods(index_path) -> dict[str, str]:
+    root = etree.parse(index_path).getroot()
+    return {s.findtext(f"{NS}loc").rsplit("/", 1)[-1]: s.findtext(f"{NS}lastmod") for s in root.iter(f"{NS}sitemap")}
+
+
+def test_index_lastmod_is_newest_entry_lastmod(tmp_path):
+    entries = [
+        UrlEntry(loc="https://example.com/a", lastmod="2025-03-01"),
+        UrlEntry(loc="https://example.com/b", lastmod="2025-03-02T09:00:00+02:00"),
+        UrlEntry(loc="https://example.com/c", lastmod="2025-03-01T23:00:00Z"),
+        "https://example.com/d",
+    ]
+    _, index_path = generate_nested_sitemaps(entries, str(tmp_path), url_limit=3, max_workers=1, lastmod="2024-12-31")
+    assert _index_lastmods(index_path) == {
+        "sitemap_0.xml": "2025-03-02T09:00:00+02:00",
+        "sitemap_1.xml": "2024-12-31",
+    }
+
+
+def test_hash_partitions_are_stable_across_runs_and_input_order(tmp_path):
+    urls = [f"https://example.com/{i}" for i in range(40)]
+    first_dir, second_dir = tmp_path / "first", tmp_path / "second"
+    generate_nested_sitemaps(urls, str(first_dir), max_workers=1, hash_partitions=4, lastmod="2025-01-01")
+    generate_nested_sitemaps(reversed(urls), str(second_dir), max_workers=2, hash_partitions=4, lastmod="2025-01-01")
+
+    def _by_file(d):
+        shards = load_manifest(str(d)).shards
+        return {s.file: {loc.text for loc in etree.parse(str(d / s.file)).iter(f"{NS}loc")} for s in shards}
+
+    first, second = _by_file(first_dir), _by_file(second_dir)
+    assert first == second
+    assert set(first) <= {f"sitemap_{b}.xml" for b in range(4)}
+    assert set().union(*first.values()) == set(urls)
+
+
+def test_hash_rebuild_keeps_unchanged_shards_and_their_lastmod(tmp_path):
+    urls = [f"https://example.com/{i}" for i in range(40)]
+    generate_nested_sitemaps(urls, str(tmp_path), max_workers=1, hash_partitions=4)
+    before = {s.file: s for s in load_manifest(str(tmp_path)).shards}
+
+    changed_url = "https://example.com/changed"
+    _, index_path = generate_nested_sitemaps(urls + [changed_url], str(tmp_path), max_workers=1, hash_partitions=4)
+    after = {s.file: s for s in load_manifest(str(tmp_path)).shards}
+
+    touched = [f for f in after if after[f].sha256 != before[f].sha256]
+    assert len(touched) == 1
+    for f in after:
+        if f not in touched:
+            assert after[f].lastmod == before[f].lastmod
+    assert _index_lastmods(index_path)[touched[0]] == after[touched[0]].lastmod
+
+
+def test_hash_update_appends_to_the_urls_partition(tmp_path):
+    urls = [f"https://example.com/{i}" for i in range(20)]
+    generate_nested_sitemaps(urls, str(tmp_path), max_workers=1, hash_partitions=3)
+    reference = tmp_path / "reference"
+    generate_nested_sitemaps(urls + ["https://example.com/new"], str(reference), max_workers=1, hash_partitions=3)
+
+    changed, _ = update_nested_sitemaps(str(tmp_path), added=["https://example.com/new"])
+
+    assert len(changed) == 1
+    name = changed[0].rsplit("/", 1)[-1]
+    assert (tmp_path / name).read_bytes().count(b"<url>") == (reference / name).read_bytes().count(b"<url>")
+    assert b"https://example.com/new<" in (tmp_path / name).read_bytes()
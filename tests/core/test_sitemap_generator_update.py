@@ -0,0 +1,101 @@
+"""Tests for incremental nested sitemap updates."""
+
+import gzip
+
+import pytest
+from lxml import etree
+
+from seo_bhishma.core.sitemap_generator import generate_nested_sitemaps, load_manifest, update_nested_sitemaps
+from seo_bhishma.models.sitemap_generator import SitemapImage, UrlEntry
+
+NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+def _locs(path) -> list[str]:
+    return [e.text for e in etree.parse(str(path)).getroot().iter(f"{NS}loc")]
+
+
+def _build(tmp_path, n: int = 9, **kwargs):
+    urls = [f"https://example.com/{i}" for i in range(n)]
+    generate_nested_sitemaps(urls, str(tmp_path), url_limit=3, max_workers=1, lastmod="2025-01-01", **kwargs)
+    return {s.file: (tmp_path / s.file).read_bytes() for s in load_manifest(str(tmp_path)).shards}
+
+
+def test_update_rewrites_only_touched_shards(tmp_path):
+    before = _build(tmp_path)
+    old_stats = {s.file: s for s in load_manifest(str(tmp_path)).shards}
+
+    changed, index_path = update_nested_sitemaps(
+        str(tmp_path),
+        removed=["https://example.com/1"],
+        modified=[UrlEntry(loc="https://example.com/7", lastmod="2025-06-01")],
+    )
+
+    assert sorted(changed) == [str(tmp_path / "sitemap_0.xml"), str(tmp_path / "sitemap_2.xml")]
+    assert (tmp_path / "sitemap_1.xml").read_bytes() == before["sitemap_1.xml"]
+    assert _locs(tmp_path / "sitemap_0.xml") == ["https://example.com/0", "https://example.com/2"]
+    assert "<lastmod>2025-06-01</lastmod>" in (tmp_path / "sitemap_2.xml").read_text()
+
+    manifest = load_manifest(str(tmp_path))
+    new_stats = {s.file: s for s in manifest.shards}
+    assert new_stats["sitemap_1.xml"] == old_stats["sitemap_1.xml"]
+    assert new_stats["sitemap_0.xml"].urls == 2
+    assert new_stats["sitemap_0.xml"].sha256 != old_stats["sitemap_0.xml"].sha256
+    index = etree.parse(index_path).getroot()
+    assert len(index.findall(f"{NS}sitemap/{NS}lastmod")) == 3
+
+
+def test_update_appends_and_spills_into_new_shards(tmp_path):
+    _build(tmp_path, n=8)
+    added = [f"https://example.com/new{i}" for i in range(3)]
+
+    changed, _ = update_nested_sitemaps(str(tmp_path), added=added)
+
+    files = [s.file for s in load_manifest(str(tmp_path)).shards]
+    assert files == ["sitemap_0.xml", "sitemap_1.xml", "sitemap_2.xml", "sitemap_3.xml"]
+    assert _locs(tmp_path / "sitemap_2.xml") == ["https://example.com/6", "https://example.com/7", added[0]]
+    assert _locs(tmp_path / "sitemap_3.xml") == added[1:]
+    assert len(changed) == 2
+    # New entries pick up the build's defaults
+    assert (tmp_path / "sitemap_3.xml").read_text().count("<lastmod>2025-01-01</lastmod>") == 2
+
+    # Spilled URLs are tracked, so they can be removed again
+    update_nested_sitemaps(str(tmp_path), removed=added[1:])
+    assert [s.file for s in load_manifest(str(tmp_path)).shards][-1] == "sitemap_2.xml"
+    assert not (tmp_path / "sitemap_3.xml").exists()
+
+
+def test_update_places_a_repeated_new_url_once_with_its_last_entry(tmp_path):
+    _build(tmp_path, n=7)
+    new = "https://example.com/new"
+
+    update_nested_sitemaps(
+        str(tmp_path),
+        added=[new, UrlEntry(loc=new, lastmod="2025-07-01")],
+        modified=[UrlEntry(loc=new, lastmod="2025-06-01")],
+    )
+
+    assert _locs(tmp_path / "sitemap_2.xml") == ["https://example.com/6", new]
+    assert "<lastmod>2025-07-01</lastmod>" in (tmp_path / "sitemap_2.xml").read_text()
+    assert load_manifest(str(tmp_path)).shards[-1].urls == 2
+
+
+def test_update_with_identical_content_keeps_file_untouched(tmp_path):
+    before = _build(tmp_path, compressed=True)
+    changed, _ = update_nested_sitemaps(str(tmp_path), modified=["https://example.com/4"])
+    assert changed == []
+    assert (tmp_path / "sitemap_1.xml.gz").read_bytes() == before["sitemap_1.xml.gz"]
+
+
+def test_update_round_trips_extension_entries(tmp_path):
+    entry = UrlEntry(loc="https://example.com/0", images=[SitemapImage(loc="https://example.com/a.jpg", caption="A")])
+    generate_nested_sitemaps([entry, "https://example.com/1"], str(tmp_path), max_workers=1, compressed=True)
+    update_nested_sitemaps(str(tmp_path), removed=["https://example.com/1"])
+    xml = gzip.decompress((tmp_path / "sitemap_0.xml.gz").read_bytes()).decode()
+    assert "<image:image><image:loc>https://example.com/a.jpg</image:loc><image:caption>A</image:caption>" in xml
+    assert "https://example.com/1<" not in xml
+
+
+def test_update_requires_previous_build(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        update_nested_sitemaps(str(tmp_path), added=["https://example.com/"])